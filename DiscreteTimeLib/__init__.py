@@ -1,2 +1,6 @@
 from .signals import DiscreteTimeSignal  # pragma: no cover
 from .systems import DiscreteTimeSystem  # pragma: no cover
+from .streaming import StreamingFilter  # pragma: no cover
+from .multirate import StreamingResampler  # pragma: no cover
+from .multichannel import MultichannelDiscreteTimeSignal  # pragma: no cover
+from .sparse import SparseDiscreteTimeSignal  # pragma: no cover
@@ -0,0 +1,336 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+# default number of responses held by cache
+DEFAULT_MAX_ENTRIES = 1024
+# default memory held by cached responses, in bytes
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+class ResponseCache:
+    '''
+    Thread-safe least-recently-used cache of responses computed from system
+    coefficients, for e.g. frequency responses computed by
+    :meth:`~DiscreteTimeLib.systems.DiscreteTimeSystem.freqz`.
+
+    Responses are keyed by a content hash of the system coefficients and by
+    the parameters of the computation, so that equal systems share entries,
+    and changing the coefficients of a system never returns stale responses.
+    The least recently used responses are evicted once the cache holds more
+    than ``max_entries`` responses or ``max_bytes`` bytes.
+
+    Caching is opt-in, since hashing inputs and copying responses only pays
+    off when responses are computed repeatedly. No cache is active by
+    default, and a cache is activated with :func:`use_response_cache` or
+    :func:`set_response_cache`.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of cached responses.
+
+    max_bytes : int, optional
+        Maximum memory of cached responses, in bytes. Responses larger than
+        this are not cached.
+
+    Examples
+    --------
+    >>> H = DiscreteTimeSystem((1,), (1, -0.5))
+    >>> with use_response_cache(ResponseCache()) as cache:
+    ...     freq, w = H.freqz((-np.pi, np.pi), num=100)
+    ...     freq, w = H.freqz((-np.pi, np.pi), num=100)
+    >>> cache.stats()['hits']
+    1
+    '''
+
+    def __init__(
+        self,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        max_bytes=DEFAULT_MAX_BYTES,
+    ):
+        '''
+        Initializer for response cache object.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of cached responses.
+
+        max_bytes : int, optional
+            Maximum memory of cached responses, in bytes.
+        '''
+
+        # raise error if limits are negative
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError('max_entries and max_bytes must be non-negative')
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # responses keyed by (system key, parameters), oldest first
+        self._entries = OrderedDict()
+        self._n_bytes = 0
+        self.reset_stats()
+
+    def __len__(self):
+        '''
+        Get number of cached responses.
+
+        Returns
+        -------
+        int
+            Number of cached responses.
+        '''
+
+        return len(self._entries)
+
+    def reset_stats(self):
+        '''
+        Reset hit, miss and eviction counts.
+        '''
+
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self):
+        '''
+        Fetch cache statistics.
+
+        Returns
+        -------
+        dict
+            Statistics, holding ``'hits'``, ``'misses'``, ``'evictions'``,
+            ``'entries'``, ``'bytes'``, ``'max_entries'`` and
+            ``'max_bytes'``.
+        '''
+
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'entries': len(self._entries),
+                'bytes': self._n_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+    def get(self, system, params, compute):
+        '''
+        Fetch cached response, computing and caching it if it is not cached.
+
+        Parameters
+        ----------
+        system : DiscreteTimeSystem
+            System the response is computed from.
+
+        params : tuple
+            Hashable parameters of the computation.
+
+        compute : callable
+            Function with no arguments that computes the response array.
+
+        Returns
+        -------
+        numpy.ndarray
+            Copy of response, so that callers may modify it.
+        '''
+
+        key = (system_key(system), params)
+
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+
+                return value.copy()
+
+            self._misses += 1
+
+        # compute outside of lock, so that other threads are not blocked
+        value = np.asarray(compute())
+        self._insert(key, value.copy())
+
+        return value
+
+    def _insert(self, key, value):
+        '''
+        Insert response, evicting least recently used responses beyond the
+        cache limits.
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key.
+
+        value : numpy.ndarray
+            Response.
+        '''
+
+        if value.nbytes > self.max_bytes or self.max_entries == 0:
+            return
+
+        with self._lock:
+            # another thread may have inserted the same response
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._n_bytes -= previous.nbytes
+
+            self._entries[key] = value
+            self._n_bytes += value.nbytes
+
+            # evict least recently used responses beyond limits
+            n_entries = len(self._entries)
+            max_entries, max_bytes = self.max_entries, self.max_bytes
+            while n_entries > max_entries or self._n_bytes > max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._n_bytes -= evicted.nbytes
+                self._evictions += 1
+                n_entries -= 1
+
+    def invalidate(self, system=None):
+        '''
+        Remove cached responses.
+
+        Parameters
+        ----------
+        system : DiscreteTimeSystem, optional
+            System whose responses, for its current coefficients, are
+            removed. Defaults to removing all responses.
+        '''
+
+        with self._lock:
+            if system is None:
+                self._entries.clear()
+                self._n_bytes = 0
+
+                return
+
+            key = system_key(system)
+            for entry_key in [k for k in self._entries if k[0] == key]:
+                self._n_bytes -= self._entries.pop(entry_key).nbytes
+
+
+def system_key(system):
+    '''
+    Compute content hash of system coefficients.
+
+    Parameters
+    ----------
+    system : DiscreteTimeSystem
+        Discrete-time system.
+
+    Returns
+    -------
+    str
+        Hash of numerator, denominator and second-order section
+        coefficients, with their data types and shapes.
+    '''
+
+    arrays = (system.b, system.a)
+    if system.sos is not None:
+        arrays += (system.sos,)
+
+    return array_key(*arrays)
+
+
+def array_key(*arrays):
+    '''
+    Compute content hash of arrays.
+
+    Parameters
+    ----------
+    *arrays : numpy.ndarray
+        Arrays to hash.
+
+    Returns
+    -------
+    str
+        Hash of values, data types and shapes of arrays.
+    '''
+
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f'{array.dtype.str}{array.shape}'.encode('ascii'))
+
+        # object arrays, for e.g. of symbolic values, hold no raw values
+        if array.dtype.hasobject:
+            digest.update(repr(array.tolist()).encode('utf-8'))
+        else:
+            digest.update(array.view(np.uint8).reshape(-1))
+
+    return digest.hexdigest()
+
+
+# active response cache, None when caching is disabled
+_cache = None
+
+
+def get_response_cache():
+    '''
+    Get active response cache.
+
+    Returns
+    -------
+    ResponseCache or None
+        Active response cache, ``None`` if caching is disabled, which it is
+        by default.
+    '''
+
+    return _cache
+
+
+def set_response_cache(cache):
+    '''
+    Set active response cache.
+
+    Parameters
+    ----------
+    cache : ResponseCache or None
+        Response cache to use, ``None`` to disable caching.
+
+    Returns
+    -------
+    ResponseCache or None
+        Previously active response cache.
+    '''
+
+    global _cache
+
+    previous = _cache
+    _cache = cache
+
+    return previous
+
+
+@contextmanager
+def use_response_cache(cache):
+    '''
+    Context manager activating response cache within its block, restoring
+    the previously active cache afterwards.
+
+    Parameters
+    ----------
+    cache : ResponseCache or None
+        Response cache to use, ``None`` to disable caching.
+
+    Yields
+    ------
+    ResponseCache or None
+        Active response cache.
+    '''
+
+    previous = set_response_cache(cache)
+    try:
+        yield cache
+    finally:
+        set_response_cache(previous)
@@ -0,0 +1,146 @@
+import numpy as np
+
+# supported convolution methods
+CONV_METHODS = ('auto', 'direct', 'fft', 'overlap-add')
+
+# shorter operand length up to which direct convolution is always used
+DIRECT_MAX_LENGTH = 256
+# operand length product up to which direct convolution is always used
+DIRECT_MAX_PRODUCT = 1_000_000
+# operand length ratio from which overlap-add is preferred over FFT
+OVERLAP_ADD_MIN_RATIO = 16
+
+
+def choose_conv_method(n, m):
+    '''
+    Choose fastest convolution method for operands of given lengths.
+
+    Parameters
+    ----------
+    n : int
+        Length of first operand.
+
+    m : int
+        Length of second operand.
+
+    Returns
+    -------
+    method : str
+        Convolution method, one of ``'direct'``, ``'fft'`` or
+        ``'overlap-add'``.
+    '''
+
+    short_len = min(n, m)
+    long_len = max(n, m)
+
+    # direct convolution for short operands
+    if short_len <= DIRECT_MAX_LENGTH or n * m <= DIRECT_MAX_PRODUCT:
+        method = 'direct'
+    # overlap-add when one operand is much longer than the other
+    elif long_len >= OVERLAP_ADD_MIN_RATIO * short_len:
+        method = 'overlap-add'
+    # single FFT otherwise
+    else:
+        method = 'fft'
+
+    return method
+
+
+def convolve(x, h, method='auto'):
+    '''
+    Compute full discrete convolution of two arrays along their last axis.
+
+    One-dimensional arrays are convolved directly. For two-dimensional
+    arrays, each row is convolved separately, and a one-dimensional array is
+    convolved with every row of a two-dimensional array.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        First one or two-dimensional array.
+
+    h : numpy.ndarray
+        Second one or two-dimensional array.
+
+    method : str, optional
+        Convolution method, one of ``'auto'``, ``'direct'``, ``'fft'`` or
+        ``'overlap-add'``. ``'auto'`` chooses the method based on the lengths
+        of the arrays.
+
+    Returns
+    -------
+    y : numpy.ndarray
+        Convolution of given arrays, of length ``len(x) + len(h) - 1`` along
+        the last axis.
+    '''
+
+    # raise error if method is unknown
+    if method not in CONV_METHODS:
+        err_msg = f'Unknown convolution method {method}. '
+        err_msg += f'Use one of {CONV_METHODS}'
+        raise ValueError(err_msg)
+
+    x = np.asarray(x)
+    h = np.asarray(h)
+
+    if method == 'auto':
+        method = choose_conv_method(x.shape[-1], h.shape[-1])
+
+    if method == 'direct':
+        if x.ndim == 1 and h.ndim == 1:
+            return np.convolve(x, h)
+
+        return _convolve_direct_rows(x, h)
+
+    # import lazily to keep package import light
+    from scipy.signal import fftconvolve, oaconvolve
+
+    # match number of dimensions to convolve rows
+    ndim = max(x.ndim, h.ndim)
+    x = x.reshape((1,) * (ndim - x.ndim) + x.shape)
+    h = h.reshape((1,) * (ndim - h.ndim) + h.shape)
+
+    if method == 'fft':
+        y = fftconvolve(x, h, axes=-1)
+    else:
+        y = oaconvolve(x, h, axes=-1)
+
+    # round back to integers if both arrays are integer-valued
+    dtype = np.result_type(x, h)
+    if np.issubdtype(dtype, np.integer):
+        y = np.rint(y).astype(dtype)
+
+    return y
+
+
+def _convolve_direct_rows(x, h):
+    '''
+    Directly convolve arrays along last axis, broadcasting over rows.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        First array.
+
+    h : numpy.ndarray
+        Second array.
+
+    Returns
+    -------
+    y : numpy.ndarray
+        Convolution of given arrays.
+    '''
+
+    # iterate over values of shorter array
+    if x.shape[-1] < h.shape[-1]:
+        x, h = h, x
+
+    n = x.shape[-1]
+    m = h.shape[-1]
+    rows_shape = np.broadcast_shapes(x.shape[:-1], h.shape[:-1])
+
+    y = np.zeros(rows_shape + (n + m - 1,), dtype=np.result_type(x, h))
+    for k in range(m):
+        y[..., k : k + n] += h[..., k : k + 1] * x
+
+    return y
@@ -0,0 +1,365 @@
+import os
+import struct
+import uuid
+
+import numpy as np
+
+from DiscreteTimeLib.signals import DiscreteTimeSignal
+
+# identifier at start of every signal file
+MAGIC = b'DTLSIG'
+# version of signal file format
+VERSION = 1
+# header layout: magic, version, start index, dtype string, length
+HEADER_FORMAT = '<6sHq16sq'
+# size of header in bytes, padded so that sample data is aligned
+HEADER_SIZE = 64
+
+
+def write_header(file, start, dtype, length):
+    '''
+    Write signal file header at current position of file.
+
+    Parameters
+    ----------
+    file : file object
+        File opened for binary writing.
+
+    start : int
+        Index of first sample.
+
+    dtype : numpy.dtype
+        Data type of samples.
+
+    length : int
+        Number of samples.
+    '''
+
+    header = struct.pack(
+        HEADER_FORMAT,
+        MAGIC,
+        VERSION,
+        start,
+        np.dtype(dtype).str.encode('ascii'),
+        length,
+    )
+    file.write(header.ljust(HEADER_SIZE, b'\0'))
+
+
+def read_header(file):
+    '''
+    Read signal file header from start of file.
+
+    Parameters
+    ----------
+    file : file object
+        File opened for binary reading.
+
+    Returns
+    -------
+    start : int
+        Index of first sample.
+
+    dtype : numpy.dtype
+        Data type of samples.
+
+    length : int
+        Number of samples.
+    '''
+
+    header = file.read(HEADER_SIZE)
+
+    # raise error if file is not a signal file
+    if len(header) < HEADER_SIZE or not header.startswith(MAGIC):
+        raise ValueError('File is not a DiscreteTimeLib signal file')
+
+    magic, version, start, dtype, length = struct.unpack_from(
+        HEADER_FORMAT,
+        header,
+    )
+
+    # raise error if file format version is unknown
+    if version != VERSION:
+        err_msg = f'Unsupported signal file version {version}, '
+        err_msg += f'expected version {VERSION}'
+        raise ValueError(err_msg)
+
+    dtype = np.dtype(dtype.rstrip(b'\0').decode('ascii'))
+
+    return start, dtype, length
+
+
+def save_signal(sig, path):
+    '''
+    Save discrete-time signal to binary signal file.
+
+    The file consists of a fixed-size header, holding the start index, data
+    type and length of the signal, followed by the raw sample buffer. The
+    file is written to a temporary file first, which then replaces the file
+    at ``path``, so that a signal memory-mapped from ``path`` may be saved
+    back to it.
+
+    Parameters
+    ----------
+    sig : DiscreteTimeSignal
+        Discrete-time signal to save.
+
+    path : str or os.PathLike
+        Path of file to write.
+    '''
+
+    temp_path = _temp_path(path)
+
+    try:
+        with open(temp_path, 'xb') as file:
+            write_header(file, sig._start, sig.dtype, len(sig))
+            np.ascontiguousarray(sig._buffer).tofile(file)
+
+        os.replace(temp_path, path)
+    finally:
+        # remove temporary file if saving failed
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _temp_path(path):
+    '''
+    Get unique path of temporary file in the same directory as given file,
+    so that the temporary file can replace it.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path of file.
+
+    Returns
+    -------
+    str
+        Path of temporary file.
+    '''
+
+    directory, name = os.path.split(os.path.abspath(os.fspath(path)))
+
+    return os.path.join(directory, f'.{name}.{uuid.uuid4().hex}.tmp')
+
+
+def load_signal(path, mmap=True, mode='r', n_range=None):
+    '''
+    Load discrete-time signal from binary signal file.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path of file to read.
+
+    mmap : bool, optional
+        Whether to memory-map the sample buffer instead of reading it into
+        memory. Memory-mapped signals load instantly, and only the parts of
+        the file that are accessed are read.
+
+    mode : str, optional
+        Memory-map mode, one of ``'r'`` (read-only), ``'r+'`` (changes are
+        written to file) or ``'c'`` (changes are kept in memory only). In
+        ``'r+'`` mode, in-place operations such as ``+=`` write to file as
+        long as the index range and data type of the signal are unchanged,
+        also after taking views such as :meth:`DiscreteTimeSignal.window`,
+        which then see the changes. Views themselves copy on write.
+
+    n_range : array-like, optional
+        Range of indices to load. For e.g. set ``n_range = [-1, 3]`` to load
+        from ``n = -1`` to ``n = 2`` inclusive. Only samples of the signal
+        within this range are loaded.
+
+    Returns
+    -------
+    sig : DiscreteTimeSignal
+        Loaded discrete-time signal.
+    '''
+
+    # raise error if memory-map mode is unknown, since other modes of
+    # numpy.memmap overwrite the file
+    if mode not in ('r', 'r+', 'c'):
+        err_msg = f'Unknown mode {mode}. '
+        err_msg += 'Use \'r\', \'r+\' or \'c\''
+        raise ValueError(err_msg)
+
+    with open(path, 'rb') as file:
+        start, dtype, length = read_header(file)
+
+    # position of first and last loaded samples in file
+    first = 0
+    last = length
+    if n_range is not None:
+        # raise error if n_range shape is not (2,)
+        n_range_shape = np.shape(n_range)
+        if len(n_range_shape) != 1 or n_range_shape[0] != 2:
+            raise ValueError('n_range must be a two-element array')
+
+        first = min(max(int(n_range[0]) - start, 0), length)
+        last = max(min(int(n_range[1]) - start, length), first)
+
+    offset = HEADER_SIZE + first * dtype.itemsize
+    count = last - first
+
+    # memory-mapping empty array is not possible
+    if count == 0:
+        buffer = np.zeros(0, dtype=dtype)
+    elif mmap:
+        buffer = np.memmap(
+            path,
+            dtype=dtype,
+            mode=mode,
+            offset=offset,
+            shape=(count,),
+        )
+    else:
+        buffer = np.fromfile(path, dtype=dtype, count=count, offset=offset)
+
+    # signals mapped for writing are modified in place, so that in-place
+    # operations write to file, while other buffers are copied on write
+    sig = DiscreteTimeSignal._from_buffer(
+        start + first,
+        buffer,
+        shared=mode != 'r+',
+    )
+
+    return sig
+
+
+class SignalWriter:
+    '''
+    Writer for binary signal files, used to write a signal incrementally in
+    chunks without holding it in memory.
+
+    The header is written when the writer is closed, once the length of the
+    signal is known. Samples are written to a temporary file, which replaces
+    the file at ``path`` when the writer is closed, so that signals
+    memory-mapped from ``path`` stay intact while writing. The temporary
+    file is discarded if the ``with`` block of the writer raises an error.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path of file to write.
+
+    start : int
+        Index of first sample.
+
+    dtype : numpy.dtype, optional
+        Data type of samples. Defaults to data type of first written chunk.
+        Chunks must be safely castable to this data type.
+
+    Examples
+    --------
+    >>> with SignalWriter('signal.dtl', start=-2) as writer:
+    ...     writer.write(np.ones(3))
+    ...     writer.write(np.zeros(2))
+    >>> load_signal('signal.dtl').values()
+    memmap([1., 1., 1., 0., 0.])
+    '''
+
+    def __init__(self, path, start, dtype=None):
+        '''
+        Initializer for signal writer object.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of file to write.
+
+        start : int
+            Index of first sample.
+
+        dtype : numpy.dtype, optional
+            Data type of samples.
+        '''
+
+        self.path = path
+        self.start = int(start)
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        # number of samples written so far
+        self.length = 0
+
+        self._temp_path = _temp_path(path)
+        self._file = open(self._temp_path, 'xb')
+        # reserve space for header
+        self._file.write(bytes(HEADER_SIZE))
+
+    def write(self, values):
+        '''
+        Append chunk of values to signal file.
+
+        Parameters
+        ----------
+        values : array-like
+            One-dimensional array of consecutive sample values.
+        '''
+
+        values = np.asarray(values)
+
+        # raise error if values are not one-dimensional
+        if values.ndim != 1:
+            raise ValueError('chunk values must be one-dimensional')
+
+        if self.dtype is None:
+            self.dtype = values.dtype
+
+        # raise error if values cannot be stored without losing information
+        if not np.can_cast(values.dtype, self.dtype, casting='safe'):
+            err_msg = f'Cannot write values of type {values.dtype} '
+            err_msg += f'to signal file of type {self.dtype}'
+            raise TypeError(err_msg)
+
+        np.ascontiguousarray(values, dtype=self.dtype).tofile(self._file)
+        self.length += values.shape[0]
+
+    def close(self):
+        '''
+        Write header and close signal file.
+        '''
+
+        if self._file.closed:
+            return
+
+        if self.dtype is None:
+            self.dtype = np.dtype(np.float64)
+
+        self._file.seek(0)
+        write_header(self._file, self.start, self.dtype, self.length)
+        self._file.close()
+
+        os.replace(self._temp_path, self.path)
+
+    def discard(self):
+        '''
+        Close and remove signal file without replacing file at ``path``.
+        '''
+
+        if self._file.closed:
+            return
+
+        self._file.close()
+        os.remove(self._temp_path)
+
+    def __enter__(self):
+        '''
+        Enter context, returning writer.
+
+        Returns
+        -------
+        SignalWriter
+            This writer.
+        '''
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        '''
+        Exit context, closing writer, or discarding written samples if an
+        error was raised.
+        '''
+
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
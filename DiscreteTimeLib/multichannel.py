@@ -0,0 +1,655 @@
+import numpy as np
+
+from DiscreteTimeLib.convolution import convolve
+from DiscreteTimeLib.signals import DiscreteTimeSignal
+
+
+class MultichannelDiscreteTimeSignal:
+    '''
+    Multichannel discrete-time signal object, where all channels share one
+    index range.
+
+    Signal values are stored in a two-dimensional NumPy buffer of shape
+    ``(channels, samples)``, so that operations run on all channels at once.
+
+    Parameters
+    ----------
+    signals : iterable of DiscreteTimeSignal
+        Signal of each channel. Channels are zero-padded to the combined
+        index range of all signals.
+
+    dtype : numpy.dtype, optional
+        Data type of signal values. Defaults to combined data type of
+        given signals.
+
+    Examples
+    --------
+    >>> x_n = DiscreteTimeSignal(((0, 1), (1, 2)))
+    >>> y_n = DiscreteTimeSignal(((1, 3), (2, 4)))
+    >>> X = MultichannelDiscreteTimeSignal((x_n, y_n))
+    >>> X.values()
+    array([[1., 2., 0.],
+           [0., 3., 4.]])
+    '''
+
+    # set NumPy array priority
+    __array_priority__ = 10000
+
+    def __init__(self, signals=(), dtype=None):
+        '''
+        Initializer for multichannel discrete-time signal object.
+
+        Parameters
+        ----------
+        signals : iterable of DiscreteTimeSignal
+            Signal of each channel.
+
+        dtype : numpy.dtype, optional
+            Data type of signal values.
+        '''
+
+        signals = list(signals)
+        non_empty = [sig for sig in signals if len(sig) > 0]
+
+        if dtype is None:
+            dtype = np.result_type(np.float64, *(sig.dtype for sig in signals))
+
+        # combined index range of all channels
+        start = min((sig.min_idx for sig in non_empty), default=0)
+        stop = max((sig.max_idx + 1 for sig in non_empty), default=0)
+
+        # index of first sample in buffer
+        self._start = start
+        # buffer of signal values, one row per channel
+        self._buffer = np.zeros((len(signals), stop - start), dtype=dtype)
+
+        for i, sig in enumerate(signals):
+            offset = sig._start - start
+            self._buffer[i, offset : offset + len(sig)] = sig._buffer
+
+    @classmethod
+    def _from_buffer(cls, start, buffer):
+        '''
+        Create multichannel discrete-time signal object directly from sample
+        buffer, without copying.
+
+        Parameters
+        ----------
+        start : int
+            Index of first sample in buffer.
+
+        buffer : numpy.ndarray
+            Two-dimensional array of signal values, one row per channel.
+
+        Returns
+        -------
+        sig : MultichannelDiscreteTimeSignal
+            Multichannel discrete-time signal backed by given buffer.
+        '''
+
+        sig = cls.__new__(cls)
+        sig._start = int(start) if buffer.shape[1] > 0 else 0
+        sig._buffer = buffer
+
+        return sig
+
+    @classmethod
+    def from_dense(cls, start, values, dtype=None):
+        '''
+        Create multichannel discrete-time signal object from starting index
+        and two-dimensional array of consecutive values.
+
+        If ``values`` is a contiguous NumPy array of the requested data type,
+        it is used as the signal buffer without copying.
+
+        Parameters
+        ----------
+        start : int
+            Index of first value in each channel.
+
+        values : array-like
+            Two-dimensional array of shape ``(channels, samples)``, where
+            ``values[c, i]`` is the value of channel ``c`` at index
+            ``start + i``.
+
+        dtype : numpy.dtype, optional
+            Data type of signal values. Defaults to data type of ``values``.
+
+        Returns
+        -------
+        sig : MultichannelDiscreteTimeSignal
+            Multichannel discrete-time signal object.
+        '''
+
+        values = np.asarray(values, dtype=dtype)
+
+        # raise error if values are not two-dimensional
+        if values.ndim != 2:
+            raise ValueError('values must be two-dimensional')
+
+        # raise error if start is not an integer
+        if int(start) != start:
+            raise ValueError('start must be an integer')
+
+        sig = cls._from_buffer(int(start), np.ascontiguousarray(values))
+
+        return sig
+
+    @property
+    def dtype(self):
+        '''
+        Data type of signal values.
+
+        Returns
+        -------
+        numpy.dtype
+            Data type of signal values.
+        '''
+
+        return self._buffer.dtype
+
+    @property
+    def n_channels(self):
+        '''
+        Number of channels.
+
+        Returns
+        -------
+        int
+            Number of channels.
+        '''
+
+        return self._buffer.shape[0]
+
+    @property
+    def min_idx(self):
+        '''
+        Lowest index of signal, ``inf`` if signal has no samples.
+
+        Returns
+        -------
+        int
+            Lowest index of signal.
+        '''
+
+        if self._buffer.shape[1] == 0:
+            return float('inf')
+
+        return self._start
+
+    @property
+    def max_idx(self):
+        '''
+        Highest index of signal, ``-inf`` if signal has no samples.
+
+        Returns
+        -------
+        int
+            Highest index of signal.
+        '''
+
+        if self._buffer.shape[1] == 0:
+            return float('-inf')
+
+        return self._start + self._buffer.shape[1] - 1
+
+    def to_dataframe(self):
+        '''
+        Convert signal to pandas DataFrame, with one column per channel.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe with signal indices and values.
+        '''
+
+        # import lazily to keep package import light
+        import pandas as pd
+
+        return pd.DataFrame(
+            {f'x{c}[n]': self._buffer[c] for c in range(self.n_channels)},
+            index=self.keys(),
+        )
+
+    def __str__(self):  # pragma: no cover
+        '''
+        String representation of object.
+
+        Returns
+        -------
+        str
+            String representation.
+        '''
+
+        return str(self.to_dataframe())
+
+    def __len__(self):
+        '''
+        Get number of samples in each channel.
+
+        Returns
+        -------
+        int
+            Number of samples.
+        '''
+
+        return self._buffer.shape[1]
+
+    def __getitem__(self, key):
+        '''
+        Fetch values of all channels by index.
+
+        Parameters
+        ----------
+        key : int
+            Index to fetch.
+
+        Returns
+        -------
+        numpy.ndarray
+            Value of each channel at index.
+        '''
+
+        # position of key in buffer
+        offset = key - self._start
+
+        # return zeros if key is outside of buffer
+        if offset < 0 or offset >= self._buffer.shape[1]:
+            return np.zeros(self.n_channels, dtype=self.dtype)
+
+        return self._buffer[:, offset].copy()
+
+    def channel(self, c):
+        '''
+        Fetch signal of one channel.
+
+        Parameters
+        ----------
+        c : int
+            Channel number.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            Signal of given channel.
+        '''
+
+        # view of channel, shared with this signal
+        return DiscreteTimeSignal._from_buffer(
+            self._start,
+            self._buffer[c],
+            shared=True,
+        )
+
+    def keys(self):
+        '''
+        Fetch all signal keys.
+
+        Returns
+        -------
+        numpy.ndarray
+            Signal keys array.
+        '''
+
+        return np.arange(self._start, self._start + self._buffer.shape[1])
+
+    def values(self):
+        '''
+        Fetch all signal values.
+
+        Returns
+        -------
+        numpy.ndarray
+            Signal values array, of shape ``(channels, samples)``.
+        '''
+
+        return self._buffer.copy()
+
+    def _check_channels(self, sig):
+        '''
+        Raise error if given signal is not a supported signal, or if given
+        multichannel signal has a different number of channels.
+
+        Parameters
+        ----------
+        sig : MultichannelDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+        '''
+
+        # raise error if signal type is unsupported
+        signal_types = (DiscreteTimeSignal, MultichannelDiscreteTimeSignal)
+        if not isinstance(sig, signal_types):
+            err_msg = f'Unknown type {type(sig)}. '
+            err_msg += 'Use DiscreteTimeSignal or '
+            err_msg += 'MultichannelDiscreteTimeSignal'
+            raise TypeError(err_msg)
+
+        if sig._buffer.ndim == 2 and sig.n_channels != self.n_channels:
+            err_msg = f'Expected signal with {self.n_channels} channels, '
+            err_msg += f'got signal with {sig.n_channels} channels'
+            raise ValueError(err_msg)
+
+    def __eq__(self, sig):
+        '''
+        Compare this and given signal for equality. A single-channel signal is
+        compared against every channel.
+
+        Parameters
+        ----------
+        sig : MultichannelDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        bool
+            Boolean value indicating equality.
+        '''
+
+        # defer to other types
+        signal_types = (DiscreteTimeSignal, MultichannelDiscreteTimeSignal)
+        if not isinstance(sig, signal_types):
+            return NotImplemented
+
+        if sig._buffer.ndim == 2 and sig.n_channels != self.n_channels:
+            return False
+
+        # compare as DiscreteTimeSignal.allclose, with relative tolerance
+        _, values, sig_values = self._aligned_values(sig)
+
+        return bool(np.all(np.isclose(values, sig_values)))
+
+    def __ne__(self, sig):
+        '''
+        Compare this and given signal for inequality.
+
+        Parameters
+        ----------
+        sig : MultichannelDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        bool
+            Boolean value indicating inequality.
+        '''
+
+        is_equal = self.__eq__(sig)
+        if is_equal is NotImplemented:
+            return is_equal
+
+        return not is_equal
+
+    def _aligned_values(self, sig):
+        '''
+        Place values of this and given signal on their combined index range,
+        zero outside the index range of each signal.
+
+        Parameters
+        ----------
+        sig : MultichannelDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        start : int
+            First index of combined index range.
+
+        values : numpy.ndarray
+            Values of this signal, of shape ``(n_channels, n_samples)``.
+
+        sig_values : numpy.ndarray
+            Values of given signal, with a single row if it is a
+            single-channel signal.
+        '''
+
+        # get combined range from non-empty signals
+        ranges = [(s._start, s._start + len(s)) for s in (self, sig) if len(s)]
+        start = min((r[0] for r in ranges), default=0)
+        stop = max((r[1] for r in ranges), default=0)
+
+        values = np.zeros((self.n_channels, stop - start), dtype=self.dtype)
+        offset = self._start - start
+        values[:, offset : offset + len(self)] = self._buffer
+
+        n_rows = sig.n_channels if sig._buffer.ndim == 2 else 1
+        sig_values = np.zeros((n_rows, stop - start), dtype=sig.dtype)
+        offset = sig._start - start
+        sig_values[:, offset : offset + len(sig)] = sig._buffer
+
+        return start, values, sig_values
+
+    def element_wise_operation(self, sig, op='add'):
+        '''
+        Perform element-wise operation between this and given signal, on all
+        channels at once. A single-channel signal is applied to every
+        channel.
+
+        Parameters
+        ----------
+        sig : MultichannelDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        op : str
+            Operation to perform ('add'/'sub')
+
+        Returns
+        -------
+        result_signal : MultichannelDiscreteTimeSignal
+            Resulting multichannel signal.
+        '''
+
+        # raise error if operation is unknown
+        if op not in ('add', 'sub'):
+            err_msg = f'Unknown operation {op}. '
+            err_msg += 'Use \'add\' or \'sub\''
+            raise ValueError(err_msg)
+
+        self._check_channels(sig)
+
+        start, values, sig_values = self._aligned_values(sig)
+        dtype = np.result_type(self.dtype, sig.dtype)
+        values = values.astype(dtype, copy=False)
+
+        # add or subtract values of given signal in resulting range
+        if op == 'add':
+            values += sig_values
+        else:
+            values -= sig_values
+
+        result_signal = MultichannelDiscreteTimeSignal._from_buffer(
+            start,
+            values,
+        )
+
+        return result_signal
+
+    def __add__(self, sig):
+        '''
+        Add adjacent elements between this and given signal on all channels.
+
+        Parameters
+        ----------
+        sig : MultichannelDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        MultichannelDiscreteTimeSignal
+            Summation multichannel signal.
+        '''
+
+        return self.element_wise_operation(sig, op='add')
+
+    def __radd__(self, sig):
+        '''
+        Add adjacent elements between given signal and this signal on all
+        channels (reverse method).
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        MultichannelDiscreteTimeSignal
+            Summation multichannel signal.
+        '''
+
+        return self.element_wise_operation(sig, op='add')
+
+    def __sub__(self, sig):
+        '''
+        Subtract adjacent elements between this and given signal on all
+        channels.
+
+        Parameters
+        ----------
+        sig : MultichannelDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        MultichannelDiscreteTimeSignal
+            Subtracted multichannel signal.
+        '''
+
+        return self.element_wise_operation(sig, op='sub')
+
+    def __rsub__(self, sig):
+        '''
+        Subtract adjacent elements between given signal and this signal on all
+        channels (reverse method).
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        MultichannelDiscreteTimeSignal
+            Subtracted multichannel signal.
+        '''
+
+        return self.scalar_mul(-1).element_wise_operation(sig, op='add')
+
+    def scalar_mul(self, scalar):
+        '''
+        Compute scalar multiplication on all channels.
+
+        Parameters
+        ----------
+        scalar : int
+            Given scalar value.
+
+        Returns
+        -------
+        scaled_signal : MultichannelDiscreteTimeSignal
+            Scaled multichannel signal.
+        '''
+
+        values = np.multiply(
+            self._buffer,
+            scalar,
+            dtype=np.result_type(self.dtype, type(scalar)),
+        )
+
+        scaled_signal = MultichannelDiscreteTimeSignal._from_buffer(
+            self._start,
+            values,
+        )
+
+        return scaled_signal
+
+    def conv(self, sig, method='auto'):
+        '''
+        Compute discrete convolution of all channels with given signal. A
+        single-channel signal is convolved with every channel, and a
+        multichannel signal is convolved channel by channel.
+
+        Parameters
+        ----------
+        sig : MultichannelDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        method : str, optional
+            Convolution method, one of ``'auto'``, ``'direct'``, ``'fft'`` or
+            ``'overlap-add'``.
+
+        Returns
+        -------
+        conv_signal : MultichannelDiscreteTimeSignal
+            Discrete convolution multichannel signal.
+        '''
+
+        self._check_channels(sig)
+
+        if len(self) == 0 or len(sig) == 0:
+            empty_conv = MultichannelDiscreteTimeSignal._from_buffer(
+                0,
+                np.zeros((self.n_channels, 0), dtype=self.dtype),
+            )
+
+            return empty_conv
+
+        # compute convolution of all channels at once
+        conv = convolve(self._buffer, sig._buffer, method=method)
+
+        conv_signal = MultichannelDiscreteTimeSignal._from_buffer(
+            self._start + sig._start,
+            conv,
+        )
+
+        return conv_signal
+
+    def __mul__(self, param):
+        '''
+        Compute scalar multiplication or discrete convolution, depending on
+        parameter type.
+
+        Parameters
+        ----------
+        param : float or DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+            Given scalar value or signal.
+
+        Returns
+        -------
+        MultichannelDiscreteTimeSignal
+            Resulting multichannel signal.
+        '''
+
+        # scalar multiplication if scalar
+        if np.isscalar(param):
+            return self.scalar_mul(param)
+        # convolution if signal
+        elif isinstance(
+            param,
+            (DiscreteTimeSignal, MultichannelDiscreteTimeSignal),
+        ):
+            return self.conv(param)
+        # TypeError otherwise
+        else:
+            err_msg = f'Unknown type {type(param)}.'
+            err_msg += 'Use scalar for scalar multiplication '
+            err_msg += 'or signal object for convolution'
+
+            raise TypeError(err_msg)
+
+    def __rmul__(self, param):
+        '''
+        Compute scalar multiplication or discrete convolution, depending on
+        parameter type (reverse method).
+
+        Parameters
+        ----------
+        param : float or DiscreteTimeSignal
+            Given scalar value or signal.
+
+        Returns
+        -------
+        MultichannelDiscreteTimeSignal
+            Resulting multichannel signal.
+        '''
+
+        return self.__mul__(param)
@@ -0,0 +1,478 @@
+import math
+
+import numpy as np
+
+from DiscreteTimeLib.signals import DiscreteTimeSignal
+from DiscreteTimeLib.systems import DiscreteTimeSystem
+
+# default half length of resampling filter, in samples at the lower rate
+DEFAULT_HALF_LEN = 10
+
+
+def resampling_filter(L, M=1, half_len=DEFAULT_HALF_LEN):
+    '''
+    Design FIR lowpass filter for resampling by rational factor ``L / M``.
+
+    The filter is a Kaiser-windowed sinc with cutoff at the lower of the two
+    Nyquist frequencies and gain ``L``, compensating the energy lost to
+    inserted zeros. Its delay is ``half_len * max(L, M)`` samples at the
+    upsampled rate.
+
+    Parameters
+    ----------
+    L : int
+        Upsampling factor.
+
+    M : int, optional
+        Downsampling factor.
+
+    half_len : int, optional
+        Half length of filter, in samples at the lower of the two rates.
+
+    Notes
+    -----
+    The factors are reduced to lowest terms before designing the filter, so
+    the filter should be applied with the reduced factors, as done by
+    :func:`resample` when no filter is given.
+
+    Returns
+    -------
+    DiscreteTimeSystem
+        FIR resampling filter.
+    '''
+
+    L, M = _rate_factors(L, M)
+    gcd = math.gcd(L, M)
+    L //= gcd
+    M //= gcd
+
+    # no filtering needed when rate is unchanged
+    max_rate = max(L, M)
+    if max_rate == 1:
+        return DiscreteTimeSystem((1.0,), (1,))
+
+    # import lazily to keep package import light
+    from scipy.signal import firwin
+
+    b = L * firwin(
+        2 * half_len * max_rate + 1,
+        1 / max_rate,
+        window=('kaiser', 5.0),
+    )
+
+    return DiscreteTimeSystem(b, (1,))
+
+
+def resample(sig, L, M, system=None):
+    '''
+    Resample discrete-time signal by rational factor ``L / M``, using a
+    polyphase FIR filter.
+
+    The result is identical to upsampling the signal by ``L``, applying the
+    filter and downsampling by ``M``, with indices kept aligned, so that
+    output sample ``y[m]`` corresponds to upsampled index ``m * M``. Only the
+    output samples that are kept are computed, and inserted zeros are never
+    multiplied.
+
+    The output covers the upsampled range of the signal, which for input
+    indices ``n0`` to ``n1`` is ``n0 * L`` to ``(n1 + 1) * L - 1``, and, as
+    with :meth:`~DiscreteTimeLib.systems.DiscreteTimeSystem.filter`, the
+    filter response past that range is discarded.
+
+    Parameters
+    ----------
+    sig : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+        Given discrete-time signal. ``SparseDiscreteTimeSignal`` objects are
+        converted to dense signals before resampling.
+
+    L : int
+        Upsampling factor.
+
+    M : int
+        Downsampling factor.
+
+    system : DiscreteTimeSystem, optional
+        FIR filter applied at the upsampled rate. Defaults to
+        :func:`resampling_filter`, in which case the factors are first
+        reduced to lowest terms.
+
+    Returns
+    -------
+    y_n : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+        Resampled signal.
+
+    Examples
+    --------
+    >>> x_n = DiscreteTimeSignal.from_dense(0, np.arange(6.0))
+    >>> H = DiscreteTimeSystem((1, 1, 1), (1,))
+    >>> resample(x_n, 1, 3, system=H).values()
+    array([0., 6.])
+    '''
+
+    L, M = _rate_factors(L, M)
+    if system is None:
+        # default filter is designed for factors in lowest terms
+        gcd = math.gcd(L, M)
+        L //= gcd
+        M //= gcd
+        system = resampling_filter(L, M)
+
+    h = _fir_coeffs(system)
+
+    # import lazily to keep package import light
+    from DiscreteTimeLib.sparse import SparseDiscreteTimeSignal
+
+    # resampled response of sparse signal is dense
+    if isinstance(sig, SparseDiscreteTimeSignal):
+        sig = sig.to_dense()
+
+    # range of output indices m, for which m * M is within upsampled range
+    start = -(-sig._start * L // M)
+    stop = -(-(sig._start + len(sig)) * L // M)
+
+    y_values = _upfirdn_range(h, sig._buffer, sig._start, L, M, start, stop)
+    y_n = type(sig)._from_buffer(start, y_values)
+
+    return y_n
+
+
+def decimate(sig, M, system=None):
+    '''
+    Decimate discrete-time signal by integer factor, applying anti-aliasing
+    FIR filter and computing only the kept output samples.
+
+    Parameters
+    ----------
+    sig : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+        Given discrete-time signal.
+
+    M : int
+        Downsampling factor.
+
+    system : DiscreteTimeSystem, optional
+        FIR anti-aliasing filter. Defaults to :func:`resampling_filter`.
+
+    Returns
+    -------
+    y_n : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+        Decimated signal, see :func:`resample`.
+    '''
+
+    return resample(sig, 1, M, system=system)
+
+
+def interpolate(sig, L, system=None):
+    '''
+    Interpolate discrete-time signal by integer factor, applying
+    anti-imaging FIR filter without multiplying inserted zeros.
+
+    Parameters
+    ----------
+    sig : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+        Given discrete-time signal.
+
+    L : int
+        Upsampling factor.
+
+    system : DiscreteTimeSystem, optional
+        FIR anti-imaging filter. Defaults to :func:`resampling_filter`.
+
+    Returns
+    -------
+    y_n : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+        Interpolated signal, see :func:`resample`.
+    '''
+
+    return resample(sig, L, 1, system=system)
+
+
+class StreamingResampler:
+    '''
+    Stateful polyphase resampler, used to resample a signal that arrives in
+    successive chunks.
+
+    The input samples still within reach of the filter are carried from one
+    chunk to the next, so that the concatenated output is identical to
+    resampling the concatenated input with :func:`resample`.
+
+    Parameters
+    ----------
+    L : int
+        Upsampling factor.
+
+    M : int
+        Downsampling factor.
+
+    system : DiscreteTimeSystem, optional
+        FIR filter applied at the upsampled rate. Defaults to
+        :func:`resampling_filter`.
+
+    Examples
+    --------
+    >>> H = DiscreteTimeSystem((1, 1, 1), (1,))
+    >>> stream = StreamingResampler(1, 3, system=H)
+    >>> stream.process(np.arange(4.0))
+    array([0., 6.])
+    >>> stream.process(np.arange(4.0, 6.0))
+    array([], dtype=float64)
+    '''
+
+    def __init__(self, L, M, system=None):
+        '''
+        Initializer for streaming resampler object.
+
+        Parameters
+        ----------
+        L : int
+            Upsampling factor.
+
+        M : int
+            Downsampling factor.
+
+        system : DiscreteTimeSystem, optional
+            FIR filter applied at the upsampled rate.
+        '''
+
+        self.L, self.M = _rate_factors(L, M)
+        if system is None:
+            # default filter is designed for factors in lowest terms
+            gcd = math.gcd(self.L, self.M)
+            self.L //= gcd
+            self.M //= gcd
+            system = resampling_filter(self.L, self.M)
+
+        self.h = _fir_coeffs(system)
+        # number of past input samples within reach of the filter
+        self.n_history = -(-(self.h.shape[0] - 1) // self.L)
+        self.reset()
+
+    def reset(self):
+        '''
+        Reset resampler state, as if no chunks have been processed.
+        '''
+
+        # past input values, created on first chunk
+        self.history = None
+        # index of next input sample
+        self.idx = 0
+        # index expected at start of next signal chunk
+        self.next_idx = None
+
+    def process_values(self, values):
+        '''
+        Resample next chunk of values.
+
+        Parameters
+        ----------
+        values : array-like
+            One-dimensional array of input values.
+
+        Returns
+        -------
+        y_values : numpy.ndarray
+            Resampled values.
+        '''
+
+        values = np.asarray(values)
+
+        # raise error if values are not one-dimensional
+        if values.ndim != 1:
+            raise ValueError('chunk values must be one-dimensional')
+
+        dtype = np.result_type(self.h, values)
+        if self.history is None:
+            self.history = np.zeros(0, dtype=dtype)
+
+        # range of output indices covered by chunk
+        start = -(-self.idx * self.L // self.M)
+        stop = -(-(self.idx + values.shape[0]) * self.L // self.M)
+
+        values = np.concatenate((self.history, values.astype(dtype)))
+        values_start = self.idx - self.history.shape[0]
+        y_values = _upfirdn_range(
+            self.h,
+            values,
+            values_start,
+            self.L,
+            self.M,
+            start,
+            stop,
+        )
+
+        self.history = values[max(values.shape[0] - self.n_history, 0) :]
+        self.idx = values_start + values.shape[0]
+        if self.next_idx is not None:
+            self.next_idx = self.idx
+
+        return y_values
+
+    def process(self, chunk):
+        '''
+        Resample next chunk of input.
+
+        Parameters
+        ----------
+        chunk : DiscreteTimeSignal or array-like
+            Next chunk of input. Signal chunks must start at the index
+            following the end of the previous signal chunk.
+
+        Returns
+        -------
+        DiscreteTimeSignal or numpy.ndarray
+            Resampled chunk, of the same type as the given chunk.
+        '''
+
+        if not isinstance(chunk, DiscreteTimeSignal):
+            return self.process_values(chunk)
+
+        if len(chunk) == 0:
+            empty_signal = DiscreteTimeSignal()
+
+            return empty_signal
+
+        # raise error if chunk is not contiguous with previous chunk
+        if self.next_idx is not None and chunk.min_idx != self.next_idx:
+            err_msg = f'Expected chunk starting at index {self.next_idx}, '
+            err_msg += f'got chunk starting at index {chunk.min_idx}'
+            raise ValueError(err_msg)
+
+        # align first chunk with its index
+        if self.next_idx is None:
+            self.idx = chunk.min_idx
+            self.next_idx = chunk.min_idx
+
+        start = -(-self.idx * self.L // self.M)
+        y_values = self.process_values(chunk._buffer)
+
+        y_n = DiscreteTimeSignal.from_dense(start, y_values)
+
+        return y_n
+
+    def __call__(self, chunk):
+        '''
+        Resample next chunk of input.
+
+        Parameters
+        ----------
+        chunk : DiscreteTimeSignal or array-like
+            Next chunk of input.
+
+        Returns
+        -------
+        DiscreteTimeSignal or numpy.ndarray
+            Resampled chunk, of the same type as the given chunk.
+        '''
+
+        return self.process(chunk)
+
+
+def _rate_factors(L, M):
+    '''
+    Validate resampling factors.
+
+    Parameters
+    ----------
+    L : int
+        Upsampling factor.
+
+    M : int
+        Downsampling factor.
+
+    Returns
+    -------
+    L, M : int
+        Factors as integers.
+    '''
+
+    # raise error if factors are not positive integers
+    for name, factor in (('L', L), ('M', M)):
+        if int(factor) != factor or factor < 1:
+            raise ValueError(f'{name} must be a positive integer')
+
+    return int(L), int(M)
+
+
+def _fir_coeffs(system):
+    '''
+    Fetch impulse response of FIR system.
+
+    Parameters
+    ----------
+    system : DiscreteTimeSystem
+        FIR system, whose denominator is a single non-zero coefficient.
+
+    Returns
+    -------
+    numpy.ndarray
+        Impulse response of system.
+    '''
+
+    a = np.trim_zeros(system.a, 'b')
+
+    # raise error if system is not FIR
+    if a.shape[0] != 1 or a[0] == 0:
+        err_msg = 'Resampling requires an FIR system, '
+        err_msg += 'with a single non-zero denominator coefficient'
+        raise ValueError(err_msg)
+
+    return system.b / a[0]
+
+
+def _upfirdn_range(h, values, values_start, L, M, start, stop):
+    '''
+    Compute range of outputs of polyphase upsample, filter and downsample,
+    ``y[m] = sum_k x[k] h[m * M - k * L]``.
+
+    Parameters
+    ----------
+    h : numpy.ndarray
+        Impulse response of FIR filter.
+
+    values : numpy.ndarray
+        Input values along last axis, zero outside of the array.
+
+    values_start : int
+        Index of first input value.
+
+    L, M : int
+        Upsampling and downsampling factors.
+
+    start : int
+        First output index.
+
+    stop : int
+        Index following last output index.
+
+    Returns
+    -------
+    y_values : numpy.ndarray
+        Output values from ``y[start]`` to ``y[stop - 1]``.
+    '''
+
+    dtype = np.result_type(h, values, np.float64)
+    y_values = np.zeros(
+        values.shape[:-1] + (max(stop - start, 0),),
+        dtype=dtype,
+    )
+    if stop <= start or values.shape[-1] == 0:
+        return y_values
+
+    # import lazily to keep package import light
+    from scipy.signal import upfirdn
+
+    # delay filter so that outputs fall on multiples of M in upsampled index
+    base = values_start * L
+    delay = (base - start * M) % M
+    h = np.concatenate((np.zeros(delay, dtype=h.dtype), h))
+    outputs = upfirdn(h, values, up=L, down=M, axis=-1)
+
+    # output index of first computed output
+    first = (base - delay) // M
+    skip = max(start - first, 0)
+    offset = max(first - start, 0)
+    count = min(outputs.shape[-1] - skip, y_values.shape[-1] - offset)
+    if count > 0:
+        kept = outputs[..., skip : skip + count]
+        y_values[..., offset : offset + count] = kept
+
+    return y_values
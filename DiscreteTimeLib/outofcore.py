@@ -0,0 +1,271 @@
+import os
+
+import numpy as np
+
+from DiscreteTimeLib.convolution import convolve
+from DiscreteTimeLib.io import SignalWriter, load_signal
+from DiscreteTimeLib.signals import DiscreteTimeSignal
+
+# default number of samples read from source at a time
+DEFAULT_BLOCK_SIZE = 2**16
+
+
+def iter_blocks(source, block_size=DEFAULT_BLOCK_SIZE, start=0):
+    '''
+    Iterate over consecutive blocks of a signal source.
+
+    Parameters
+    ----------
+    source : DiscreteTimeSignal or str or os.PathLike or iterable
+        Signal source. A discrete-time signal, for e.g. a memory-mapped
+        signal, is read in blocks of ``block_size`` samples. A path is
+        memory-mapped using :func:`~DiscreteTimeLib.io.load_signal`. Any
+        other iterable must yield consecutive chunks, either as arrays of
+        values or as discrete-time signals. Empty chunks are skipped, and
+        chunks longer than ``block_size`` are split into blocks of
+        ``block_size`` samples. Shorter chunks are yielded as they are.
+
+    block_size : int, optional
+        Maximum number of samples per block.
+
+    start : int, optional
+        Index of first sample, when reading from an iterable of arrays.
+
+    Yields
+    ------
+    idx : int
+        Index of first sample of block.
+
+    values : numpy.ndarray
+        Values of block.
+    '''
+
+    # raise error if block size is not positive
+    if block_size < 1:
+        raise ValueError('block_size must be positive')
+
+    if isinstance(source, (str, os.PathLike)):
+        source = load_signal(source)
+
+    if isinstance(source, DiscreteTimeSignal):
+        for offset in range(0, len(source), block_size):
+            block = source._buffer[offset : offset + block_size]
+            yield source._start + offset, block
+
+        return
+
+    idx = start
+    # whether a non-empty chunk was read, fixing index of following chunks
+    started = False
+    for chunk in source:
+        if isinstance(chunk, DiscreteTimeSignal):
+            if len(chunk) == 0:
+                continue
+
+            # raise error if chunk is not contiguous with previous chunk
+            if started and chunk.min_idx != idx:
+                err_msg = f'Expected chunk starting at index {idx}, '
+                err_msg += f'got chunk starting at index {chunk.min_idx}'
+                raise ValueError(err_msg)
+
+            idx = chunk.min_idx
+            chunk = chunk._buffer
+
+        chunk = np.asarray(chunk)
+        for offset in range(0, chunk.shape[0], block_size):
+            yield idx + offset, chunk[offset : offset + block_size]
+
+        started = started or chunk.shape[0] > 0
+        idx += chunk.shape[0]
+
+
+def filter_out_of_core(
+    system,
+    source,
+    sink,
+    block_size=DEFAULT_BLOCK_SIZE,
+    start=0,
+):
+    '''
+    Apply digital filter on a signal block by block, writing the filtered
+    signal incrementally to a signal file.
+
+    Peak memory use is set by the block size rather than the length of the
+    signal, so that signals larger than memory can be filtered. The data
+    type of the filtered signal is set by its first block, so that later
+    blocks must not require a wider data type, for e.g. complex blocks
+    after real blocks. ``sink`` is replaced once filtering is done, so that
+    it may be the file ``source`` is read from.
+
+    Parameters
+    ----------
+    system : DiscreteTimeSystem
+        Discrete-time system to apply.
+
+    source : DiscreteTimeSignal or str or os.PathLike or iterable
+        Signal source, see :func:`iter_blocks`.
+
+    sink : str or os.PathLike
+        Path of signal file to write filtered signal to.
+
+    block_size : int, optional
+        Number of samples per block.
+
+    start : int, optional
+        Index of first sample, when reading from an iterable of arrays.
+
+    Returns
+    -------
+    DiscreteTimeSignal
+        Filtered signal, memory-mapped from ``sink``.
+    '''
+
+    stream = system.stream()
+
+    with _LazyWriter(sink) as writer:
+        for idx, values in iter_blocks(source, block_size, start):
+            writer.write(idx, stream.process_values(values))
+
+    return load_signal(sink)
+
+
+def conv_out_of_core(
+    source,
+    h_n,
+    sink,
+    block_size=DEFAULT_BLOCK_SIZE,
+    start=0,
+    method='auto',
+):
+    '''
+    Compute discrete convolution of a signal with an in-memory signal, using
+    overlap-add block by block, writing the result incrementally to a signal
+    file.
+
+    Peak memory use is set by the block size and the length of ``h_n``
+    rather than the length of the signal, so that signals larger than memory
+    can be convolved. The data type of the convolution is set by its first
+    block, so that later blocks must not require a wider data type, for e.g.
+    complex blocks after real blocks. ``sink`` is replaced once convolution
+    is done, so that it may be the file ``source`` is read from.
+
+    Parameters
+    ----------
+    source : DiscreteTimeSignal or str or os.PathLike or iterable
+        Signal source, see :func:`iter_blocks`.
+
+    h_n : DiscreteTimeSignal
+        Signal to convolve with, for e.g. an impulse response.
+
+    sink : str or os.PathLike
+        Path of signal file to write convolution to.
+
+    block_size : int, optional
+        Number of samples per block.
+
+    start : int, optional
+        Index of first sample, when reading from an iterable of arrays.
+
+    method : str, optional
+        Convolution method for each block, one of ``'auto'``, ``'direct'``,
+        ``'fft'`` or ``'overlap-add'``.
+
+    Returns
+    -------
+    DiscreteTimeSignal
+        Convolution signal, memory-mapped from ``sink``.
+    '''
+
+    # tail of previous block convolution, overlapping next block
+    carry = None
+
+    with _LazyWriter(sink) as writer:
+        if len(h_n) > 0:
+            for idx, values in iter_blocks(source, block_size, start):
+                conv = convolve(values, h_n._buffer, method=method)
+
+                if carry is None:
+                    carry = np.zeros(len(h_n) - 1, dtype=conv.dtype)
+                    conv_idx = idx + h_n.min_idx
+                else:
+                    conv = conv.astype(np.result_type(conv, carry))
+
+                # add overlapping tail of previous blocks
+                conv[: carry.shape[0]] += carry
+
+                # write samples that no later block contributes to
+                writer.write(conv_idx, conv[: values.shape[0]])
+                carry = conv[values.shape[0] :]
+                conv_idx += values.shape[0]
+
+        if carry is not None:
+            writer.write(conv_idx, carry)
+
+    return load_signal(sink)
+
+
+class _LazyWriter:
+    '''
+    Signal writer that opens its file on first write, once the start index
+    and data type are known, or writes an empty signal file if nothing is
+    written.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path of file to write.
+    '''
+
+    def __init__(self, path):
+        '''
+        Initializer for lazy signal writer object.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of file to write.
+        '''
+
+        self.path = path
+        self.writer = None
+
+    def write(self, idx, values):
+        '''
+        Append chunk of values to signal file.
+
+        Parameters
+        ----------
+        idx : int
+            Index of first value, used if this is the first chunk.
+
+        values : numpy.ndarray
+            One-dimensional array of consecutive sample values.
+        '''
+
+        if self.writer is None:
+            self.writer = SignalWriter(self.path, idx, dtype=values.dtype)
+
+        self.writer.write(values)
+
+    def __enter__(self):
+        '''
+        Enter context, returning writer.
+
+        Returns
+        -------
+        _LazyWriter
+            This writer.
+        '''
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        '''
+        Exit context, closing writer, or discarding written samples if an
+        error was raised.
+        '''
+
+        if self.writer is None:
+            self.writer = SignalWriter(self.path, 0)
+
+        self.writer.__exit__(exc_type, exc_value, traceback)
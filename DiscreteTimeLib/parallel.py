@@ -0,0 +1,333 @@
+import os
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from itertools import islice
+
+import numpy as np
+
+from DiscreteTimeLib.multichannel import MultichannelDiscreteTimeSignal
+from DiscreteTimeLib.systems import DiscreteTimeSystem
+
+# supported executor types
+EXECUTOR_TYPES = ('thread', 'process')
+
+# number of pending tasks per worker, bounding memory held by queued input
+# and finished output
+PENDING_PER_WORKER = 2
+
+
+def filter_many(
+    system,
+    signals,
+    executor='thread',
+    max_workers=None,
+    chunksize=1,
+):
+    '''
+    Apply digital filter on many discrete-time signals, spreading the work
+    over a pool of workers.
+
+    Signals are sent to workers in chunks, and filtered signals are yielded
+    in the order of the given signals as soon as they are finished. Only a
+    bounded number of chunks is pending at a time, so that long iterables of
+    signals are streamed through the pool rather than loaded at once.
+
+    Parameters
+    ----------
+    system : DiscreteTimeSystem
+        Discrete-time system to apply.
+
+    signals : iterable of DiscreteTimeSignal
+        Signals to filter.
+
+    executor : str or concurrent.futures.Executor, optional
+        Pool of workers, one of ``'thread'`` or ``'process'``, or an existing
+        executor, which is not shut down afterwards. Threads suit long
+        signals, since filtering releases the GIL, and processes suit many
+        short signals.
+
+    max_workers : int, optional
+        Number of workers, when creating a pool. Defaults to the number of
+        CPUs.
+
+    chunksize : int, optional
+        Number of signals sent to a worker at a time. Larger chunks reduce
+        the overhead of each task for short signals.
+
+    Yields
+    ------
+    y_n : DiscreteTimeSignal
+        Filtered discrete-time signal.
+
+    Examples
+    --------
+    >>> H = DiscreteTimeSystem((1,), (1, -0.5))
+    >>> signals = [DiscreteTimeSignal.from_dense(0, np.ones(3))] * 2
+    >>> [y_n.values() for y_n in filter_many(H, signals, chunksize=2)]
+    [array([1.  , 1.5 , 1.75]), array([1.  , 1.5 , 1.75])]
+    '''
+
+    # raise error if chunk size is not positive
+    if chunksize < 1:
+        raise ValueError('chunksize must be positive')
+
+    signals = iter(signals)
+    chunks = iter(lambda: list(islice(signals, chunksize)), [])
+
+    for filtered_chunk in _ordered_map(
+        _filter_chunk,
+        _coeffs(system),
+        chunks,
+        executor,
+        max_workers,
+    ):
+        yield from filtered_chunk
+
+
+def filter_channels(
+    system,
+    sig,
+    executor='thread',
+    max_workers=None,
+    chunksize=None,
+):
+    '''
+    Apply digital filter on all channels of multichannel discrete-time
+    signal, spreading blocks of channels over a pool of workers.
+
+    Parameters
+    ----------
+    system : DiscreteTimeSystem
+        Discrete-time system to apply.
+
+    sig : MultichannelDiscreteTimeSignal
+        Multichannel signal to filter.
+
+    executor : str or concurrent.futures.Executor, optional
+        Pool of workers, see :func:`filter_many`.
+
+    max_workers : int, optional
+        Number of workers, when creating a pool. Defaults to the number of
+        CPUs.
+
+    chunksize : int, optional
+        Number of channels sent to a worker at a time. Defaults to splitting
+        the channels evenly over the workers.
+
+    Returns
+    -------
+    y_n : MultichannelDiscreteTimeSignal
+        Filtered multichannel signal.
+    '''
+
+    n_workers = _n_workers(executor, max_workers)
+    if chunksize is None:
+        chunksize = max(-(-sig.n_channels // n_workers), 1)
+
+    # raise error if chunk size is not positive
+    if chunksize < 1:
+        raise ValueError('chunksize must be positive')
+
+    # blocks of consecutive channels, as views of signal buffer
+    firsts = range(0, sig.n_channels, chunksize)
+    blocks = (sig._buffer[c : c + chunksize] for c in firsts)
+    filtered_blocks = list(
+        _ordered_map(
+            _filter_block,
+            _coeffs(system),
+            blocks,
+            executor,
+            max_workers,
+        )
+    )
+
+    if len(filtered_blocks) == 0:
+        return system.filter(sig)
+
+    y_n = MultichannelDiscreteTimeSignal._from_buffer(
+        sig._start,
+        np.concatenate(filtered_blocks),
+    )
+
+    return y_n
+
+
+def _ordered_map(func, coeffs, items, executor, max_workers):
+    '''
+    Apply function on items using pool of workers, yielding results in order
+    of items, while keeping a bounded number of tasks pending.
+
+    Parameters
+    ----------
+    func : callable
+        Module-level function, taking system coefficients and an item.
+
+    coeffs : tuple
+        Coefficients of system, passed to every call of ``func``.
+
+    items : iterable
+        Items to apply function on.
+
+    executor : str or concurrent.futures.Executor
+        Pool of workers.
+
+    max_workers : int or None
+        Number of workers, when creating a pool.
+
+    Yields
+    ------
+    object
+        Result of function on each item.
+    '''
+
+    n_workers = _n_workers(executor, max_workers)
+    owns_executor = not isinstance(executor, Executor)
+    if executor == 'thread':
+        executor = ThreadPoolExecutor(max_workers=n_workers)
+    elif executor == 'process':
+        executor = ProcessPoolExecutor(max_workers=n_workers)
+
+    pending = deque()
+    try:
+        for item in items:
+            # wait for oldest task when too many tasks are pending
+            if len(pending) >= PENDING_PER_WORKER * n_workers:
+                yield pending.popleft().result()
+
+            pending.append(executor.submit(func, *coeffs, item))
+
+        while len(pending) > 0:
+            yield pending.popleft().result()
+    finally:
+        # cancel remaining tasks, for e.g. when generator is closed early
+        for future in pending:
+            future.cancel()
+
+        if owns_executor:
+            executor.shutdown()
+
+
+def _n_workers(executor, max_workers):
+    '''
+    Compute number of workers of pool.
+
+    Parameters
+    ----------
+    executor : str or concurrent.futures.Executor
+        Pool of workers.
+
+    max_workers : int or None
+        Number of workers, when creating a pool.
+
+    Returns
+    -------
+    int
+        Number of workers.
+    '''
+
+    # raise error if executor type is unknown
+    if not isinstance(executor, Executor) and executor not in EXECUTOR_TYPES:
+        err_msg = f'Unknown executor {executor}. '
+        err_msg += f'Use one of {EXECUTOR_TYPES} or a '
+        err_msg += 'concurrent.futures.Executor object'
+        raise ValueError(err_msg)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    return max_workers
+
+
+def _coeffs(system):
+    '''
+    Extract coefficients of system, to send to workers instead of the system
+    itself, whose cached values may not be picklable.
+
+    Parameters
+    ----------
+    system : DiscreteTimeSystem
+        Discrete-time system.
+
+    Returns
+    -------
+    tuple
+        Numerator coefficients, denominator coefficients and second-order
+        sections of system.
+    '''
+
+    return system.b, system.a, system.sos
+
+
+def _system(b, a, sos):
+    '''
+    Rebuild system from coefficients inside worker.
+
+    Parameters
+    ----------
+    b : numpy.ndarray
+        Numerator coefficients.
+
+    a : numpy.ndarray
+        Denominator coefficients.
+
+    sos : numpy.ndarray or None
+        Second-order sections.
+
+    Returns
+    -------
+    system : DiscreteTimeSystem
+        Discrete-time system.
+    '''
+
+    system = DiscreteTimeSystem(b, a)
+    system.sos = sos
+
+    return system
+
+
+def _filter_chunk(b, a, sos, chunk):
+    '''
+    Apply digital filter on chunk of signals inside worker.
+
+    Parameters
+    ----------
+    b, a, sos : numpy.ndarray
+        Coefficients of system, see :func:`_system`.
+
+    chunk : list of DiscreteTimeSignal
+        Signals to filter.
+
+    Returns
+    -------
+    list of DiscreteTimeSignal
+        Filtered signals.
+    '''
+
+    system = _system(b, a, sos)
+
+    return [system.filter(sig) for sig in chunk]
+
+
+def _filter_block(b, a, sos, block):
+    '''
+    Apply digital filter on block of channel values inside worker.
+
+    Parameters
+    ----------
+    b, a, sos : numpy.ndarray
+        Coefficients of system, see :func:`_system`.
+
+    block : numpy.ndarray
+        Two-dimensional array of channel values.
+
+    Returns
+    -------
+    numpy.ndarray
+        Filtered channel values.
+    '''
+
+    return _system(b, a, sos)._filter_values(block)
@@ -0,0 +1,432 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+# active profiler, None when profiling is disabled
+_profiler = None
+
+
+class Profiler:
+    '''
+    Profiler object, recording call counts, cumulative wall time and bytes
+    allocated for each instrumented operation and each of its internal
+    phases, for e.g. ``'materialize'``, ``'compute'`` or ``'wrap result'``.
+
+    Profilers are activated using :func:`profile` or :func:`enable`.
+
+    Examples
+    --------
+    >>> with profile() as profiler:
+    ...     x_n = DiscreteTimeSignal.from_dense(0, np.ones(100))
+    ...     y_n = x_n * x_n
+    >>> profiler.snapshot()['DiscreteTimeSignal.conv']['calls']
+    1
+    '''
+
+    def __init__(self):
+        '''
+        Initializer for profiler object.
+        '''
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        '''
+        Discard all recorded statistics.
+        '''
+
+        with self._lock:
+            # statistics keyed by (operation, phase), phase None for totals
+            self._stats = {}
+
+    def record(self, operation, phase, elapsed, n_bytes):
+        '''
+        Record one call of an operation or phase.
+
+        Parameters
+        ----------
+        operation : str
+            Name of operation.
+
+        phase : str or None
+            Name of phase, ``None`` for the operation as a whole.
+
+        elapsed : float
+            Wall time of call, in seconds.
+
+        n_bytes : int
+            Bytes allocated by call.
+        '''
+
+        with self._lock:
+            stats = self._stats.setdefault((operation, phase), [0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += n_bytes
+
+    def records(self):
+        '''
+        List recorded statistics as flat records, for e.g. to send to a
+        metrics system.
+
+        Returns
+        -------
+        list of dict
+            One record per operation and phase, holding ``'operation'``,
+            ``'phase'`` (``None`` for operation totals), ``'calls'``,
+            ``'time'`` (seconds) and ``'bytes'``.
+        '''
+
+        with self._lock:
+            items = sorted(
+                self._stats.items(),
+                key=lambda item: (item[0][0], item[0][1] or ''),
+            )
+
+        records = [
+            {
+                'operation': operation,
+                'phase': phase,
+                'calls': calls,
+                'time': elapsed,
+                'bytes': n_bytes,
+            }
+            for (operation, phase), (calls, elapsed, n_bytes) in items
+        ]
+
+        return records
+
+    def snapshot(self):
+        '''
+        Take snapshot of recorded statistics, grouped by operation.
+
+        Returns
+        -------
+        dict
+            Statistics keyed by operation name, each holding ``'calls'``,
+            ``'time'`` (seconds), ``'bytes'`` and ``'phases'``, which holds
+            the same statistics keyed by phase name.
+        '''
+
+        snapshot = {}
+        for record in self.records():
+            operation = snapshot.setdefault(
+                record['operation'],
+                {'calls': 0, 'time': 0.0, 'bytes': 0, 'phases': {}},
+            )
+            stats = {
+                'calls': record['calls'],
+                'time': record['time'],
+                'bytes': record['bytes'],
+            }
+
+            if record['phase'] is None:
+                operation.update(stats)
+            else:
+                operation['phases'][record['phase']] = stats
+
+        return snapshot
+
+    def export(self, file):
+        '''
+        Export snapshot of recorded statistics as JSON.
+
+        Parameters
+        ----------
+        file : str or os.PathLike or file object
+            Path of file to write, or file object opened for text writing.
+        '''
+
+        if hasattr(file, 'write'):
+            json.dump(self.snapshot(), file, indent=2)
+
+            return
+
+        with open(file, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+class _Span:
+    '''
+    Context manager timing one call of an operation or phase.
+
+    Parameters
+    ----------
+    profiler : Profiler
+        Profiler to record call in.
+
+    operation : str
+        Name of operation.
+
+    phase : str or None
+        Name of phase.
+    '''
+
+    def __init__(self, profiler, operation, phase):
+        '''
+        Initializer for span object.
+
+        Parameters
+        ----------
+        profiler : Profiler
+            Profiler to record call in.
+
+        operation : str
+            Name of operation.
+
+        phase : str or None
+            Name of phase.
+        '''
+
+        self.profiler = profiler
+        self.operation = operation
+        self.phase = phase
+        self.n_bytes = 0
+
+    def allocated(self, array):
+        '''
+        Count memory of array allocated during call.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Allocated array.
+        '''
+
+        self.n_bytes += array.nbytes
+
+    def __enter__(self):
+        '''
+        Start timing call.
+
+        Returns
+        -------
+        _Span
+            This span.
+        '''
+
+        self.t_start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        '''
+        Stop timing call and record it.
+        '''
+
+        elapsed = time.perf_counter() - self.t_start
+        self.profiler.record(
+            self.operation,
+            self.phase,
+            elapsed,
+            self.n_bytes,
+        )
+
+
+class _NullSpan:
+    '''
+    Context manager that does nothing, used when profiling is disabled.
+    '''
+
+    def allocated(self, array):
+        '''
+        Ignore allocated array.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Allocated array.
+        '''
+
+    def __enter__(self):
+        '''
+        Enter context.
+
+        Returns
+        -------
+        _NullSpan
+            This span.
+        '''
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        '''
+        Exit context.
+        '''
+
+
+# shared span returned while profiling is disabled, so that disabled
+# instrumentation allocates nothing
+_NULL_SPAN = _NullSpan()
+
+
+def span(operation, phase=None):
+    '''
+    Create context manager timing one call of an instrumented operation or
+    one of its phases.
+
+    Parameters
+    ----------
+    operation : str
+        Name of operation.
+
+    phase : str, optional
+        Name of phase, omitted for the operation as a whole.
+
+    Returns
+    -------
+    context manager
+        Span recording the call in the active profiler, or a shared no-op
+        span if profiling is disabled.
+    '''
+
+    if _profiler is None:
+        return _NULL_SPAN
+
+    return _Span(_profiler, operation, phase)
+
+
+def profiled(operation, phase=None):
+    '''
+    Create decorator instrumenting function as an operation or one of its
+    phases. Calls of the function are timed while profiling is enabled, and
+    the memory of returned arrays and signals is counted as allocated.
+
+    Parameters
+    ----------
+    operation : str
+        Name of operation.
+
+    phase : str, optional
+        Name of phase, omitted for the operation as a whole.
+
+    Returns
+    -------
+    callable
+        Decorator.
+    '''
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # call function directly when profiling is disabled
+            if _profiler is None:
+                return func(*args, **kwargs)
+
+            with _Span(_profiler, operation, phase) as s:
+                result = func(*args, **kwargs)
+                s.n_bytes += _nbytes(result)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _nbytes(obj):
+    '''
+    Count memory of arrays held by object returned from an instrumented
+    function.
+
+    Parameters
+    ----------
+    obj : object
+        Returned object, for e.g. an array, a signal or a tuple of arrays.
+
+    Returns
+    -------
+    int
+        Bytes held by arrays.
+    '''
+
+    if isinstance(obj, tuple):
+        return sum(_nbytes(item) for item in obj)
+
+    # signals hold their values in a buffer
+    obj = getattr(obj, '_buffer', obj)
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+
+    return 0
+
+
+def enable(profiler=None):
+    '''
+    Enable profiling of instrumented operations.
+
+    Parameters
+    ----------
+    profiler : Profiler, optional
+        Profiler to record in. Defaults to a new profiler.
+
+    Returns
+    -------
+    profiler : Profiler
+        Active profiler.
+    '''
+
+    global _profiler
+
+    if profiler is None:
+        profiler = Profiler()
+
+    _profiler = profiler
+
+    return profiler
+
+
+def disable():
+    '''
+    Disable profiling of instrumented operations.
+    '''
+
+    global _profiler
+
+    _profiler = None
+
+
+def get_profiler():
+    '''
+    Get active profiler.
+
+    Returns
+    -------
+    Profiler or None
+        Active profiler, ``None`` if profiling is disabled.
+    '''
+
+    return _profiler
+
+
+@contextmanager
+def profile(profiler=None):
+    '''
+    Context manager enabling profiling of instrumented operations within its
+    block, restoring the previously active profiler afterwards.
+
+    Parameters
+    ----------
+    profiler : Profiler, optional
+        Profiler to record in. Defaults to a new profiler.
+
+    Yields
+    ------
+    profiler : Profiler
+        Active profiler.
+    '''
+
+    previous = _profiler
+    try:
+        yield enable(profiler)
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
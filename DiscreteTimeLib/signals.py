@@ -1,5 +1,19 @@
 import numpy as np
-import pandas as pd
+
+from DiscreteTimeLib.convolution import (
+    CONV_METHODS,
+    DIRECT_MAX_LENGTH,
+    convolve,
+)
+from DiscreteTimeLib import spectral
+from DiscreteTimeLib.profiling import profiled, span
+
+# number of samples compared at a time, so that comparisons of long signals
+# stop at the first mismatching block
+COMPARE_BLOCK_SIZE = 65536
+
+# supported normalizations of correlation
+XCORR_NORMALIZATIONS = (None, 'biased', 'unbiased', 'coeff')
 
 
 class DiscreteTimeSignal:
@@ -7,6 +21,11 @@ class DiscreteTimeSignal:
     Discrete-time signal object, implemented with digital signal processing
     functions.
 
+    Signal values are stored in a NumPy buffer, starting at the lowest given
+    index. Missing samples within the index range are stored as zero. Windows
+    and index transforms, such as :meth:`shift` or :meth:`reverse`, are views
+    sharing the buffer of the original signal.
+
     Parameters
     ----------
     data : array-like
@@ -33,12 +52,18 @@ class DiscreteTimeSignal:
     -3  -2.2
     -2  -1.0
     -1   1.5
-    0   2.0
-    1   3.3
-    2   5.0
-    5  12.0
+     0   2.0
+     1   3.3
+     2   5.0
+     3   0.0
+     4   0.0
+     5  12.0
     '''
 
+    # set NumPy array priority
+    __array_priority__ = 10000
+
+    @profiled('DiscreteTimeSignal.__init__')
     def __init__(self, data=(), dtype=np.float64):
         '''
         Initializer for discrete-time signal object.
@@ -61,33 +86,325 @@ class DiscreteTimeSignal:
         if data_shape[0] > 0 and (len(data_shape) < 2 or data_shape[1] != 2):
             raise ValueError('data must consist of key-value pairs')
 
-        # set NumPy array priority
-        self.__array_priority__ = 10000
-
-        # discrete signal indices
-        keys = np.zeros(data_shape[0], dtype=np.int64)
-        # discrete signal values
-        self.dtype = dtype
-        values = np.zeros(data_shape[0], dtype=self.dtype)
-        # lowest index with non-zero value
-        self.min_idx = float('inf')
-        # highest index with non-zero value
-        self.max_idx = float('-inf')
-
-        for n in range(data_shape[0]):
-            keys[n] = data[n][0]
-            values[n] = data[n][1]
-            self.min_idx = min(self.min_idx, data[n][0])
-            self.max_idx = max(self.max_idx, data[n][0])
-
-        # create dataframe with signal indices and values
-        self.signal = pd.DataFrame(
+        with span('DiscreteTimeSignal.__init__', 'parse') as s:
+            if data_shape[0] > 0:
+                pairs = np.asarray(data)
+                # discrete signal indices
+                keys = np.real(pairs[:, 0]).astype(np.int64)
+                # discrete signal values
+                values = pairs[:, 1].astype(dtype)
+            else:
+                keys = np.zeros(0, dtype=np.int64)
+                values = np.zeros(0, dtype=dtype)
+
+            s.allocated(keys)
+            s.allocated(values)
+
+        with span('DiscreteTimeSignal.__init__', 'materialize') as s:
+            # index of first sample in buffer and contiguous buffer of values
+            self._start, self._buffer = _buffer_from_arrays(keys, values)
+            s.allocated(self._buffer)
+
+        # array holding buffer, with spare capacity for in-place operations
+        # that expand the index range, and index of its first sample
+        self._storage = self._buffer
+        self._storage_start = self._start
+        # whether buffer may be used outside of signal
+        self._shared = False
+
+    @classmethod
+    def from_arrays(cls, keys, values, dtype=None):
+        '''
+        Create discrete-time signal object from array of indices and array of
+        corresponding values.
+
+        Keys need not be sorted. If keys are already sorted and consecutive,
+        and values are of the requested data type, the given values array is
+        used as the signal buffer without copying.
+
+        Parameters
+        ----------
+        keys : array-like
+            One-dimensional array of unique integer signal indices.
+
+        values : array-like
+            One-dimensional array of signal values, with the same length as
+            ``keys``.
+
+        dtype : numpy.dtype, optional
+            Data type of signal values. Defaults to data type of ``values``.
+
+        Returns
+        -------
+        sig : DiscreteTimeSignal
+            Discrete-time signal object.
+
+        Examples
+        --------
+        >>> x_n = DiscreteTimeSignal.from_arrays([2, 0, 1], [4.0, 1.5, -2.0])
+        >>> print(x_n)
+           x[n]
+        0   1.5
+        1  -2.0
+        2   4.0
+        '''
+
+        keys = np.asarray(keys)
+        values = np.asarray(values, dtype=dtype)
+
+        # raise error if keys or values are not one-dimensional
+        if keys.ndim != 1 or values.ndim != 1:
+            raise ValueError('keys and values must be one-dimensional')
+
+        # raise error if keys and values differ in length
+        if keys.shape[0] != values.shape[0]:
+            raise ValueError('keys and values must have the same length')
+
+        # raise error if keys are not integers
+        if not np.issubdtype(keys.dtype, np.integer):
+            int_keys = keys.astype(np.int64)
+            if not np.array_equal(int_keys, keys):
+                raise ValueError('keys must be integers')
+
+            keys = int_keys
+
+        start, buffer = _buffer_from_arrays(keys, values)
+        sig = cls._from_buffer(start, buffer, shared=True)
+
+        return sig
+
+    @classmethod
+    def from_dense(cls, start, values, dtype=None):
+        '''
+        Create discrete-time signal object from starting index and array of
+        consecutive values.
+
+        If ``values`` is a contiguous NumPy array of the requested data type,
+        it is used as the signal buffer without copying.
+
+        Parameters
+        ----------
+        start : int
+            Index of first value.
+
+        values : array-like
+            One-dimensional array of signal values, where ``values[i]`` is the
+            signal value at index ``start + i``.
+
+        dtype : numpy.dtype, optional
+            Data type of signal values. Defaults to data type of ``values``.
+
+        Returns
+        -------
+        sig : DiscreteTimeSignal
+            Discrete-time signal object.
+
+        Examples
+        --------
+        >>> x_n = DiscreteTimeSignal.from_dense(-1, [1.5, -2.0, 4.0])
+        >>> print(x_n)
+            x[n]
+        -1   1.5
+         0  -2.0
+         1   4.0
+        '''
+
+        values = np.asarray(values, dtype=dtype)
+
+        # raise error if values are not one-dimensional
+        if values.ndim != 1:
+            raise ValueError('values must be one-dimensional')
+
+        # raise error if start is not an integer
+        if int(start) != start:
+            raise ValueError('start must be an integer')
+
+        sig = cls._from_buffer(
+            int(start),
+            np.ascontiguousarray(values),
+            shared=True,
+        )
+
+        return sig
+
+    def _share(self):
+        '''
+        Mark buffer as shared with a view of this signal, so that it is copied
+        before being modified in place.
+
+        Buffers memory-mapped in ``'r+'`` mode are not marked, since in-place
+        operations on them are meant to write to file.
+        '''
+
+        storage = self._storage
+        if not isinstance(storage, np.memmap) or storage.mode != 'r+':
+            self._shared = True
+
+    @classmethod
+    def _from_buffer(cls, start, buffer, shared=False):
+        '''
+        Create discrete-time signal object directly from sample buffer,
+        without copying.
+
+        Parameters
+        ----------
+        start : int
+            Index of first sample in buffer.
+
+        buffer : numpy.ndarray
+            One-dimensional array of signal values.
+
+        shared : bool, optional
+            Whether buffer may be used outside of signal, for e.g. an array
+            given by the user, a memory-mapped file or a view of another
+            buffer. Shared buffers are copied before being modified in place.
+
+        Returns
+        -------
+        sig : DiscreteTimeSignal
+            Discrete-time signal backed by given buffer.
+        '''
+
+        sig = cls.__new__(cls)
+        sig._start = int(start) if buffer.shape[0] > 0 else 0
+        sig._buffer = buffer
+        sig._storage = buffer
+        sig._storage_start = sig._start
+        sig._shared = shared
+
+        return sig
+
+    @property
+    def dtype(self):
+        '''
+        Data type of signal values.
+
+        Returns
+        -------
+        numpy.dtype
+            Data type of signal values.
+        '''
+
+        return self._buffer.dtype
+
+    @property
+    def min_idx(self):
+        '''
+        Lowest index of signal, ``inf`` if signal is empty.
+
+        Returns
+        -------
+        int
+            Lowest index of signal.
+        '''
+
+        if self._buffer.shape[0] == 0:
+            return float('inf')
+
+        return self._start
+
+    @property
+    def max_idx(self):
+        '''
+        Highest index of signal, ``-inf`` if signal is empty.
+
+        Returns
+        -------
+        int
+            Highest index of signal.
+        '''
+
+        if self._buffer.shape[0] == 0:
+            return float('-inf')
+
+        return self._start + self._buffer.shape[0] - 1
+
+    @property
+    def signal(self):
+        '''
+        Signal data as pandas DataFrame.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe with signal indices and values.
+        '''
+
+        return self.to_dataframe()
+
+    def to_dataframe(self):
+        '''
+        Convert signal to pandas DataFrame.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe with signal indices and values.
+        '''
+
+        # import lazily to keep package import light
+        import pandas as pd
+
+        return pd.DataFrame(
             {
-                'x[n]': values,
+                'x[n]': self.values(),
             },
-            index=keys,
+            index=self.keys(),
         )
 
+    def save(self, path):
+        '''
+        Save signal to binary signal file, which can be loaded with
+        :meth:`load`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of file to write.
+        '''
+
+        # import lazily to avoid circular imports
+        from DiscreteTimeLib.io import save_signal
+
+        save_signal(self, path)
+
+    @classmethod
+    def load(cls, path, mmap=True, mode='r', n_range=None):
+        '''
+        Load signal from binary signal file, written by :meth:`save`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of file to read.
+
+        mmap : bool, optional
+            Whether to memory-map the sample buffer instead of reading it into
+            memory. Memory-mapped signals load instantly, and only the parts
+            of the file that are accessed are read.
+
+        mode : str, optional
+            Memory-map mode, one of ``'r'`` (read-only), ``'r+'`` (changes are
+            written to file) or ``'c'`` (changes are kept in memory only).
+            In ``'r+'`` mode, in-place operations such as ``+=`` write to file
+            as long as the index range and data type of the signal are
+            unchanged.
+
+        n_range : array-like, optional
+            Range of indices to load. For e.g. set ``n_range = [-1, 3]`` to
+            load from ``n = -1`` to ``n = 2`` inclusive.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            Loaded discrete-time signal.
+        '''
+
+        # import lazily to avoid circular imports
+        from DiscreteTimeLib.io import load_signal
+
+        return load_signal(path, mmap=mmap, mode=mode, n_range=n_range)
+
     def __str__(self):  # pragma: no cover
         '''
         String representation of object.
@@ -98,7 +415,7 @@ class DiscreteTimeSignal:
             String representation.
         '''
 
-        return str(self.signal)
+        return str(self.to_dataframe())
 
     def __len__(self):
         '''
@@ -110,30 +427,257 @@ class DiscreteTimeSignal:
             Length of signal.
         '''
 
-        return self.signal.shape[0]
+        return self._buffer.shape[0]
 
     def __getitem__(self, key):
         '''
-        Fetch signal value by index.
+        Fetch signal value by index, or window of signal by index slice.
 
         Parameters
         ----------
-        key : int
-            Index to fetch.
+        key : int or slice
+            Index to fetch, or slice of indices, for e.g. ``x_n[-2:3]`` for
+            the window from ``n = -2`` to ``n = 2`` inclusive. Omitted slice
+            bounds default to the index range of the signal.
 
         Returns
         -------
-        float
-            Value at index.
+        float or DiscreteTimeSignal
+            Value at index, or window of signal, see :meth:`window`.
         '''
 
-        # access value in dataframe using key
-        try:
-            return self.signal.loc[key]['x[n]']
-        # return 0 if key does not exist
-        except KeyError:
+        if isinstance(key, slice):
+            # raise error if slice has a step
+            if key.step is not None and key.step != 1:
+                raise ValueError('slice step must be 1')
+
+            start = self._start if key.start is None else key.start
+            stop = self._start + len(self) if key.stop is None else key.stop
+
+            return self.window(start, stop)
+
+        # position of key in buffer
+        offset = key - self._start
+
+        # return 0 if key is outside of buffer
+        if offset < 0 or offset >= self._buffer.shape[0]:
             return 0.0
 
+        return self._buffer[offset]
+
+    def window(self, start, stop):
+        '''
+        Fetch window of signal over index range, keeping original indices.
+
+        The window is a view sharing the buffer of this signal, so that no
+        values are copied. Both signals copy the shared buffer before they
+        are modified in place, so that changes to one never affect the other.
+        Signals loaded in ``'r+'`` mode are the exception, and keep writing
+        in-place changes to file, where their views see them too.
+
+        Parameters
+        ----------
+        start : int
+            First index of window.
+
+        stop : int
+            Index following last index of window.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            Window of signal, covering the part of the range within the index
+            range of this signal, values outside of which are zero.
+
+        Examples
+        --------
+        >>> x_n = DiscreteTimeSignal.from_dense(-2, [1.0, 2.0, 3.0, 4.0])
+        >>> print(x_n.window(-1, 1))
+            x[n]
+        -1   2.0
+         0   3.0
+        '''
+
+        # position of window in buffer, clipped to buffer
+        first = min(max(int(start) - self._start, 0), len(self))
+        last = max(min(int(stop) - self._start, len(self)), first)
+
+        if first == last:
+            return DiscreteTimeSignal()
+
+        # buffer is now shared between this signal and window
+        self._share()
+        window = DiscreteTimeSignal._from_buffer(
+            self._start + first,
+            self._buffer[first:last],
+            shared=True,
+        )
+
+        return window
+
+    def shift(self, k):
+        '''
+        Shift signal in time, computing ``y[n] = x[n - k]``.
+
+        The shifted signal is a view sharing the buffer of this signal, with
+        only its starting index changed.
+
+        Parameters
+        ----------
+        k : int
+            Number of samples to delay signal by, negative to advance it.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            Shifted discrete-time signal.
+
+        Examples
+        --------
+        >>> x_n = DiscreteTimeSignal.from_dense(0, [1.0, 2.0])
+        >>> print(x_n.shift(3))
+           x[n]
+        3   1.0
+        4   2.0
+        '''
+
+        # raise error if shift is not an integer
+        if int(k) != k:
+            raise ValueError('k must be an integer')
+
+        # buffer is now shared between this and shifted signal
+        self._share()
+        shifted_signal = DiscreteTimeSignal._from_buffer(
+            self._start + int(k),
+            self._buffer,
+            shared=True,
+        )
+
+        return shifted_signal
+
+    def reverse(self):
+        '''
+        Reverse signal in time, computing ``y[n] = x[-n]``.
+
+        The reversed signal is a view of the buffer of this signal with
+        negative stride.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            Time-reversed discrete-time signal.
+        '''
+
+        if len(self) == 0:
+            return DiscreteTimeSignal()
+
+        # buffer is now shared between this and reversed signal
+        self._share()
+        reversed_signal = DiscreteTimeSignal._from_buffer(
+            -self.max_idx,
+            self._buffer[::-1],
+            shared=True,
+        )
+
+        return reversed_signal
+
+    def downsample(self, M):
+        '''
+        Downsample signal by integer factor, computing ``y[n] = x[nM]``.
+
+        The downsampled signal is a strided view of the buffer of this
+        signal.
+
+        Parameters
+        ----------
+        M : int
+            Downsampling factor.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            Downsampled discrete-time signal.
+
+        Examples
+        --------
+        >>> x_n = DiscreteTimeSignal.from_dense(-3, np.arange(7.0))
+        >>> print(x_n.downsample(2))
+            x[n]
+        -1   1.0
+         0   3.0
+         1   5.0
+        '''
+
+        # raise error if factor is not a positive integer
+        if int(M) != M or M < 1:
+            raise ValueError('M must be a positive integer')
+
+        M = int(M)
+        if len(self) == 0:
+            return DiscreteTimeSignal()
+
+        # lowest index n for which nM is within signal
+        start = -(-self._start // M)
+        offset = start * M - self._start
+
+        # buffer is now shared between this and downsampled signal
+        self._share()
+        downsampled_signal = DiscreteTimeSignal._from_buffer(
+            start,
+            self._buffer[offset::M],
+            shared=True,
+        )
+
+        return downsampled_signal
+
+    def upsample(self, L):
+        '''
+        Upsample signal by integer factor, computing ``y[n] = x[n / L]`` when
+        ``n`` is a multiple of ``L``, and ``y[n] = 0`` otherwise.
+
+        Inserted zeros cannot be represented as a view of the buffer of this
+        signal, so the upsampled buffer is written with a single strided
+        copy.
+
+        Parameters
+        ----------
+        L : int
+            Upsampling factor.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            Upsampled discrete-time signal.
+
+        Examples
+        --------
+        >>> x_n = DiscreteTimeSignal.from_dense(1, [1.0, 2.0])
+        >>> print(x_n.upsample(3))
+           x[n]
+        3   1.0
+        4   0.0
+        5   0.0
+        6   2.0
+        '''
+
+        # raise error if factor is not a positive integer
+        if int(L) != L or L < 1:
+            raise ValueError('L must be a positive integer')
+
+        L = int(L)
+        if len(self) == 0:
+            return DiscreteTimeSignal()
+
+        values = np.zeros((len(self) - 1) * L + 1, dtype=self.dtype)
+        values[::L] = self._buffer
+
+        upsampled_signal = DiscreteTimeSignal._from_buffer(
+            self._start * L,
+            values,
+        )
+
+        return upsampled_signal
+
     def keys(self):
         '''
         Fetch all signal keys.
@@ -144,8 +688,9 @@ class DiscreteTimeSignal:
             Signal keys array.
         '''
 
-        return np.arange(self.min_idx, self.max_idx + 1)
+        return np.arange(self._start, self._start + self._buffer.shape[0])
 
+    @profiled('DiscreteTimeSignal.values')
     def values(self):
         '''
         Fetch all signal values.
@@ -156,52 +701,164 @@ class DiscreteTimeSignal:
             Signal values array.
         '''
 
-        # fill array with values
-        values = np.zeros(
-            self.max_idx - self.min_idx + 1,
-            dtype=self.dtype,
-        )
-        for n in range(self.min_idx, self.max_idx + 1):
-            values[n - self.min_idx] = self[n]
+        return self._buffer.copy()
 
-        return values
+    def _compare_blocks(self, sig, block_size):
+        '''
+        Iterate over aligned blocks of values of this and given discrete-time
+        signal, covering the combined index range of both signals.
 
-    def __eq__(self, sig):
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given discrete-time signal.
+
+        block_size : int
+            Number of samples per block.
+
+        Yields
+        ------
+        idx : int
+            Index of first sample of block.
+
+        x_block : numpy.ndarray
+            Values of this signal in block, zero outside its index range.
+
+        y_block : numpy.ndarray
+            Values of given signal in block, zero outside its index range.
         '''
-        Compare this and given discrete-time signal for equality.
+
+        # raise error if block size is not positive
+        if block_size < 1:
+            raise ValueError('block_size must be positive')
+
+        # combined index range of non-empty signals
+        ranges = [(s._start, s._start + len(s)) for s in (self, sig) if len(s)]
+        start = min((r[0] for r in ranges), default=0)
+        stop = max((r[1] for r in ranges), default=0)
+
+        for idx in range(start, stop, block_size):
+            block_stop = min(idx + block_size, stop)
+            x_block = _window(self, idx, block_stop)
+            y_block = _window(sig, idx, block_stop)
+
+            yield idx, x_block, y_block
+
+    def allclose(self, sig, rtol=1e-05, atol=1e-08, block_size=None):
+        '''
+        Check whether this and given discrete-time signal are equal within a
+        tolerance, at every index of their combined index range.
+
+        Values at each index are compared as in ``numpy.isclose``, so that
+        :math:`|x[n] - y[n]| \\leq atol + rtol |y[n]|`. Values are compared
+        block by block, stopping at the first block with a mismatch.
 
         Parameters
         ----------
         sig : DiscreteTimeSignal
             Given discrete-time signal.
 
+        rtol : float, optional
+            Relative tolerance.
+
+        atol : float, optional
+            Absolute tolerance.
+
+        block_size : int, optional
+            Number of samples compared at a time. Defaults to
+            ``COMPARE_BLOCK_SIZE``.
+
         Returns
         -------
         bool
-            Boolean value indicating equality.
+            Whether signals are equal within tolerance.
         '''
 
-        # get iterator range
-        if len(self) == 0:
-            if len(sig) == 0:
-                return True
-            else:
-                iter_min_idx = sig.min_idx
-                iter_max_idx = sig.max_idx
-        elif len(sig) == 0:
-            iter_min_idx = self.min_idx
-            iter_max_idx = self.max_idx
-        else:
-            iter_min_idx = min(self.min_idx, sig.min_idx)
-            iter_max_idx = max(self.max_idx, sig.max_idx)
+        if block_size is None:
+            block_size = COMPARE_BLOCK_SIZE
 
-        # iterate each index and test equality
-        for n in range(iter_min_idx, iter_max_idx + 1):
-            if not np.isclose(self[n], sig[n]):
+        for _, x_block, y_block in self._compare_blocks(sig, block_size):
+            if not np.all(np.isclose(x_block, y_block, rtol=rtol, atol=atol)):
                 return False
 
         return True
 
+    def compare(self, sig, rtol=1e-05, atol=1e-08, block_size=None):
+        '''
+        Compare this and given discrete-time signal within a tolerance,
+        reporting where and by how much they differ.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given discrete-time signal.
+
+        rtol : float, optional
+            Relative tolerance, see :meth:`allclose`.
+
+        atol : float, optional
+            Absolute tolerance, see :meth:`allclose`.
+
+        block_size : int, optional
+            Number of samples compared at a time. Defaults to
+            ``COMPARE_BLOCK_SIZE``.
+
+        Returns
+        -------
+        first_mismatch : int or None
+            Lowest index at which signals are not equal within tolerance,
+            ``None`` if signals are equal within tolerance.
+
+        max_deviation : float
+            Largest absolute difference between signals.
+
+        Examples
+        --------
+        >>> x_n = DiscreteTimeSignal.from_dense(0, [1.0, 2.0, 3.0])
+        >>> y_n = DiscreteTimeSignal.from_dense(1, [2.0, 3.5])
+        >>> x_n.compare(y_n)
+        (0, 1.0)
+        '''
+
+        if block_size is None:
+            block_size = COMPARE_BLOCK_SIZE
+
+        first_mismatch = None
+        max_deviation = 0.0
+        for idx, x_block, y_block in self._compare_blocks(sig, block_size):
+            deviation = np.abs(x_block - y_block)
+            max_deviation = max(max_deviation, float(np.max(deviation)))
+
+            if first_mismatch is None:
+                close = np.isclose(x_block, y_block, rtol=rtol, atol=atol)
+                if not np.all(close):
+                    first_mismatch = idx + int(np.argmin(close))
+
+        return first_mismatch, max_deviation
+
+    @profiled('DiscreteTimeSignal.__eq__')
+    def __eq__(self, sig):
+        '''
+        Compare this and given discrete-time signal for equality, within the
+        default tolerance of :meth:`allclose`.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given discrete-time signal.
+
+        Returns
+        -------
+        bool
+            Boolean value indicating equality.
+        '''
+
+        # defer to other signal types, for e.g. multichannel or sparse signals
+        if not isinstance(sig, DiscreteTimeSignal):
+            return NotImplemented
+
+        return self.allclose(sig)
+
     def __ne__(self, sig):
         '''
         Compare this and given discrete-time signal for inequality.
@@ -217,9 +874,93 @@ class DiscreteTimeSignal:
             Boolean value indicating inequality.
         '''
 
-        return not self.__eq__(sig)
+        is_equal = self.__eq__(sig)
+        if is_equal is NotImplemented:
+            return is_equal
+
+        return not is_equal
+
+    def _resize(self, start, stop, dtype, keep=True):
+        '''
+        Change index range and data type of signal buffer in place, reusing
+        spare capacity of its storage when possible.
+
+        Storage is reallocated only if it is too small, of a different data
+        type, read-only or shared. When the index range expands, storage is
+        reallocated with spare capacity on the expanding side, so that
+        repeated expansion takes amortized constant time per sample.
+
+        Parameters
+        ----------
+        start : int
+            First index of new range.
+
+        stop : int
+            Index following last index of new range.
+
+        dtype : numpy.dtype
+            Data type of new buffer.
+
+        keep : bool, optional
+            Whether to keep values within both the old and new range. All
+            other values of the new range are zero.
+        '''
 
-    def element_wise_operation(self, sig, op='add'):
+        old_start = self._start
+        old_stop = self._start + self._buffer.shape[0]
+        length = stop - start
+        storage_offset = start - self._storage_start
+
+        # whether storage can be modified and holds new range
+        reusable = not self._shared and self._storage.flags.writeable
+        reusable = reusable and self._storage.dtype == dtype
+        reusable = reusable and storage_offset >= 0
+        reusable = reusable and storage_offset + length <= len(self._storage)
+
+        if length == 0:
+            start = 0
+            buffer = np.zeros(0, dtype=dtype)
+            self._storage = buffer
+            self._storage_start = 0
+        elif reusable:
+            # reuse storage, zeroing values outside kept range
+            buffer = self._storage[storage_offset : storage_offset + length]
+            if keep:
+                kept_first = min(max(old_start, start), stop) - start
+                kept_last = max(min(old_stop, stop) - start, kept_first)
+                buffer[:kept_first] = 0
+                buffer[kept_last:] = 0
+            else:
+                buffer[:] = 0
+        else:
+            # spare capacity on expanding sides of range, and on sides where
+            # storage already had spare capacity
+            storage_stop = self._storage_start + len(self._storage)
+            expand_before = start < old_start or self._storage_start < start
+            expand_after = stop > old_stop or storage_stop > stop
+            spare_before = length // 2 if expand_before else 0
+            spare_after = length // 2 if expand_after else 0
+
+            self._storage = np.zeros(
+                spare_before + length + spare_after,
+                dtype=dtype,
+            )
+            self._storage_start = start - spare_before
+            buffer = self._storage[spare_before : spare_before + length]
+
+            if keep:
+                kept_first = min(max(old_start, start), stop)
+                kept_last = max(min(old_stop, stop), kept_first)
+                buffer[kept_first - start : kept_last - start] = self._buffer[
+                    kept_first - old_start : kept_last - old_start
+                ]
+
+        self._start = start
+        self._buffer = buffer
+        self._shared = False
+
+    @profiled('DiscreteTimeSignal.element_wise_operation')
+    def element_wise_operation(self, sig, op='add', out=None):
         '''
         Perform element-wise operation between this and given discrete-time
         signal objects.
@@ -232,15 +973,31 @@ class DiscreteTimeSignal:
         op : str
             Operation to perform ('add'/'sub')
 
+        out : DiscreteTimeSignal, optional
+            Signal to store result in, for e.g. this or the given signal. Its
+            buffer is reused when possible, and grows only when the index
+            range expands.
+
         Returns
         -------
         result_signal : DiscreteTimeSignal
-            Resulting discrete-time signal.
+            Resulting discrete-time signal, ``out`` if given.
         '''
 
-        # get iterator range
+        # raise error if operation is unknown
+        if op not in ('add', 'sub'):
+            err_msg = f'Unknown operation {op}. '
+            err_msg += 'Use \'add\' or \'sub\''
+            raise ValueError(err_msg)
+
+        # get resulting range
         if len(self) == 0:
             if len(sig) == 0:
+                if out is not None:
+                    out._resize(0, 0, np.result_type(self.dtype, sig.dtype))
+
+                    return out
+
                 empty_signal = DiscreteTimeSignal()
 
                 return empty_signal
@@ -254,22 +1011,116 @@ class DiscreteTimeSignal:
             result_min_idx = min(self.min_idx, sig.min_idx)
             result_max_idx = max(self.max_idx, sig.max_idx)
 
-        # iterate each index and record resulting values
-        data = ()
-        for n in range(result_min_idx, result_max_idx + 1):
+        if out is not None:
+            return self._element_wise_operation_out(
+                sig,
+                op,
+                out,
+                result_min_idx,
+                result_max_idx + 1,
+            )
+
+        with span('DiscreteTimeSignal.element_wise_operation', 'compute') as s:
+            values = np.zeros(
+                result_max_idx - result_min_idx + 1,
+                dtype=np.result_type(self.dtype, sig.dtype),
+            )
+            s.allocated(values)
+
+            # place values of this signal in resulting range
+            offset = self._start - result_min_idx
+            values[offset : offset + len(self)] = self._buffer
+
+            # add or subtract values of given signal in resulting range
+            offset = sig._start - result_min_idx
             if op == 'add':
-                data += ((n, self[n] + sig[n]),)
-            elif op == 'sub':
-                data += ((n, self[n] - sig[n]),)
-
-        # create new discrete-time signal object using data
-        result_signal = DiscreteTimeSignal(
-            data,
-            dtype=np.result_type(self.dtype, sig.dtype),
-        )
+                values[offset : offset + len(sig)] += sig._buffer
+            else:
+                values[offset : offset + len(sig)] -= sig._buffer
+
+        with span('DiscreteTimeSignal.element_wise_operation', 'wrap result'):
+            # create new discrete-time signal object using values
+            result_signal = DiscreteTimeSignal._from_buffer(
+                result_min_idx,
+                values,
+            )
 
         return result_signal
 
+    def _element_wise_operation_out(self, sig, op, out, start, stop):
+        '''
+        Perform element-wise operation between this and given discrete-time
+        signal objects, storing result in given signal.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given discrete-time signal.
+
+        op : str
+            Operation to perform ('add'/'sub')
+
+        out : DiscreteTimeSignal
+            Signal to store result in.
+
+        start : int
+            First index of resulting range.
+
+        stop : int
+            Index following last index of resulting range.
+
+        Returns
+        -------
+        out : DiscreteTimeSignal
+            Signal holding result.
+        '''
+
+        dtype = np.result_type(self.dtype, sig.dtype)
+
+        if out is self or out is sig:
+            # keep values of output signal and apply other signal on them
+            operand = sig if out is self else self
+            out._resize(start, stop, dtype)
+
+            # x - y is computed in y as -y + x
+            if out is not self and op == 'sub':
+                np.negative(out._buffer, out=out._buffer)
+
+            offset = operand._start - start
+            region = out._buffer[offset : offset + len(operand)]
+            if op == 'add' or out is not self:
+                np.add(region, operand._buffer, out=region)
+            else:
+                np.subtract(region, operand._buffer, out=region)
+
+            return out
+
+        # compute separately if output signal overlaps operands in memory
+        if np.may_share_memory(out._storage, self._buffer) or (
+            np.may_share_memory(out._storage, sig._buffer)
+        ):
+            result = self.element_wise_operation(sig, op)
+            out._resize(start, stop, dtype, keep=False)
+            out._buffer[:] = result._buffer
+
+            return out
+
+        out._resize(start, stop, dtype, keep=False)
+
+        # place values of this signal in resulting range
+        offset = self._start - start
+        out._buffer[offset : offset + len(self)] = self._buffer
+
+        # add or subtract values of given signal in resulting range
+        offset = sig._start - start
+        region = out._buffer[offset : offset + len(sig)]
+        if op == 'add':
+            np.add(region, sig._buffer, out=region)
+        else:
+            np.subtract(region, sig._buffer, out=region)
+
+        return out
+
     def __add__(self, sig):
         '''
         Add adjacent elements between this and given discrete-time signal
@@ -286,6 +1137,10 @@ class DiscreteTimeSignal:
             Summation discrete-time signal.
         '''
 
+        # defer to other signal types, for e.g. multichannel or sparse signals
+        if not isinstance(sig, DiscreteTimeSignal):
+            return NotImplemented
+
         return self.element_wise_operation(sig, op='add')
 
     def __sub__(self, sig):
@@ -304,9 +1159,58 @@ class DiscreteTimeSignal:
             Subtracted discrete-time signal.
         '''
 
+        # defer to other signal types, for e.g. multichannel or sparse signals
+        if not isinstance(sig, DiscreteTimeSignal):
+            return NotImplemented
+
         return self.element_wise_operation(sig, op='sub')
 
-    def scalar_mul(self, scalar):
+    def __iadd__(self, sig):
+        '''
+        Add adjacent elements of given discrete-time signal to this signal in
+        place.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given discrete-time signal.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            This signal.
+        '''
+
+        # defer to other signal types, for e.g. multichannel or sparse signals
+        if not isinstance(sig, DiscreteTimeSignal):
+            return NotImplemented
+
+        return self.element_wise_operation(sig, op='add', out=self)
+
+    def __isub__(self, sig):
+        '''
+        Subtract adjacent elements of given discrete-time signal from this
+        signal in place.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given discrete-time signal.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            This signal.
+        '''
+
+        # defer to other signal types, for e.g. multichannel or sparse signals
+        if not isinstance(sig, DiscreteTimeSignal):
+            return NotImplemented
+
+        return self.element_wise_operation(sig, op='sub', out=self)
+
+    @profiled('DiscreteTimeSignal.scalar_mul')
+    def scalar_mul(self, scalar, out=None):
         '''
         Compute scalar multiplication on signal.
 
@@ -315,25 +1219,53 @@ class DiscreteTimeSignal:
         scalar : int
             Given scalar value.
 
+        out : DiscreteTimeSignal, optional
+            Signal to store result in, for e.g. this signal. Its buffer is
+            reused when possible.
+
         Returns
         -------
         scaled_signal : DiscreteTimeSignal
-            Scaled discrete-time signal.
+            Scaled discrete-time signal, ``out`` if given.
         '''
 
-        data = ()
-        for n in range(self.min_idx, self.max_idx + 1):
-            data += ((n, self[n] * scalar),)
+        dtype = np.result_type(self.dtype, type(scalar))
 
-        # create new discrete-time signal object using data
-        scaled_signal = DiscreteTimeSignal(
-            data,
-            dtype=np.result_type(self.dtype, type(scalar)),
-        )
+        if out is self:
+            self._resize(self._start, self._start + len(self), dtype)
+            np.multiply(self._buffer, scalar, out=self._buffer)
+
+            return self
+
+        if out is not None:
+            # compute separately if output signal overlaps this signal
+            if np.may_share_memory(out._storage, self._buffer):
+                values = np.multiply(self._buffer, scalar, dtype=dtype)
+                out._resize(self._start, self._start + len(self), dtype)
+                out._buffer[:] = values
+
+                return out
+
+            out._resize(self._start, self._start + len(self), dtype, False)
+            np.multiply(self._buffer, scalar, out=out._buffer)
+
+            return out
+
+        with span('DiscreteTimeSignal.scalar_mul', 'compute') as s:
+            values = np.multiply(self._buffer, scalar, dtype=dtype)
+            s.allocated(values)
+
+        with span('DiscreteTimeSignal.scalar_mul', 'wrap result'):
+            # create new discrete-time signal object using values
+            scaled_signal = DiscreteTimeSignal._from_buffer(
+                self._start,
+                values,
+            )
 
         return scaled_signal
 
-    def conv(self, sig):
+    @profiled('DiscreteTimeSignal.conv')
+    def conv(self, sig, method='auto'):
         '''
         Compute discrete convolution between this and given discrete-time
         signal objects.
@@ -343,6 +1275,11 @@ class DiscreteTimeSignal:
         sig : DiscreteTimeSignal
             Given discrete-time signal.
 
+        method : str, optional
+            Convolution method, one of ``'auto'``, ``'direct'``, ``'fft'`` or
+            ``'overlap-add'``. ``'auto'`` chooses the method based on the
+            lengths of the signals.
+
         Returns
         -------
         conv_signal : DiscreteTimeSignal
@@ -356,23 +1293,250 @@ class DiscreteTimeSignal:
 
         # minimum value of n for convolution computation
         conv_min_idx = self.min_idx + sig.min_idx
-        # maximum value of n for convolution computation
-        conv_max_idx = self.max_idx + sig.max_idx
 
-        # compute convolution
-        conv = np.convolve(self.values(), sig.values())
+        with span('DiscreteTimeSignal.conv', 'compute') as s:
+            # compute convolution
+            conv = convolve(self._buffer, sig._buffer, method=method)
+            s.allocated(conv)
+
+        with span('DiscreteTimeSignal.conv', 'wrap result'):
+            # create new discrete-time signal object using values
+            conv_signal = DiscreteTimeSignal._from_buffer(conv_min_idx, conv)
+
+        return conv_signal
+
+    @profiled('DiscreteTimeSignal.xcorr')
+    def xcorr(self, sig, maxlag=None, normalization=None, method='auto'):
+        '''
+        Compute cross-correlation between this and given discrete-time signal
+        objects, ``r[l] = sum_n x[n + l] conj(y[n])``, indexed by lag ``l``.
+
+        Lags follow from the indices of both signals, so that a copy of a
+        signal delayed by ``k`` samples peaks at ``l = k``. Correlation is
+        computed with the convolution engine, which uses FFTs for long
+        signals.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given discrete-time signal.
+
+        maxlag : int, optional
+            Largest absolute lag to compute. Only the samples of this signal
+            within reach of these lags are used, and few lags are computed
+            directly.
+
+        normalization : str, optional
+            Normalization of correlation, one of ``'biased'`` (divided by
+            ``N``), ``'unbiased'`` (divided by ``N - |l|``) or ``'coeff'``
+            (divided by the square root of the product of signal energies,
+            so that the autocorrelation is 1 at lag 0), where ``N`` is the
+            length of the combined index range of both signals. Omitted for
+            no normalization.
+
+        method : str, optional
+            Convolution method, one of ``'auto'``, ``'direct'``, ``'fft'`` or
+            ``'overlap-add'``.
+
+        Returns
+        -------
+        xcorr_signal : DiscreteTimeSignal
+            Cross-correlation, indexed by lag.
+
+        Examples
+        --------
+        >>> x_n = DiscreteTimeSignal.from_dense(3, [1.0, 2.0, 1.0])
+        >>> y_n = DiscreteTimeSignal.from_dense(0, [1.0, 2.0, 1.0])
+        >>> r_l = x_n.xcorr(y_n, maxlag=4)
+        >>> int(r_l.keys()[np.argmax(r_l.values())])
+        3
+        '''
+
+        # raise error if normalization is unknown
+        if normalization not in XCORR_NORMALIZATIONS:
+            err_msg = f'Unknown normalization {normalization}. '
+            err_msg += f'Use one of {XCORR_NORMALIZATIONS}'
+            raise ValueError(err_msg)
+
+        # raise error if method is unknown
+        if method not in CONV_METHODS:
+            err_msg = f'Unknown convolution method {method}. '
+            err_msg += f'Use one of {CONV_METHODS}'
+            raise ValueError(err_msg)
+
+        # raise error if maximum lag is not a non-negative integer
+        if maxlag is not None and (int(maxlag) != maxlag or maxlag < 0):
+            raise ValueError('maxlag must be a non-negative integer')
+
+        if len(self) == 0 or len(sig) == 0:
+            empty_xcorr = DiscreteTimeSignal()
+
+            return empty_xcorr
+
+        # lags at which signals overlap, within maximum lag
+        lag_min = self._start - sig.max_idx
+        lag_max = self.max_idx - sig._start
+        if maxlag is not None:
+            lag_min = max(lag_min, -int(maxlag))
+            lag_max = min(lag_max, int(maxlag))
+
+            if lag_min > lag_max:
+                empty_xcorr = DiscreteTimeSignal()
+
+                return empty_xcorr
+
+        n_lags = lag_max - lag_min + 1
+
+        with span('DiscreteTimeSignal.xcorr', 'compute') as s:
+            if maxlag is None:
+                xcorr = convolve(
+                    self._buffer,
+                    np.conj(sig._buffer[::-1]),
+                    method=method,
+                )
+            else:
+                # values of this signal within reach of lags
+                segment = _window(
+                    self,
+                    sig._start + lag_min,
+                    sig._start + len(sig) + lag_max,
+                )
+
+                # correlate directly when few lags are needed
+                if method == 'direct' or (
+                    method == 'auto' and n_lags <= DIRECT_MAX_LENGTH
+                ):
+                    xcorr = np.correlate(segment, sig._buffer, 'valid')
+                else:
+                    xcorr = convolve(
+                        segment,
+                        np.conj(sig._buffer[::-1]),
+                        method=method,
+                    )[len(sig) - 1 : len(sig) - 1 + n_lags]
+
+            if normalization is not None:
+                xcorr = xcorr / _xcorr_scale(
+                    self,
+                    sig,
+                    normalization,
+                    lag_min,
+                    n_lags,
+                )
+            s.allocated(xcorr)
+
+        with span('DiscreteTimeSignal.xcorr', 'wrap result'):
+            # create new discrete-time signal object using values
+            xcorr_signal = DiscreteTimeSignal._from_buffer(lag_min, xcorr)
+
+        return xcorr_signal
+
+    def autocorr(self, maxlag=None, normalization=None, method='auto'):
+        '''
+        Compute autocorrelation of signal,
+        ``r[l] = sum_n x[n + l] conj(x[n])``, indexed by lag ``l``. See
+        :meth:`xcorr`.
+
+        Parameters
+        ----------
+        maxlag : int, optional
+            Largest absolute lag to compute.
+
+        normalization : str, optional
+            Normalization of correlation, one of ``'biased'``, ``'unbiased'``
+            or ``'coeff'``.
+
+        method : str, optional
+            Convolution method, one of ``'auto'``, ``'direct'``, ``'fft'`` or
+            ``'overlap-add'``.
 
-        # create new discrete-time signal object using data
-        data = ()
-        for n in range(conv_min_idx, conv_max_idx + 1):
-            data += ((n, conv[n - conv_min_idx]),)
+        Returns
+        -------
+        DiscreteTimeSignal
+            Autocorrelation, indexed by lag.
+        '''
 
-        conv_signal = DiscreteTimeSignal(
-            data,
-            dtype=np.result_type(self.dtype, sig.dtype),
+        return self.xcorr(
+            self,
+            maxlag=maxlag,
+            normalization=normalization,
+            method=method,
         )
 
-        return conv_signal
+    @profiled('DiscreteTimeSignal.spectrum')
+    def spectrum(self, n_fft=None, onesided=True):
+        '''
+        Compute spectrum of signal, sampling its discrete-time Fourier
+        transform at ``n_fft`` evenly spaced frequencies using an FFT, with
+        the phase corrected for the index of the first sample. See
+        :func:`~DiscreteTimeLib.spectral.spectrum`.
+
+        Parameters
+        ----------
+        n_fft : int, optional
+            Number of frequencies. Defaults to the length of the signal.
+
+        onesided : bool, optional
+            Whether to return only the non-negative frequencies of real
+            signals.
+
+        Returns
+        -------
+        X : numpy.ndarray
+            Spectrum of signal.
+
+        w : numpy.ndarray
+            Angular frequencies of spectrum.
+        '''
+
+        return spectral.spectrum(self, n_fft=n_fft, onesided=onesided)
+
+    def stft(
+        self,
+        window_length,
+        hop=None,
+        window='hann',
+        n_fft=None,
+        onesided=True,
+    ):
+        '''
+        Compute short-time Fourier transform of signal, lazily yielding the
+        spectrum of each frame. Frames are strided views of the signal
+        buffer. See :func:`~DiscreteTimeLib.spectral.stft`.
+
+        Parameters
+        ----------
+        window_length : int
+            Number of samples per frame.
+
+        hop : int, optional
+            Number of samples between starts of consecutive frames. Defaults
+            to half of the window length.
+
+        window : str or tuple or array-like or None, optional
+            Window applied on each frame.
+
+        n_fft : int, optional
+            Length of DFT of each frame. Defaults to the window length.
+
+        onesided : bool, optional
+            Whether to return only the non-negative frequencies of real
+            signals.
+
+        Returns
+        -------
+        generator
+            Generator yielding the index of the first sample of each frame and
+            the spectrum of the frame.
+        '''
+
+        return spectral.stft(
+            self,
+            window_length,
+            hop=hop,
+            window=window,
+            n_fft=n_fft,
+            onesided=onesided,
+        )
 
     def __mul__(self, param):
         '''
@@ -396,6 +1560,9 @@ class DiscreteTimeSignal:
         # convolution if discrete-time signal
         elif isinstance(param, DiscreteTimeSignal):
             return self.conv(param)
+        # defer to other signal types, for e.g. multichannel or sparse signals
+        elif _is_signal_type(param):
+            return NotImplemented
         # TypeError otherwise
         else:
             err_msg = f'Unknown type {type(param)}.'
@@ -421,3 +1588,199 @@ class DiscreteTimeSignal:
         '''
 
         return self.__mul__(param)
+
+    def __imul__(self, param):
+        '''
+        Compute scalar multiplication or discrete convolution in place,
+        depending on parameter type.
+
+        Scalar multiplication reuses the buffer of this signal. Convolution
+        computes a new buffer, which this signal then holds.
+
+        Parameters
+        ----------
+        param : float or DiscreteTimeSignal
+            Given scalar value or discrete-time signal.
+
+        Returns
+        -------
+        DiscreteTimeSignal
+            This signal.
+        '''
+
+        if np.isscalar(param):
+            return self.scalar_mul(param, out=self)
+        elif not isinstance(param, DiscreteTimeSignal):
+            return NotImplemented
+
+        conv_signal = self.conv(param)
+
+        self._start = conv_signal._start
+        self._buffer = conv_signal._buffer
+        self._storage = conv_signal._storage
+        self._storage_start = conv_signal._storage_start
+        self._shared = conv_signal._shared
+
+        return self
+
+
+def _buffer_from_arrays(keys, values):
+    '''
+    Build contiguous signal buffer from integer indices and corresponding
+    values.
+
+    Parameters
+    ----------
+    keys : numpy.ndarray
+        One-dimensional array of unique integer indices.
+
+    values : numpy.ndarray
+        One-dimensional array of values.
+
+    Returns
+    -------
+    start : int
+        Index of first value in buffer.
+
+    buffer : numpy.ndarray
+        Contiguous buffer of values, with missing indices stored as zero.
+    '''
+
+    if keys.shape[0] == 0:
+        return 0, values
+
+    steps = np.diff(keys)
+
+    # use values as buffer if keys are already consecutive
+    if np.all(steps == 1):
+        return int(keys[0]), np.ascontiguousarray(values)
+
+    # sort keys if they are not in increasing order
+    if not np.all(steps > 0):
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        values = values[order]
+
+        # raise error if keys have duplicates
+        if np.any(np.diff(keys) == 0):
+            raise ValueError('keys must be unique')
+
+    start = int(keys[0])
+    buffer = np.zeros(int(keys[-1]) - start + 1, dtype=values.dtype)
+    buffer[keys - start] = values
+
+    return start, buffer
+
+
+def _window(sig, start, stop):
+    '''
+    Fetch values of signal over index range, zero outside the index range of
+    the signal.
+
+    Parameters
+    ----------
+    sig : DiscreteTimeSignal
+        Given discrete-time signal.
+
+    start : int
+        First index of range.
+
+    stop : int
+        Index following last index of range.
+
+    Returns
+    -------
+    numpy.ndarray
+        Values over index range, a view of the signal buffer if the range is
+        within the index range of the signal.
+    '''
+
+    first = start - sig._start
+    last = stop - sig._start
+
+    # return view if range is within buffer
+    if first >= 0 and last <= sig._buffer.shape[0]:
+        return sig._buffer[first:last]
+
+    values = np.zeros(stop - start, dtype=sig.dtype)
+
+    # copy overlap of range and buffer
+    overlap_first = min(max(first, 0), sig._buffer.shape[0])
+    overlap_last = max(min(last, sig._buffer.shape[0]), overlap_first)
+    offset = overlap_first - first
+    values[offset : offset + overlap_last - overlap_first] = sig._buffer[
+        overlap_first:overlap_last
+    ]
+
+    return values
+
+
+def _xcorr_scale(x_n, y_n, normalization, lag_min, n_lags):
+    '''
+    Compute divisor of cross-correlation for given normalization.
+
+    Parameters
+    ----------
+    x_n, y_n : DiscreteTimeSignal
+        Correlated discrete-time signals, both non-empty.
+
+    normalization : str
+        Normalization, one of ``'biased'``, ``'unbiased'`` or ``'coeff'``.
+
+    lag_min : int
+        First lag of correlation.
+
+    n_lags : int
+        Number of lags of correlation.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        Divisor, per lag for ``'unbiased'`` normalization.
+    '''
+
+    # length of combined index range
+    length = max(x_n.max_idx, y_n.max_idx) - min(x_n.min_idx, y_n.min_idx) + 1
+
+    if normalization == 'biased':
+        return length
+
+    if normalization == 'unbiased':
+        lags = np.arange(lag_min, lag_min + n_lags)
+
+        return length - np.abs(lags)
+
+    energy = np.vdot(x_n._buffer, x_n._buffer).real
+    energy *= np.vdot(y_n._buffer, y_n._buffer).real
+
+    # raise error if either signal is zero
+    if energy == 0:
+        raise ValueError('coeff normalization requires non-zero signals')
+
+    return np.sqrt(energy)
+
+
+def _is_signal_type(obj):
+    '''
+    Check if object is a signal type that implements its own operations with
+    discrete-time signals.
+
+    Parameters
+    ----------
+    obj : object
+        Given object.
+
+    Returns
+    -------
+    bool
+        Whether object is such a signal type.
+    '''
+
+    # import lazily to avoid circular imports
+    from DiscreteTimeLib.multichannel import MultichannelDiscreteTimeSignal
+    from DiscreteTimeLib.sparse import SparseDiscreteTimeSignal
+
+    return isinstance(
+        obj,
+        (MultichannelDiscreteTimeSignal, SparseDiscreteTimeSignal),
+    )
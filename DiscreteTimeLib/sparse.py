@@ -0,0 +1,778 @@
+import numpy as np
+
+from DiscreteTimeLib.convolution import convolve
+from DiscreteTimeLib.signals import DiscreteTimeSignal
+
+# ratio of stored samples to index range above which results become dense
+DENSITY_THRESHOLD = 0.25
+# number of sample pairs multiplied at a time by sparse convolution, bounding
+# memory held by pair products
+CONV_BLOCK_PAIRS = 2**20
+
+
+class SparseDiscreteTimeSignal:
+    '''
+    Sparse discrete-time signal object, storing only explicitly given samples.
+
+    Indices and values are stored in sorted NumPy arrays, so that operations
+    take time proportional to the number of stored samples rather than the
+    index range. Results of operations whose density exceeds
+    ``DENSITY_THRESHOLD`` are returned as dense ``DiscreteTimeSignal``
+    objects.
+
+    Parameters
+    ----------
+    data : array-like
+        Two-dimensional array representing signal data.
+
+        For e.g., ``((0, 2), (10**9, 4))`` indicates ``x[0] = 2`` and
+        ``x[10**9] = 4``.
+
+    dtype : float, optional
+        Data type of signal values.
+
+    Examples
+    --------
+    >>> x_n = SparseDiscreteTimeSignal(((0, 2), (10**9, 4)))
+    >>> y_n = x_n * x_n
+    >>> y_n.keys()
+    array([         0, 1000000000, 2000000000])
+    >>> y_n.values()
+    array([ 4., 16., 16.])
+    '''
+
+    # set NumPy array priority
+    __array_priority__ = 10000
+
+    def __init__(self, data=(), dtype=np.float64):
+        '''
+        Initializer for sparse discrete-time signal object.
+
+        Parameters
+        ----------
+        data : array-like
+            Two-dimensional array representing signal data.
+
+        dtype : float, optional
+            Data type of signal values.
+        '''
+
+        data_shape = np.shape(data)
+
+        # raise error if data is not of shape (_, 2, ...)
+        if data_shape[0] > 0 and (len(data_shape) < 2 or data_shape[1] != 2):
+            raise ValueError('data must consist of key-value pairs')
+
+        if data_shape[0] > 0:
+            pairs = np.asarray(data)
+            keys = np.real(pairs[:, 0]).astype(np.int64)
+            values = pairs[:, 1].astype(dtype)
+        else:
+            keys = np.zeros(0, dtype=np.int64)
+            values = np.zeros(0, dtype=dtype)
+
+        # sorted indices and corresponding values of stored samples
+        self._keys, self._values = _sort_unique(keys, values)
+
+    @classmethod
+    def _from_sorted(cls, keys, values):
+        '''
+        Create sparse discrete-time signal object directly from sorted, unique
+        indices and corresponding values, without copying.
+
+        Parameters
+        ----------
+        keys : numpy.ndarray
+            Sorted array of unique indices.
+
+        values : numpy.ndarray
+            Array of corresponding values.
+
+        Returns
+        -------
+        sig : SparseDiscreteTimeSignal
+            Sparse discrete-time signal backed by given arrays.
+        '''
+
+        sig = cls.__new__(cls)
+        sig._keys = keys
+        sig._values = values
+
+        return sig
+
+    @classmethod
+    def from_arrays(cls, keys, values, dtype=None):
+        '''
+        Create sparse discrete-time signal object from array of indices and
+        array of corresponding values.
+
+        Parameters
+        ----------
+        keys : array-like
+            One-dimensional array of unique integer signal indices, in any
+            order.
+
+        values : array-like
+            One-dimensional array of signal values, with the same length as
+            ``keys``.
+
+        dtype : numpy.dtype, optional
+            Data type of signal values. Defaults to data type of ``values``.
+
+        Returns
+        -------
+        sig : SparseDiscreteTimeSignal
+            Sparse discrete-time signal object.
+        '''
+
+        keys = np.asarray(keys)
+        values = np.asarray(values, dtype=dtype)
+
+        # raise error if keys or values are not one-dimensional
+        if keys.ndim != 1 or values.ndim != 1:
+            raise ValueError('keys and values must be one-dimensional')
+
+        # raise error if keys and values differ in length
+        if keys.shape[0] != values.shape[0]:
+            raise ValueError('keys and values must have the same length')
+
+        # raise error if keys are not integers
+        int_keys = keys.astype(np.int64)
+        if not np.array_equal(int_keys, keys):
+            raise ValueError('keys must be integers')
+
+        sig = cls._from_sorted(*_sort_unique(int_keys, values))
+
+        return sig
+
+    @classmethod
+    def from_signal(cls, sig):
+        '''
+        Create sparse discrete-time signal object from non-zero samples of
+        given discrete-time signal.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal or SparseDiscreteTimeSignal
+            Given discrete-time signal.
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal
+            Sparse discrete-time signal.
+        '''
+
+        if isinstance(sig, SparseDiscreteTimeSignal):
+            return sig
+
+        # raise error if signal is not a single-channel signal
+        if not isinstance(sig, DiscreteTimeSignal):
+            err_msg = f'Unknown type {type(sig)}. '
+            err_msg += 'Use DiscreteTimeSignal or SparseDiscreteTimeSignal'
+            raise TypeError(err_msg)
+
+        # positions of non-zero values in buffer
+        nonzero = np.flatnonzero(sig._buffer)
+        sparse_sig = cls._from_sorted(
+            nonzero + sig._start,
+            sig._buffer[nonzero],
+        )
+
+        return sparse_sig
+
+    def to_dense(self):
+        '''
+        Convert to dense discrete-time signal.
+
+        Returns
+        -------
+        dense_sig : DiscreteTimeSignal
+            Dense discrete-time signal, with missing samples stored as zero.
+        '''
+
+        start = self._keys[0] if self.nnz > 0 else 0
+        buffer = np.zeros(len(self), dtype=self.dtype)
+        buffer[self._keys - start] = self._values
+
+        dense_sig = DiscreteTimeSignal._from_buffer(start, buffer)
+
+        return dense_sig
+
+    @property
+    def dtype(self):
+        '''
+        Data type of signal values.
+
+        Returns
+        -------
+        numpy.dtype
+            Data type of signal values.
+        '''
+
+        return self._values.dtype
+
+    @property
+    def nnz(self):
+        '''
+        Number of stored samples.
+
+        Returns
+        -------
+        int
+            Number of stored samples.
+        '''
+
+        return self._keys.shape[0]
+
+    @property
+    def density(self):
+        '''
+        Ratio of stored samples to length of index range.
+
+        Returns
+        -------
+        float
+            Density of signal, ``0`` if signal is empty.
+        '''
+
+        if self.nnz == 0:
+            return 0.0
+
+        return self.nnz / len(self)
+
+    @property
+    def min_idx(self):
+        '''
+        Lowest index of signal, ``inf`` if signal is empty.
+
+        Returns
+        -------
+        int
+            Lowest index of signal.
+        '''
+
+        if self.nnz == 0:
+            return float('inf')
+
+        return int(self._keys[0])
+
+    @property
+    def max_idx(self):
+        '''
+        Highest index of signal, ``-inf`` if signal is empty.
+
+        Returns
+        -------
+        int
+            Highest index of signal.
+        '''
+
+        if self.nnz == 0:
+            return float('-inf')
+
+        return int(self._keys[-1])
+
+    def to_dataframe(self):
+        '''
+        Convert stored samples to pandas DataFrame.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe with stored signal indices and values.
+        '''
+
+        # import lazily to keep package import light
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                'x[n]': self.values(),
+            },
+            index=self.keys(),
+        )
+
+    def __str__(self):  # pragma: no cover
+        '''
+        String representation of object.
+
+        Returns
+        -------
+        str
+            String representation.
+        '''
+
+        return str(self.to_dataframe())
+
+    def __len__(self):
+        '''
+        Get length of index range of signal.
+
+        Returns
+        -------
+        int
+            Length of signal.
+        '''
+
+        if self.nnz == 0:
+            return 0
+
+        return int(self._keys[-1] - self._keys[0]) + 1
+
+    def __getitem__(self, key):
+        '''
+        Fetch signal value by index.
+
+        Parameters
+        ----------
+        key : int
+            Index to fetch.
+
+        Returns
+        -------
+        float
+            Value at index.
+        '''
+
+        # position of key in sorted keys
+        pos = np.searchsorted(self._keys, key)
+
+        # return 0 if key is not stored
+        if pos == self.nnz or self._keys[pos] != key:
+            return 0.0
+
+        return self._values[pos]
+
+    def keys(self):
+        '''
+        Fetch indices of stored samples.
+
+        Returns
+        -------
+        numpy.ndarray
+            Sorted array of stored indices.
+        '''
+
+        return self._keys.copy()
+
+    def values(self):
+        '''
+        Fetch values of stored samples.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of stored values, corresponding to :meth:`keys`.
+        '''
+
+        return self._values.copy()
+
+    def __eq__(self, sig):
+        '''
+        Compare this and given signal for equality.
+
+        Parameters
+        ----------
+        sig : SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        bool
+            Boolean value indicating equality.
+        '''
+
+        # defer to other types, for e.g. multichannel signals
+        if not isinstance(sig, (DiscreteTimeSignal, SparseDiscreteTimeSignal)):
+            return NotImplemented
+
+        # compare as DiscreteTimeSignal.allclose, with relative tolerance
+        sig = SparseDiscreteTimeSignal.from_signal(sig)
+        _, values, sig_values = self._aligned_values(sig)
+
+        return bool(np.all(np.isclose(values, sig_values)))
+
+    def __ne__(self, sig):
+        '''
+        Compare this and given signal for inequality.
+
+        Parameters
+        ----------
+        sig : SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        bool
+            Boolean value indicating inequality.
+        '''
+
+        is_equal = self.__eq__(sig)
+        if is_equal is NotImplemented:
+            return is_equal
+
+        return not is_equal
+
+    def _aligned_values(self, sig):
+        '''
+        Place stored samples of this and given sparse signal on the union of
+        their indices, zero at indices not stored by a signal.
+
+        Parameters
+        ----------
+        sig : SparseDiscreteTimeSignal
+            Given sparse signal.
+
+        Returns
+        -------
+        keys : numpy.ndarray
+            Union of indices of both signals.
+
+        values : numpy.ndarray
+            Values of this signal at the indices.
+
+        sig_values : numpy.ndarray
+            Values of given signal at the indices.
+        '''
+
+        keys = np.union1d(self._keys, sig._keys)
+
+        values = np.zeros(keys.shape[0], dtype=self.dtype)
+        values[np.searchsorted(keys, self._keys)] = self._values
+
+        sig_values = np.zeros(keys.shape[0], dtype=sig.dtype)
+        sig_values[np.searchsorted(keys, sig._keys)] = sig._values
+
+        return keys, values, sig_values
+
+    def _merge(self, sig, op):
+        '''
+        Add or subtract stored samples of given sparse signal.
+
+        Parameters
+        ----------
+        sig : SparseDiscreteTimeSignal
+            Given sparse signal.
+
+        op : str
+            Operation to perform ('add'/'sub')
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal
+            Resulting sparse signal, storing the union of both signals'
+            indices.
+        '''
+
+        keys, values, sig_values = self._aligned_values(sig)
+        dtype = np.result_type(self.dtype, sig.dtype)
+        values = values.astype(dtype, copy=False)
+
+        if op == 'add':
+            values += sig_values
+        else:
+            values -= sig_values
+
+        return SparseDiscreteTimeSignal._from_sorted(keys, values)
+
+    def element_wise_operation(self, sig, op='add'):
+        '''
+        Perform element-wise operation between this and given signal.
+
+        Parameters
+        ----------
+        sig : SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        op : str
+            Operation to perform ('add'/'sub')
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Resulting signal, dense if its density exceeds
+            ``DENSITY_THRESHOLD``.
+        '''
+
+        # raise error if operation is unknown
+        if op not in ('add', 'sub'):
+            err_msg = f'Unknown operation {op}. '
+            err_msg += 'Use \'add\' or \'sub\''
+            raise ValueError(err_msg)
+
+        result = self._merge(SparseDiscreteTimeSignal.from_signal(sig), op)
+
+        return _densify(result)
+
+    def __add__(self, sig):
+        '''
+        Add adjacent elements between this and given signal.
+
+        Parameters
+        ----------
+        sig : SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Summation signal.
+        '''
+
+        return self.element_wise_operation(sig, op='add')
+
+    def __radd__(self, sig):
+        '''
+        Add adjacent elements between given signal and this signal (reverse
+        method).
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Summation signal.
+        '''
+
+        return self.element_wise_operation(sig, op='add')
+
+    def __sub__(self, sig):
+        '''
+        Subtract adjacent elements between this and given signal.
+
+        Parameters
+        ----------
+        sig : SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Subtracted signal.
+        '''
+
+        return self.element_wise_operation(sig, op='sub')
+
+    def __rsub__(self, sig):
+        '''
+        Subtract adjacent elements between given signal and this signal
+        (reverse method).
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal
+            Given signal.
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Subtracted signal.
+        '''
+
+        return self.scalar_mul(-1).element_wise_operation(sig, op='add')
+
+    def scalar_mul(self, scalar):
+        '''
+        Compute scalar multiplication on signal.
+
+        Parameters
+        ----------
+        scalar : int
+            Given scalar value.
+
+        Returns
+        -------
+        scaled_signal : SparseDiscreteTimeSignal
+            Scaled sparse signal.
+        '''
+
+        values = np.multiply(
+            self._values,
+            scalar,
+            dtype=np.result_type(self.dtype, type(scalar)),
+        )
+
+        scaled_signal = SparseDiscreteTimeSignal._from_sorted(
+            self._keys,
+            values,
+        )
+
+        return scaled_signal
+
+    def conv(self, sig, method='auto'):
+        '''
+        Compute discrete convolution between this and given signal.
+
+        Convolution is computed from the products of all pairs of stored
+        samples, in blocks of at most ``CONV_BLOCK_PAIRS`` pairs, unless
+        there are more pairs than samples in the resulting index range, in
+        which case both signals are converted to dense signals and convolved
+        using ``method``.
+
+        Parameters
+        ----------
+        sig : SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Given signal.
+
+        method : str, optional
+            Convolution method for dense convolution, one of ``'auto'``,
+            ``'direct'``, ``'fft'`` or ``'overlap-add'``.
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Discrete convolution signal, dense if its density exceeds
+            ``DENSITY_THRESHOLD``.
+        '''
+
+        sig = SparseDiscreteTimeSignal.from_signal(sig)
+
+        if self.nnz == 0 or sig.nnz == 0:
+            empty_conv = SparseDiscreteTimeSignal()
+
+            return empty_conv
+
+        # convolve densely if there are more pairs than resulting samples
+        if self.nnz * sig.nnz > len(self) + len(sig) - 1:
+            x_n = self.to_dense()
+            h_n = sig.to_dense()
+            conv = convolve(x_n._buffer, h_n._buffer, method=method)
+            conv_signal = DiscreteTimeSignal._from_buffer(
+                x_n.min_idx + h_n.min_idx,
+                conv,
+            )
+
+            return conv_signal
+
+        dtype = np.result_type(self.dtype, sig.dtype)
+        conv_signal = SparseDiscreteTimeSignal(dtype=dtype)
+
+        # multiply pairs of stored samples for blocks of this signal's
+        # samples, so that memory held by pairs stays bounded
+        block_size = max(CONV_BLOCK_PAIRS // sig.nnz, 1)
+        for first in range(0, self.nnz, block_size):
+            block = slice(first, first + block_size)
+
+            # indices and products of all pairs of stored samples in block
+            pair_keys = np.add.outer(self._keys[block], sig._keys).ravel()
+            pair_values = np.multiply.outer(
+                self._values[block],
+                sig._values,
+            ).ravel()
+
+            # sum products at equal indices
+            keys, inverse = np.unique(pair_keys, return_inverse=True)
+            values = np.zeros(keys.shape[0], dtype=dtype)
+            np.add.at(values, inverse.ravel(), pair_values)
+
+            block_conv = SparseDiscreteTimeSignal._from_sorted(keys, values)
+            conv_signal = conv_signal._merge(block_conv, 'add')
+
+        return _densify(conv_signal)
+
+    def __mul__(self, param):
+        '''
+        Compute scalar multiplication or discrete convolution, depending on
+        parameter type.
+
+        Parameters
+        ----------
+        param : float or SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Given scalar value or signal.
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Resulting signal.
+        '''
+
+        # scalar multiplication if scalar
+        if np.isscalar(param):
+            return self.scalar_mul(param)
+        # convolution if signal
+        elif isinstance(param, (DiscreteTimeSignal, SparseDiscreteTimeSignal)):
+            return self.conv(param)
+        # TypeError otherwise
+        else:
+            err_msg = f'Unknown type {type(param)}.'
+            err_msg += 'Use scalar for scalar multiplication '
+            err_msg += 'or signal object for convolution'
+
+            raise TypeError(err_msg)
+
+    def __rmul__(self, param):
+        '''
+        Compute scalar multiplication or discrete convolution, depending on
+        parameter type (reverse method).
+
+        Parameters
+        ----------
+        param : float or DiscreteTimeSignal
+            Given scalar value or signal.
+
+        Returns
+        -------
+        SparseDiscreteTimeSignal or DiscreteTimeSignal
+            Resulting signal.
+        '''
+
+        return self.__mul__(param)
+
+
+def _sort_unique(keys, values):
+    '''
+    Sort indices and corresponding values, checking that indices are unique.
+
+    Parameters
+    ----------
+    keys : numpy.ndarray
+        One-dimensional array of integer indices.
+
+    values : numpy.ndarray
+        One-dimensional array of values.
+
+    Returns
+    -------
+    keys : numpy.ndarray
+        Sorted indices.
+
+    values : numpy.ndarray
+        Corresponding values.
+    '''
+
+    # sort keys if they are not in increasing order
+    if np.any(np.diff(keys) <= 0):
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        values = values[order]
+
+        # raise error if keys have duplicates
+        if np.any(np.diff(keys) == 0):
+            raise ValueError('keys must be unique')
+
+    return keys, values
+
+
+def _densify(sig):
+    '''
+    Convert sparse signal to dense signal if its density exceeds
+    ``DENSITY_THRESHOLD``.
+
+    Parameters
+    ----------
+    sig : SparseDiscreteTimeSignal
+        Given sparse signal.
+
+    Returns
+    -------
+    SparseDiscreteTimeSignal or DiscreteTimeSignal
+        Given signal, or equivalent dense signal.
+    '''
+
+    if sig.density > DENSITY_THRESHOLD:
+        return sig.to_dense()
+
+    return sig
@@ -0,0 +1,325 @@
+import numpy as np
+
+# number of STFT frames transformed at a time, bounding memory held by
+# windowed frames
+STFT_BLOCK_SIZE = 256
+
+
+def frequencies(n_fft, onesided=False):
+    '''
+    Compute angular frequencies of DFT bins.
+
+    Parameters
+    ----------
+    n_fft : int
+        Length of DFT.
+
+    onesided : bool, optional
+        Whether to return only the non-negative frequencies of a one-sided
+        spectrum.
+
+    Returns
+    -------
+    w : numpy.ndarray
+        Angular frequency of each bin, ``w[k] = 2 * pi * k / n_fft``.
+    '''
+
+    n_bins = n_fft // 2 + 1 if onesided else n_fft
+
+    return 2 * np.pi * np.arange(n_bins) / n_fft
+
+
+def spectrum(sig, n_fft=None, onesided=True):
+    '''
+    Compute spectrum of discrete-time signal, sampling its discrete-time
+    Fourier transform :math:`X(e^{j \\omega}) = \\sum_n x[n] e^{-j \\omega n}`
+    at ``n_fft`` evenly spaced frequencies using an FFT.
+
+    The phase is corrected for the index of the first sample, so that the
+    spectrum of a signal starting at index ``n0`` is that of the same values
+    starting at ``n = 0`` times :math:`e^{-j \\omega n_0}`.
+
+    Parameters
+    ----------
+    sig : DiscreteTimeSignal
+        Given discrete-time signal.
+
+    n_fft : int, optional
+        Number of frequencies, with the signal zero-padded to this length.
+        Defaults to the length of the signal. Shorter lengths sample the
+        transform exactly, by wrapping the signal around.
+
+    onesided : bool, optional
+        Whether to return only the non-negative frequencies of real signals,
+        whose spectrum is conjugate symmetric.
+
+    Returns
+    -------
+    X : numpy.ndarray
+        Spectrum of signal.
+
+    w : numpy.ndarray
+        Angular frequencies of spectrum, ``w[k] = 2 * pi * k / n_fft``.
+
+    Examples
+    --------
+    >>> x_n = DiscreteTimeSignal.from_dense(1, [1.0, 0.0, 0.0, 0.0])
+    >>> X, w = spectrum(x_n, onesided=False)
+    >>> np.round(X, 6)
+    array([ 1.+0.j,  0.-1.j, -1.-0.j,  0.+1.j])
+    '''
+
+    if n_fft is None:
+        n_fft = max(len(sig), 1)
+
+    # raise error if FFT length is not positive
+    if int(n_fft) != n_fft or n_fft < 1:
+        raise ValueError('n_fft must be a positive integer')
+
+    n_fft = int(n_fft)
+    values = sig._buffer
+
+    # wrap values beyond FFT length, since the transform is sampled at
+    # multiples of 2 * pi / n_fft
+    if values.shape[0] > n_fft:
+        n_wraps = -(-values.shape[0] // n_fft)
+        wrapped = np.zeros(n_wraps * n_fft, dtype=values.dtype)
+        wrapped[: values.shape[0]] = values
+        values = wrapped.reshape(n_wraps, n_fft).sum(axis=0)
+
+    onesided = onesided and not np.iscomplexobj(values)
+    if onesided:
+        X = np.fft.rfft(values, n=n_fft)
+    else:
+        X = np.fft.fft(values, n=n_fft)
+
+    X *= _phase(sig._start, X.shape[-1], n_fft)
+
+    return X, frequencies(n_fft, onesided)
+
+
+def stft(
+    sig,
+    window_length,
+    hop=None,
+    window='hann',
+    n_fft=None,
+    onesided=True,
+    block_size=STFT_BLOCK_SIZE,
+):
+    '''
+    Compute short-time Fourier transform of discrete-time signal, yielding
+    the spectrum of each frame as it is computed.
+
+    Frames are strided views of the signal buffer, so that no frame is
+    copied before it is windowed, and frames are transformed in blocks of
+    ``block_size``, so that memory use does not grow with the length of the
+    signal. Long signals, for e.g. memory-mapped signals, are thus read as
+    frames are consumed.
+
+    Frames cover whole windows within the signal, starting at its first
+    index. As with :func:`spectrum`, the phase of each frame is corrected for
+    the index of its first sample.
+
+    Parameters
+    ----------
+    sig : DiscreteTimeSignal
+        Given discrete-time signal.
+
+    window_length : int
+        Number of samples per frame.
+
+    hop : int, optional
+        Number of samples between starts of consecutive frames. Defaults to
+        half of the window length.
+
+    window : str or tuple or array-like or None, optional
+        Window applied on each frame, either values of length
+        ``window_length``, a window name accepted by
+        ``scipy.signal.get_window``, or ``None`` for a rectangular window.
+
+    n_fft : int, optional
+        Length of DFT of each frame, with frames zero-padded to this length.
+        Defaults to the window length.
+
+    onesided : bool, optional
+        Whether to return only the non-negative frequencies of real signals.
+
+    block_size : int, optional
+        Number of frames transformed at a time.
+
+    Returns
+    -------
+    generator
+        Generator yielding the index of the first sample of each frame and
+        the spectrum of the frame, at the frequencies given by
+        :func:`frequencies`.
+
+    Examples
+    --------
+    >>> x_n = DiscreteTimeSignal.from_dense(0, np.ones(8))
+    >>> for n, X in stft(x_n, 4, window=None):
+    ...     print(n, np.round(np.abs(X), 6))
+    0 [4. 0. 0.]
+    2 [4. 0. 0.]
+    4 [4. 0. 0.]
+    '''
+
+    if hop is None:
+        hop = max(window_length // 2, 1)
+
+    if n_fft is None:
+        n_fft = window_length
+
+    # raise error if lengths are not positive integers
+    for name, length in (
+        ('window_length', window_length),
+        ('hop', hop),
+        ('n_fft', n_fft),
+        ('block_size', block_size),
+    ):
+        if int(length) != length or length < 1:
+            raise ValueError(f'{name} must be a positive integer')
+
+    # raise error if frames do not fit in DFT
+    if n_fft < window_length:
+        raise ValueError('n_fft must be at least window_length')
+
+    window_values = _window_values(window, int(window_length))
+
+    return _stft_frames(
+        sig,
+        window_values,
+        int(hop),
+        int(n_fft),
+        onesided,
+        int(block_size),
+    )
+
+
+def _window_values(window, window_length):
+    '''
+    Compute values of STFT window.
+
+    Parameters
+    ----------
+    window : str or tuple or array-like or None
+        Window, see :func:`stft`.
+
+    window_length : int
+        Number of samples per frame.
+
+    Returns
+    -------
+    numpy.ndarray
+        Window values.
+    '''
+
+    if window is None:
+        return np.ones(window_length)
+
+    if isinstance(window, (str, tuple)):
+        # import lazily to keep package import light
+        from scipy.signal import get_window
+
+        return get_window(window, window_length)
+
+    window = np.asarray(window)
+
+    # raise error if window does not match frame length
+    if window.shape != (window_length,):
+        err_msg = f'window must have shape ({window_length},), '
+        err_msg += f'got shape {window.shape}'
+        raise ValueError(err_msg)
+
+    return window
+
+
+def _stft_frames(sig, window, hop, n_fft, onesided, block_size):
+    '''
+    Yield spectra of STFT frames, see :func:`stft`.
+
+    Parameters
+    ----------
+    sig : DiscreteTimeSignal
+        Given discrete-time signal.
+
+    window : numpy.ndarray
+        Window values.
+
+    hop : int
+        Number of samples between starts of consecutive frames.
+
+    n_fft : int
+        Length of DFT of each frame.
+
+    onesided : bool
+        Whether to return only non-negative frequencies of real signals.
+
+    block_size : int
+        Number of frames transformed at a time.
+
+    Yields
+    ------
+    n : int
+        Index of first sample of frame.
+
+    X : numpy.ndarray
+        Spectrum of frame.
+    '''
+
+    if len(sig) < window.shape[0]:
+        return
+
+    # frames as strided views of signal buffer
+    frames = np.lib.stride_tricks.sliding_window_view(
+        sig._buffer,
+        window.shape[0],
+    )[::hop]
+
+    onesided = onesided and not np.iscomplexobj(sig._buffer)
+    onesided = onesided and not np.iscomplexobj(window)
+    n_bins = n_fft // 2 + 1 if onesided else n_fft
+
+    for first in range(0, frames.shape[0], block_size):
+        block = frames[first : first + block_size] * window
+        if onesided:
+            X = np.fft.rfft(block, n=n_fft, axis=-1)
+        else:
+            X = np.fft.fft(block, n=n_fft, axis=-1)
+
+        # correct phase of each frame for index of its first sample
+        starts = sig._start + hop * np.arange(first, first + block.shape[0])
+        X *= _phase(starts[:, np.newaxis], n_bins, n_fft)
+
+        yield from zip(starts.tolist(), X)
+
+
+def _phase(start, n_bins, n_fft):
+    '''
+    Compute phase correction :math:`e^{-j \\omega_k n_0}` of DFT bins for
+    first index ``n0``.
+
+    Parameters
+    ----------
+    start : int or numpy.ndarray
+        First index, or column of first indices.
+
+    n_bins : int
+        Number of bins.
+
+    n_fft : int
+        Length of DFT.
+
+    Returns
+    -------
+    numpy.ndarray
+        Phase correction of each bin.
+    '''
+
+    # reduce product of bin and index modulo FFT length, keeping the phase
+    # exact for large indices
+    k = np.arange(n_bins)
+    turns = (k * (np.asarray(start) % n_fft)) % n_fft
+
+    return np.exp(-2j * np.pi * turns / n_fft)
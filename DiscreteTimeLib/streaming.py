@@ -0,0 +1,160 @@
+import numpy as np
+
+from DiscreteTimeLib.signals import DiscreteTimeSignal
+
+
+class StreamingFilter:
+    '''
+    Stateful digital filter, used to apply a discrete-time system on a signal
+    that arrives in successive chunks.
+
+    The filter state is carried from one chunk to the next, so that the
+    concatenated output is identical to filtering the concatenated input in a
+    single pass.
+
+    Parameters
+    ----------
+    system : DiscreteTimeSystem
+        Discrete-time system to apply.
+
+    Examples
+    --------
+    >>> H = DiscreteTimeSystem((1,), (1, -0.5))
+    >>> stream = H.stream()
+    >>> stream.process(np.ones(3))
+    array([1.  , 1.5 , 1.75])
+    >>> stream.process(np.ones(2))
+    array([1.875 , 1.9375])
+    '''
+
+    def __init__(self, system):
+        '''
+        Initializer for streaming filter object.
+
+        Parameters
+        ----------
+        system : DiscreteTimeSystem
+            Discrete-time system to apply.
+        '''
+
+        self.b = system.b
+        self.a = system.a
+        self.sos = system.sos
+        self.reset()
+
+    def reset(self):
+        '''
+        Reset filter state, as if no chunks have been processed.
+        '''
+
+        # filter delay values, created on first chunk, of shape
+        # (n_sections, 2) when filtering using second-order sections
+        self.zi = None
+        # index expected at start of next signal chunk
+        self.next_idx = None
+
+    def process_values(self, values):
+        '''
+        Apply filter on next chunk of values.
+
+        Parameters
+        ----------
+        values : array-like
+            One-dimensional array of input values.
+
+        Returns
+        -------
+        y_values : numpy.ndarray
+            Filtered values.
+        '''
+
+        values = np.asarray(values)
+
+        # raise error if values are not one-dimensional
+        if values.ndim != 1:
+            raise ValueError('chunk values must be one-dimensional')
+
+        # leave state untouched for empty chunks, with same data type as
+        # filtered values, so that concatenated output is independent of
+        # chunking
+        dtype = np.result_type(self.b, self.a, values, np.float64)
+        if values.shape[0] == 0:
+            return np.zeros(0, dtype=dtype)
+
+        if self.zi is None:
+            # initialize filter at rest
+            if self.sos is not None:
+                zi_shape = (self.sos.shape[0], 2)
+            else:
+                zi_shape = max(self.b.shape[0], self.a.shape[0]) - 1
+            self.zi = np.zeros(zi_shape, dtype=dtype)
+        elif self.zi.dtype != dtype:
+            # promote state, for e.g. when a complex chunk arrives
+            self.zi = self.zi.astype(np.result_type(self.zi, dtype))
+
+        # import lazily to keep package import light
+        from scipy.signal import lfilter, sosfilt
+
+        if self.sos is not None:
+            y_values, self.zi = sosfilt(self.sos, values, zi=self.zi)
+        else:
+            y_values, self.zi = lfilter(self.b, self.a, values, zi=self.zi)
+
+        if self.next_idx is not None:
+            self.next_idx += values.shape[0]
+
+        return y_values
+
+    def process(self, chunk):
+        '''
+        Apply filter on next chunk of input.
+
+        Parameters
+        ----------
+        chunk : DiscreteTimeSignal or array-like
+            Next chunk of input. Signal chunks must start at the index
+            following the end of the previous signal chunk.
+
+        Returns
+        -------
+        DiscreteTimeSignal or numpy.ndarray
+            Filtered chunk, of the same type as the given chunk.
+        '''
+
+        if not isinstance(chunk, DiscreteTimeSignal):
+            return self.process_values(chunk)
+
+        if len(chunk) == 0:
+            empty_signal = DiscreteTimeSignal()
+
+            return empty_signal
+
+        # raise error if chunk is not contiguous with previous chunk
+        if self.next_idx is not None and chunk.min_idx != self.next_idx:
+            err_msg = f'Expected chunk starting at index {self.next_idx}, '
+            err_msg += f'got chunk starting at index {chunk.min_idx}'
+            raise ValueError(err_msg)
+
+        self.next_idx = chunk.min_idx
+        y_values = self.process_values(chunk._buffer)
+
+        y_n = DiscreteTimeSignal.from_dense(chunk.min_idx, y_values)
+
+        return y_n
+
+    def __call__(self, chunk):
+        '''
+        Apply filter on next chunk of input.
+
+        Parameters
+        ----------
+        chunk : DiscreteTimeSignal or array-like
+            Next chunk of input.
+
+        Returns
+        -------
+        DiscreteTimeSignal or numpy.ndarray
+            Filtered chunk, of the same type as the given chunk.
+        '''
+
+        return self.process(chunk)
@@ -1,8 +1,11 @@
+import warnings
+
 import numpy as np
-from scipy.signal import lfilter, residuez
-from sympy import Symbol, Heaviside, KroneckerDelta
 
+from DiscreteTimeLib.caching import array_key, get_response_cache
+from DiscreteTimeLib.profiling import profiled, span
 from DiscreteTimeLib.signals import DiscreteTimeSignal
+from DiscreteTimeLib.streaming import StreamingFilter
 
 
 class DiscreteTimeSystem:
@@ -17,6 +20,15 @@ class DiscreteTimeSystem:
         \\frac{b_0 + b_1 z^{-1} + ... + b_n z^{-n}}
         {a_0 + a_1 z^{-1} + ... + a_m z^{-m}}
 
+    Systems created using :meth:`from_sos` also keep the transfer function as
+    cascaded second-order sections in attribute ``sos``, and use the sections
+    to filter and evaluate, which is numerically stable for high-order
+    filters.
+
+    Systems are composed in series using ``*``, in parallel using ``+`` and
+    in a feedback loop using :meth:`feedback`. The composite system filters
+    in a single pass, without computing intermediate signals.
+
     Parameters
     ----------
     b : array-like
@@ -72,71 +84,740 @@ class DiscreteTimeSystem:
         # save numerator and denominator coefficients
         self.b = np.array(b)
         self.a = np.array(a)
+        # second-order sections, set by from_sos
+        self.sos = None
+
+        # values derived from coefficients, cached until coefficients change
+        self._cache = {}
+        self._cache_key = None
+
+    @classmethod
+    def from_sos(cls, sos):
+        '''
+        Create discrete-time system from cascaded second-order sections.
+
+        Each row of ``sos`` holds the numerator coefficients
+        :math:`b_0, b_1, b_2` followed by the denominator coefficients
+        :math:`a_0, a_1, a_2` of one section, and the transfer function of the
+        system is the product of the sections.
+
+        Parameters
+        ----------
+        sos : array-like
+            Two-dimensional array-like of shape ``(n_sections, 6)``.
+
+        Returns
+        -------
+        system : DiscreteTimeSystem
+            Discrete-time system that filters using the given sections.
+
+        Examples
+        --------
+        >>> H = DiscreteTimeSystem.from_sos([[1, 1, 0, 1, -0.5, 0]])
+        >>> H.b, H.a
+        (array([1., 1., 0.]), array([ 1. , -0.5,  0. ]))
+        '''
+
+        sos = np.array(sos)
+
+        # raise error if sos shape is not (n_sections, 6)
+        if sos.ndim != 2 or sos.shape[0] < 1 or sos.shape[1] != 6:
+            err_msg = 'Second-order sections sos, '
+            err_msg += 'must be of shape (n_sections, 6)'
+            raise ValueError(err_msg)
+
+        # raise error if any section has a zero leading denominator
+        if np.any(sos[:, 3] == 0):
+            err_msg = 'Second-order sections sos, '
+            err_msg += 'must have non-zero leading denominator coefficients'
+            raise ValueError(err_msg)
+
+        # normalize sections so that leading denominator coefficient is 1
+        sos = sos / sos[:, 3:4]
+
+        # multiply out sections into transfer function polynomials
+        b = np.ones(1, dtype=sos.dtype)
+        a = np.ones(1, dtype=sos.dtype)
+        for section in sos:
+            b = np.convolve(b, section[:3])
+            a = np.convolve(a, section[3:])
+
+        system = cls(b, a)
+        system.sos = sos
+
+        return system
+
+    def to_sos(self):
+        '''
+        Convert transfer function of system into cascaded second-order
+        sections.
+
+        The sections are computed once and cached until the coefficients of
+        the system change. Systems created using :meth:`from_sos` return
+        their own sections.
+
+        Returns
+        -------
+        sos : numpy.ndarray
+            Array of shape ``(n_sections, 6)``, see :meth:`from_sos`.
+        '''
+
+        if self.sos is not None:
+            return self.sos
+
+        return self._cached('sos', self._to_sos)
+
+    def _to_sos(self):
+        '''
+        Convert transfer function of system into second-order sections,
+        without caching.
+
+        Returns
+        -------
+        sos : numpy.ndarray
+            Second-order sections.
+        '''
+
+        return _zpk_to_sos(*_zpk(self.b, self.a))
+
+    def _cached(self, name, compute):
+        '''
+        Fetch value derived from system coefficients, computing and caching it
+        if it has not been computed for the current coefficients.
+
+        Parameters
+        ----------
+        name : str
+            Name of cached value.
+
+        compute : callable
+            Function with no arguments that computes the value.
+
+        Returns
+        -------
+        object
+            Cached value.
+        '''
+
+        # invalidate cache if coefficients have changed
+        key = (
+            self.b.dtype.str,
+            self.b.tobytes(),
+            self.a.dtype.str,
+            self.a.tobytes(),
+        )
+        if key != self._cache_key:
+            self._cache = {}
+            self._cache_key = key
+
+        if name not in self._cache:
+            self._cache[name] = compute()
+
+        return self._cache[name]
+
+    @profiled('DiscreteTimeSystem.eval')
+    def eval(self, z, dtype=np.clongdouble):
+        '''
+        Evaluate filter at given input values.
+
+        Parameters
+        ----------
+        z : complex or array-like
+            Given input value or array of input values.
+
+        dtype : numpy.dtype, optional
+            Complex data type used for computation, for e.g.
+            ``numpy.complex128`` for faster, double-precision evaluation.
+
+        Returns
+        -------
+        val : numpy.clongdouble or numpy.ndarray
+            Computed output value, or array of output values.
+
+        Notes
+        -----
+        If a :class:`~DiscreteTimeLib.caching.ResponseCache` is active,
+        arrays of output values are cached in it, keyed by a content hash of
+        the coefficients and input values.
+        '''
+
+        # raise error if dtype is not complex
+        if np.dtype(dtype).kind != 'c':
+            raise ValueError('dtype must be a complex data type')
 
-    def eval(self, z):
+        cache = get_response_cache()
+        if cache is None or np.ndim(z) == 0:
+            return self._eval(z, dtype)
+
+        z = np.asarray(z)
+        params = ('eval', np.dtype(dtype).str, array_key(z))
+
+        return cache.get(self, params, lambda: self._eval(z, dtype))
+
+    def _eval(self, z, dtype):
         '''
-        Evaluate filter at given input value.
+        Evaluate filter at given input values, without caching.
 
         Parameters
         ----------
-        z : numpy.clongdouble
-            Given input value.
+        z : complex or array-like
+            Given input value or array of input values.
+
+        dtype : numpy.dtype
+            Complex data type used for computation.
 
         Returns
         -------
-        val : numpy.clongdouble
-            Conputed output value.
+        val : numpy.clongdouble or numpy.ndarray
+            Computed output value, or array of output values.
         '''
 
-        # sum numerator values
-        numerator = np.clongdouble(0)
-        for i, b_i in enumerate(self.b):
-            numerator += b_i * (z ** (-i))
+        z_inv = 1 / np.asarray(z, dtype=dtype)
 
-        # sum denominator values
-        denominator = np.clongdouble(0)
-        for i, a_i in enumerate(self.a):
-            denominator += a_i * (z ** (-i))
+        if self.sos is not None:
+            # multiply responses of sections
+            val = np.ones(z_inv.shape, dtype=dtype)
+            for section in self.sos.astype(dtype):
+                numerator = np.polyval(section[2::-1], z_inv)
+                denominator = np.polyval(section[:2:-1], z_inv)
+                val *= numerator / denominator
+
+            return val[()]
+
+        # evaluate polynomials in z^-1 using Horner's method
+        numerator = np.polyval(self.b[::-1].astype(dtype), z_inv)
+        denominator = np.polyval(self.a[::-1].astype(dtype), z_inv)
 
         val = numerator / denominator
 
-        return val
+        return val[()]
+
+    def cascade(self, system):
+        '''
+        Compose this and given discrete-time system in series, so that the
+        output of this system is the input of the given system.
+
+        The composite transfer function is the product of the transfer
+        functions, so that filtering through it takes a single pass. If
+        either system has second-order sections, the sections of both
+        systems are stacked, see :meth:`to_sos`.
+
+        Parameters
+        ----------
+        system : DiscreteTimeSystem
+            Given discrete-time system.
+
+        Returns
+        -------
+        composite : DiscreteTimeSystem
+            Cascaded discrete-time system.
+        '''
+
+        # stack sections if either system has them, keeping high orders
+        # numerically stable
+        if self.sos is not None or system.sos is not None:
+            composite = DiscreteTimeSystem.from_sos(
+                np.concatenate((self.to_sos(), system.to_sos()))
+            )
+
+            return composite
+
+        composite = DiscreteTimeSystem(
+            np.convolve(self.b, system.b),
+            np.convolve(self.a, system.a),
+        )
+
+        return composite
+
+    def parallel(self, system):
+        '''
+        Compose this and given discrete-time system in parallel, so that both
+        systems receive the same input and their outputs are added.
+
+        If either system has second-order sections, the composite system is
+        built from the poles and zeros of both systems and has second-order
+        sections too. Poles of both systems are kept as they are, so that
+        only the zeros of the sum are computed from a polynomial. A
+        ``RuntimeWarning`` is issued if the sections of the composite system
+        do not reproduce the frequency response of the sum.
+
+        Parameters
+        ----------
+        system : DiscreteTimeSystem
+            Given discrete-time system.
+
+        Returns
+        -------
+        composite : DiscreteTimeSystem
+            Parallel discrete-time system.
+        '''
+
+        if self.sos is not None or system.sos is not None:
+            zpk = _parallel_zpk(_system_zpk(self), _system_zpk(system))
+            response = self.eval(_CHECK_Z, dtype=np.complex128)
+            response += system.eval(_CHECK_Z, dtype=np.complex128)
+
+            return _checked_from_sos(_zpk_to_sos(*zpk), response)
+
+        # add numerators directly if denominators are equal
+        if np.array_equal(self.a, system.a):
+            composite = DiscreteTimeSystem(
+                _poly_add(self.b, system.b),
+                self.a,
+            )
+
+            return composite
+
+        composite = DiscreteTimeSystem(
+            _poly_add(
+                np.convolve(self.b, system.a),
+                np.convolve(system.b, self.a),
+            ),
+            np.convolve(self.a, system.a),
+        )
+
+        return composite
+
+    def feedback(self, system=None, sign=-1):
+        '''
+        Close feedback loop around this system, with given discrete-time
+        system in the feedback path.
+
+        .. math::
+            T(z) = \\frac{H(z)}{1 - s H(z) G(z)}
+
+        If either system has second-order sections, the closed-loop system is
+        built from the poles and zeros of both systems and has second-order
+        sections too, with its poles computed from the closed-loop
+        denominator. A ``RuntimeWarning`` is issued if the sections do not
+        reproduce the closed-loop frequency response, as for high-order
+        loops whose poles cannot be computed accurately.
+
+        Parameters
+        ----------
+        system : DiscreteTimeSystem, optional
+            Discrete-time system in feedback path. Defaults to unity feedback.
+
+        sign : int, optional
+            Sign with which feedback is added to input, ``-1`` for negative
+            feedback and ``1`` for positive feedback.
+
+        Returns
+        -------
+        composite : DiscreteTimeSystem
+            Closed-loop discrete-time system.
+        '''
+
+        # raise error if sign is not -1 or 1
+        if sign not in (-1, 1):
+            raise ValueError('sign must be -1 or 1')
+
+        if system is None:
+            system = DiscreteTimeSystem((1,), (1,))
+
+        use_sos = self.sos is not None or system.sos is not None
+        if use_sos:
+            # closed-loop denominator over poles and zeros of both systems,
+            # instead of over products of high-order polynomials
+            zeros, poles, gain, delay = _system_zpk(self)
+            g_zeros, g_poles, g_gain, g_delay = _system_zpk(system)
+
+            loop = np.convolve(np.poly(zeros), np.poly(g_zeros))
+            loop = np.pad(loop, (delay + g_delay, 0))
+            a = _poly_add(
+                np.convolve(np.poly(poles), np.poly(g_poles)),
+                -sign * gain * g_gain * loop,
+            )
+        else:
+            b = np.convolve(self.b, system.a)
+            a = _poly_add(
+                np.convolve(self.a, system.a),
+                -sign * np.convolve(self.b, system.b),
+            )
+
+        # raise error if loop has no delay, for e.g. unity gain in unity
+        # positive feedback
+        if a[0] == 0:
+            err_msg = 'Feedback loop is not realizable, '
+            err_msg += 'leading denominator coefficient is zero'
+            raise ValueError(err_msg)
+
+        if use_sos:
+            closed_poles, a_gain, _ = _poly_roots(np.real_if_close(a))
+            sos = _zpk_to_sos(
+                np.concatenate((zeros, g_poles)),
+                closed_poles,
+                gain / a_gain,
+                delay,
+            )
+
+            response = self.eval(_CHECK_Z, dtype=np.complex128)
+            loop = response * system.eval(_CHECK_Z, dtype=np.complex128)
+            response /= 1 - sign * loop
 
+            return _checked_from_sos(sos, response)
+
+        composite = DiscreteTimeSystem(b, a)
+
+        return composite
+
+    def __mul__(self, param):
+        '''
+        Compose systems in series or scale system by gain, depending on
+        parameter type.
+
+        Parameters
+        ----------
+        param : float or DiscreteTimeSystem
+            Given gain or discrete-time system.
+
+        Returns
+        -------
+        DiscreteTimeSystem
+            Resulting discrete-time system.
+        '''
+
+        # scale numerator if scalar
+        if np.isscalar(param):
+            if self.sos is not None:
+                sos = self.sos.copy()
+                sos[0, :3] = sos[0, :3] * param
+
+                return DiscreteTimeSystem.from_sos(sos)
+
+            return DiscreteTimeSystem(self.b * param, self.a)
+        # cascade if discrete-time system
+        elif isinstance(param, DiscreteTimeSystem):
+            return self.cascade(param)
+
+        return NotImplemented
+
+    def __rmul__(self, param):
+        '''
+        Scale system by gain (reverse method).
+
+        Parameters
+        ----------
+        param : float
+            Given gain.
+
+        Returns
+        -------
+        DiscreteTimeSystem
+            Scaled discrete-time system.
+        '''
+
+        return self.__mul__(param)
+
+    def __add__(self, system):
+        '''
+        Compose this and given discrete-time system in parallel.
+
+        Parameters
+        ----------
+        system : DiscreteTimeSystem
+            Given discrete-time system.
+
+        Returns
+        -------
+        DiscreteTimeSystem
+            Parallel discrete-time system.
+        '''
+
+        if not isinstance(system, DiscreteTimeSystem):
+            return NotImplemented
+
+        return self.parallel(system)
+
+    def _filter_values(self, values):
+        '''
+        Apply digital filter on array of values along last axis, using
+        second-order sections if the system has them.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Array of input values.
+
+        Returns
+        -------
+        y_values : numpy.ndarray
+            Filtered values.
+        '''
+
+        # import lazily to keep package import light
+        from scipy.signal import lfilter, sosfilt
+
+        if self.sos is not None:
+            return sosfilt(self.sos, values, axis=-1)
+
+        return lfilter(self.b, self.a, values, axis=-1)
+
+    @profiled('DiscreteTimeSystem.filter')
     def filter(self, sig):
         '''
-        Apply digital filter on discrete-time signal.
+        Apply digital filter on discrete-time signal. Multichannel signals are
+        filtered on all channels at once.
 
         Parameters
         ----------
-        sig : DiscreteTimeSignal
-            Given discrete-time signal.
+        sig : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+            Given discrete-time signal. ``SparseDiscreteTimeSignal`` objects
+            are converted to dense signals before filtering.
 
         Returns
         -------
-        y_n : DiscreteTimeSignal
+        y_n : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
             Filtered discrete-time signal.
         '''
 
-        # get signal values
-        sig_values = sig.values()
-        # pass signal values through filter
-        y_values = lfilter(self.b, self.a, sig_values)
+        # import lazily to keep package import light
+        from DiscreteTimeLib.sparse import SparseDiscreteTimeSignal
 
-        data = ()
-        for n in range(sig.min_idx, sig.max_idx + 1):
-            data += ((n, y_values[n - sig.min_idx]),)
+        # filter response of sparse signal is dense
+        if isinstance(sig, SparseDiscreteTimeSignal):
+            with span('DiscreteTimeSystem.filter', 'materialize') as s:
+                sig = sig.to_dense()
+                s.allocated(sig._buffer)
 
-        y_n = DiscreteTimeSignal(
-            data,
-            dtype=y_values.dtype,
-        )
+        with span('DiscreteTimeSystem.filter', 'compute') as s:
+            # pass signal values through filter
+            y_values = self._filter_values(sig._buffer)
+            s.allocated(y_values)
+
+        with span('DiscreteTimeSystem.filter', 'wrap result'):
+            y_n = type(sig)._from_buffer(sig._start, y_values)
 
         return y_n
 
+    def filter_many(
+        self,
+        signals,
+        executor='thread',
+        max_workers=None,
+        chunksize=1,
+    ):
+        '''
+        Apply digital filter on many discrete-time signals, spreading the work
+        over a pool of workers. See
+        :func:`~DiscreteTimeLib.parallel.filter_many`.
+
+        Parameters
+        ----------
+        signals : iterable of DiscreteTimeSignal
+            Signals to filter.
+
+        executor : str or concurrent.futures.Executor, optional
+            Pool of workers, one of ``'thread'`` or ``'process'``, or an
+            existing executor.
+
+        max_workers : int, optional
+            Number of workers, when creating a pool.
+
+        chunksize : int, optional
+            Number of signals sent to a worker at a time.
+
+        Returns
+        -------
+        generator of DiscreteTimeSignal
+            Filtered signals, in the order of the given signals.
+        '''
+
+        # import lazily to keep package import light
+        from DiscreteTimeLib.parallel import filter_many
+
+        return filter_many(self, signals, executor, max_workers, chunksize)
+
+    def stream(self):
+        '''
+        Create streaming filter, used to apply digital filter on a signal
+        chunk by chunk, carrying filter state between chunks.
+
+        Returns
+        -------
+        stream : StreamingFilter
+            Streaming filter at rest.
+        '''
+
+        stream = StreamingFilter(self)
+
+        return stream
+
+    def resample(self, sig, L, M):
+        '''
+        Resample discrete-time signal by rational factor ``L / M``, using this
+        FIR system as polyphase filter. See
+        :func:`~DiscreteTimeLib.multirate.resample`.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+            Given discrete-time signal.
+
+        L : int
+            Upsampling factor.
+
+        M : int
+            Downsampling factor.
+
+        Returns
+        -------
+        y_n : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+            Resampled signal.
+        '''
+
+        # import lazily to avoid circular imports
+        from DiscreteTimeLib.multirate import resample
+
+        return resample(sig, L, M, system=self)
+
+    def decimate(self, sig, M):
+        '''
+        Decimate discrete-time signal by integer factor, using this FIR
+        system as anti-aliasing filter. See
+        :func:`~DiscreteTimeLib.multirate.decimate`.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+            Given discrete-time signal.
+
+        M : int
+            Downsampling factor.
+
+        Returns
+        -------
+        y_n : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+            Decimated signal.
+        '''
+
+        return self.resample(sig, 1, M)
+
+    def interpolate(self, sig, L):
+        '''
+        Interpolate discrete-time signal by integer factor, using this FIR
+        system as anti-imaging filter. See
+        :func:`~DiscreteTimeLib.multirate.interpolate`.
+
+        Parameters
+        ----------
+        sig : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+            Given discrete-time signal.
+
+        L : int
+            Upsampling factor.
+
+        Returns
+        -------
+        y_n : DiscreteTimeSignal or MultichannelDiscreteTimeSignal
+            Interpolated signal.
+        '''
+
+        return self.resample(sig, L, 1)
+
+    def stream_resample(self, L, M):
+        '''
+        Create streaming resampler, used to resample a signal chunk by chunk
+        using this FIR system as polyphase filter.
+
+        Parameters
+        ----------
+        L : int
+            Upsampling factor.
+
+        M : int
+            Downsampling factor.
+
+        Returns
+        -------
+        StreamingResampler
+            Streaming resampler at rest.
+        '''
+
+        # import lazily to avoid circular imports
+        from DiscreteTimeLib.multirate import StreamingResampler
+
+        return StreamingResampler(L, M, system=self)
+
+    @profiled('DiscreteTimeSystem.partial_fractions')
+    def partial_fractions(self):
+        '''
+        Compute partial fraction decomposition of transfer function.
+
+        The decomposition is computed once and cached until the coefficients
+        of the system change.
+
+        .. math::
+            H(z) =
+            \\sum_i \\frac{r_i}{(1 - p_i z^{-1})^{m_i}} +
+            \\sum_j k_j z^{-j}
+
+        Returns
+        -------
+        r : numpy.ndarray
+            Residues.
+
+        p : numpy.ndarray
+            Poles, with repeated poles listed consecutively.
+
+        m : numpy.ndarray
+            Power of each term, increasing from 1 for repeated poles.
+
+        k : numpy.ndarray
+            Coefficients of direct terms.
+        '''
+
+        return self._cached('partial_fractions', self._partial_fractions)
+
+    @profiled('DiscreteTimeSystem.partial_fractions', 'compute')
+    def _partial_fractions(self):
+        '''
+        Compute partial fraction decomposition of transfer function, without
+        caching.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Residues, poles, powers and direct terms.
+        '''
+
+        # import lazily to keep package import light
+        from scipy.signal import residuez
+
+        r, p, k = residuez(self.b, self.a)
+
+        # repeated poles are listed consecutively with increasing power
+        m = np.ones(np.shape(p)[0], dtype=np.int64)
+        for i in range(1, np.shape(p)[0]):
+            if p[i] == p[i - 1]:
+                m[i] = m[i - 1] + 1
+
+        return r, p, m, k
+
+    @profiled('DiscreteTimeSystem.iztrans')
     def iztrans(self):
         '''
         Compute inverse z-transform of system.
 
+        The expression is computed once and cached until the coefficients of
+        the system change.
+
+        Returns
+        -------
+        exp : sympy.core.expr.Expr
+            Z-transform of the system, computed as a sympy expression.
+
+        n : sympy.core.symbol.Symbol
+            Symbolic variable used to create sympy expression.
+        '''
+
+        return self._cached('iztrans', self._iztrans)
+
+    @profiled('DiscreteTimeSystem.iztrans', 'compute')
+    def _iztrans(self):
+        '''
+        Compute inverse z-transform of system, without caching.
+
         Returns
         -------
         exp : sympy.core.expr.Expr
@@ -146,14 +827,21 @@ class DiscreteTimeSystem:
             Symbolic variable used to create sympy expression.
         '''
 
+        # import lazily, since sympy is slow to import
+        from sympy import Symbol, Heaviside, KroneckerDelta, binomial
+
         exp = 0
         # get partial fraction decomposition
-        r, p, k = residuez(self.b, self.a)
+        r, p, m, k = self.partial_fractions()
 
         # create expression for inverse z-transform
         n = Symbol('n')
         for i in range(max(np.shape(r)[0], np.shape(p)[0])):
             p_coeff = p[i] if p[i] == 1.0 else p[i] ** n
+            # repeated pole terms are scaled by binomial coefficient
+            if m[i] > 1:
+                p_coeff *= binomial(n + int(m[i]) - 1, int(m[i]) - 1)
+
             exp += r[i] * p_coeff * Heaviside(n, 1)
 
         for i in range(np.shape(k)[0]):
@@ -161,7 +849,75 @@ class DiscreteTimeSystem:
 
         return exp, n
 
-    def impz(self, n_range):
+    def iztrans_func(self):
+        '''
+        Compile inverse z-transform of system into a function that evaluates
+        it over arrays of indices using NumPy.
+
+        The function is built once and cached until the coefficients of the
+        system change.
+
+        Returns
+        -------
+        h : callable
+            Function that takes an integer or array of integers ``n`` and
+            returns the inverse z-transform evaluated at ``n``.
+
+        Examples
+        --------
+        >>> H = DiscreteTimeSystem((1,), (1, -2, 1))
+        >>> h = H.iztrans_func()
+        >>> h(np.arange(-1, 4))
+        array([0., 1., 2., 3., 4.])
+        '''
+
+        return self._cached('iztrans_func', self._iztrans_func)
+
+    def _iztrans_func(self):
+        '''
+        Compile inverse z-transform of system, without caching.
+
+        Returns
+        -------
+        h : callable
+            Function evaluating inverse z-transform.
+        '''
+
+        r, p, m, k = self.partial_fractions()
+        # response of system with real coefficients is real
+        is_real = not (np.iscomplexobj(self.b) or np.iscomplexobj(self.a))
+
+        def h(n):
+            n = np.asarray(n, dtype=np.int64)
+            vals = np.zeros(n.shape, dtype=np.complex128)
+
+            # pole terms are non-zero from n = 0
+            causal = n >= 0
+            n_causal = n[causal]
+            pole_vals = np.zeros(n_causal.shape, dtype=np.complex128)
+            for r_i, p_i, m_i in zip(r, p, m):
+                term = r_i * np.power(p_i, n_causal)
+                # scale repeated pole terms by binomial coefficient
+                for j in range(1, m_i):
+                    term *= (n_causal + j) / j
+
+                pole_vals += term
+
+            vals[causal] = pole_vals
+
+            # direct terms are non-zero from n = 0 to n = len(k) - 1
+            direct = causal & (n < np.shape(k)[0])
+            vals[direct] += k[n[direct]]
+
+            if is_real:
+                vals = vals.real
+
+            return vals[()]
+
+        return h
+
+    @profiled('DiscreteTimeSystem.impz')
+    def impz(self, n_range, method='filter'):
         '''
         Compute impulse response of system.
 
@@ -172,6 +928,14 @@ class DiscreteTimeSystem:
             ``n_range = [-1, 3]`` to compute from ``n = -1`` to ``n = 2``
             inclusive.
 
+        method : str, optional
+            Computation method, one of ``'filter'``, ``'residue'`` or
+            ``'symbolic'``. ``'filter'`` passes a unit impulse through the
+            digital filter. ``'residue'`` evaluates the compiled inverse
+            z-transform from :meth:`iztrans_func`. ``'symbolic'`` substitutes
+            each index into the inverse z-transform expression computed by
+            :meth:`iztrans`, which is much slower.
+
         Returns
         -------
         response : DiscreteTimeSignal
@@ -183,27 +947,69 @@ class DiscreteTimeSystem:
         if len(n_range_shape) != 1 or n_range_shape[0] != 2:
             raise ValueError('n_range must be a two-element array')
 
-        # compute inverse z-transform values for n_range
-        iztrans_exp, n = self.iztrans()
+        # raise error if method is unknown
+        if method not in ('filter', 'residue', 'symbolic'):
+            err_msg = f'Unknown method {method}. '
+            err_msg += 'Use \'filter\', \'residue\' or \'symbolic\''
+            raise ValueError(err_msg)
+
+        n_start, n_stop = int(n_range[0]), int(n_range[1])
+        if n_stop <= n_start:
+            empty_response = DiscreteTimeSignal()
+
+            return empty_response
+
+        if method == 'symbolic':
+            # compute inverse z-transform values for n_range
+            iztrans_exp, n = self.iztrans()
+
+            with span('DiscreteTimeSystem.impz', 'substitute'):
+                values = []
+                for n_idx in range(n_start, n_stop):
+                    val = iztrans_exp.subs(n, n_idx)
+                    try:
+                        val = np.float64(val)
+                    except TypeError:
+                        val = np.clongdouble(val)
+
+                    values.append(val)
 
-        data = ()
-        for n_idx in range(*n_range):
-            val = iztrans_exp.subs(n, n_idx)
-            try:
-                val = np.float64(iztrans_exp.subs(n, n_idx))
-            except TypeError:
-                val = np.clongdouble(iztrans_exp.subs(n, n_idx))
+            response = DiscreteTimeSignal.from_dense(n_start, np.array(values))
 
-            data += ((n_idx, val),)
+            return response
 
-        response = DiscreteTimeSignal(
-            data,
-            dtype=np.array(data).dtype,
+        if method == 'residue':
+            h = self.iztrans_func()
+            with span('DiscreteTimeSystem.impz', 'compute') as s:
+                values = h(np.arange(n_start, n_stop))
+                s.allocated(values)
+
+            response = DiscreteTimeSignal.from_dense(n_start, values)
+
+            return response
+
+        # causal system has zero response before n = 0
+        values = np.zeros(
+            n_stop - n_start,
+            dtype=np.result_type(self.b, self.a, np.float64),
         )
 
+        if n_stop > 0:
+            with span('DiscreteTimeSystem.impz', 'compute') as s:
+                # pass unit impulse through filter
+                impulse = np.zeros(n_stop)
+                impulse[0] = 1
+                h = self._filter_values(impulse)
+                s.allocated(h)
+
+            values[max(-n_start, 0) :] = h[max(n_start, 0) :]
+
+        response = DiscreteTimeSignal.from_dense(n_start, values)
+
         return response
 
-    def freqz(self, w_range, num=50):
+    @profiled('DiscreteTimeSystem.freqz')
+    def freqz(self, w_range, num=50, method='auto', dtype=np.clongdouble):
         '''
         Compute frequency response of system.
 
@@ -217,6 +1023,17 @@ class DiscreteTimeSystem:
         num : int, optional
             Number of points to divide range into.
 
+        method : str, optional
+            Evaluation method, one of ``'auto'``, ``'horner'`` or ``'fft'``.
+            ``'fft'`` requires the spacing of the frequency grid to divide the
+            unit circle into a whole number of points. ``'auto'`` uses
+            ``'fft'`` for such grids when computing in double precision, and
+            ``'horner'`` otherwise.
+
+        dtype : numpy.dtype, optional
+            Complex data type used for computation, for e.g.
+            ``numpy.complex128`` for faster, double-precision evaluation.
+
         Returns
         -------
         freq : numpy.ndarray
@@ -224,15 +1041,475 @@ class DiscreteTimeSystem:
 
         w_samples : numpy.ndarray
             Angular frequency values used to compute frequency response.
+
+        Notes
+        -----
+        If a :class:`~DiscreteTimeLib.caching.ResponseCache` is active,
+        frequency responses are cached in it, keyed by a content hash of the
+        coefficients and by the frequency grid, so that repeated calls for
+        equal systems and grids are not recomputed.
         '''
 
-        freq = np.zeros(num, dtype=np.clongdouble)
+        # raise error if method is unknown
+        if method not in ('auto', 'horner', 'fft'):
+            err_msg = f'Unknown method {method}. '
+            err_msg += 'Use \'auto\', \'horner\' or \'fft\''
+            raise ValueError(err_msg)
+
+        # raise error if dtype is not complex
+        if np.dtype(dtype).kind != 'c':
+            raise ValueError('dtype must be a complex data type')
+
         w_samples = np.linspace(w_range[0], w_range[1], num=num)
-        # calculate frequency response using w values
-        for i, w in enumerate(w_samples):
-            # compute z value given w
-            z = np.cos(w) + (np.clongdouble(1j) * np.sin(w))
-            # evaluate frequency at z value
-            freq[i] = self.eval(z)
+
+        cache = get_response_cache()
+        if cache is None:
+            return self._freqz(w_range, num, method, dtype), w_samples
+
+        params = (
+            'freqz',
+            float(w_range[0]),
+            float(w_range[1]),
+            int(num),
+            method,
+            np.dtype(dtype).str,
+        )
+        freq = cache.get(
+            self,
+            params,
+            lambda: self._freqz(w_range, num, method, dtype),
+        )
 
         return freq, w_samples
+
+    def _freqz(self, w_range, num, method, dtype):
+        '''
+        Compute frequency response of system, without caching.
+
+        Parameters
+        ----------
+        w_range : array-like
+            Range of angular velocities to compute frequency response for.
+
+        num : int
+            Number of points to divide range into.
+
+        method : str
+            Evaluation method, one of ``'auto'``, ``'horner'`` or ``'fft'``.
+
+        dtype : numpy.dtype
+            Complex data type used for computation.
+
+        Returns
+        -------
+        freq : numpy.ndarray
+            Frequency response of system.
+        '''
+
+        n_fft = _fft_grid_size(w_range, num)
+
+        if method == 'auto':
+            # FFT is only accurate up to double precision
+            use_fft = n_fft is not None and n_fft <= 2 * num
+            use_fft = use_fft and np.finfo(dtype).eps >= np.finfo(float).eps
+            method = 'fft' if use_fft else 'horner'
+
+        # raise error if grid cannot be computed using FFT
+        if method == 'fft' and n_fft is None:
+            err_msg = 'Frequency grid spacing must divide the unit circle '
+            err_msg += 'into a whole number of points to use FFT'
+            raise ValueError(err_msg)
+
+        if method == 'fft':
+            # positions of grid points in FFT output
+            step_sign = 1 if w_range[1] >= w_range[0] else -1
+            fft_idx = (step_sign * np.arange(num)) % n_fft
+
+            if self.sos is not None:
+                # multiply responses of sections
+                freq = np.ones(num, dtype=np.complex128)
+                for section in self.sos:
+                    numerator = _fft_poly(section[:3], w_range[0], n_fft)
+                    denominator = _fft_poly(section[3:], w_range[0], n_fft)
+                    freq *= (numerator / denominator)[fft_idx]
+            else:
+                # evaluate numerator and denominator using FFT
+                numerator = _fft_poly(self.b, w_range[0], n_fft)[fft_idx]
+                denominator = _fft_poly(self.a, w_range[0], n_fft)[fft_idx]
+                freq = numerator / denominator
+
+            freq = freq.astype(dtype)
+        else:
+            # compute z values given w
+            w_samples = np.linspace(w_range[0], w_range[1], num=num)
+            j = np.asarray(1j, dtype=dtype)
+            z = np.cos(w_samples) + (j * np.sin(w_samples))
+            # evaluate frequency at z values
+            freq = np.asarray(self._eval(z, dtype))
+
+        return freq
+
+
+def _poly_add(p, q):
+    '''
+    Add polynomials of possibly different lengths.
+
+    Parameters
+    ----------
+    p : numpy.ndarray
+        Coefficients of first polynomial, in increasing powers.
+
+    q : numpy.ndarray
+        Coefficients of second polynomial, in increasing powers.
+
+    Returns
+    -------
+    numpy.ndarray
+        Coefficients of sum.
+    '''
+
+    n = max(p.shape[0], q.shape[0])
+
+    return np.pad(p, (0, n - p.shape[0])) + np.pad(q, (0, n - q.shape[0]))
+
+
+def _poly_roots(coeffs):
+    '''
+    Factor polynomial in :math:`z^{-1}` into its roots, gain and delay, so
+    that :math:`p(z) = k z^{-d} \\prod_i (1 - r_i z^{-1})`.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Polynomial coefficients, in increasing powers of :math:`z^{-1}`.
+
+    Returns
+    -------
+    roots : numpy.ndarray
+        Roots :math:`r_i`, without roots at the origin.
+
+    gain : float
+        Gain :math:`k`.
+
+    delay : int
+        Delay :math:`d`.
+    '''
+
+    nonzero = np.flatnonzero(coeffs)
+
+    # zero polynomial has no roots
+    if nonzero.shape[0] == 0:
+        return np.zeros(0), 0.0, 0
+
+    coeffs = coeffs[nonzero[0] : nonzero[-1] + 1]
+
+    return np.roots(coeffs), coeffs[0], int(nonzero[0])
+
+
+def _zpk(b, a):
+    '''
+    Factor transfer function into zeros, poles, gain and delay, so that
+
+    .. math::
+        H(z) = k z^{-d} \\frac{\\prod_i (1 - z_i z^{-1})}
+        {\\prod_i (1 - p_i z^{-1})}
+
+    Unlike ``scipy.signal.tf2zpk``, delays are kept, since roots of
+    polynomials in :math:`z^{-1}` lose leading zero coefficients.
+
+    Parameters
+    ----------
+    b : numpy.ndarray
+        Numerator coefficients.
+
+    a : numpy.ndarray
+        Denominator coefficients.
+
+    Returns
+    -------
+    zeros : numpy.ndarray
+        Zeros :math:`z_i`.
+
+    poles : numpy.ndarray
+        Poles :math:`p_i`.
+
+    gain : float
+        Gain :math:`k`.
+
+    delay : int
+        Delay :math:`d`.
+    '''
+
+    zeros, b_gain, b_delay = _poly_roots(b)
+    poles, a_gain, a_delay = _poly_roots(a)
+
+    return zeros, poles, b_gain / a_gain, b_delay - a_delay
+
+
+def _zpk_to_sos(zeros, poles, gain, delay):
+    '''
+    Convert zeros, poles, gain and delay of transfer function, see
+    :func:`_zpk`, into second-order sections.
+
+    Parameters
+    ----------
+    zeros : numpy.ndarray
+        Zeros of transfer function.
+
+    poles : numpy.ndarray
+        Poles of transfer function.
+
+    gain : float
+        Gain of transfer function.
+
+    delay : int
+        Delay of transfer function, in samples.
+
+    Returns
+    -------
+    sos : numpy.ndarray
+        Second-order sections, see
+        :meth:`DiscreteTimeSystem.from_sos`.
+    '''
+
+    # import lazily to keep package import light
+    from scipy.signal import zpk2sos
+
+    # pad roots at origin, whose factors are 1, to pair zeros with poles
+    n = max(zeros.shape[0], poles.shape[0])
+    zeros = np.pad(zeros, (0, n - zeros.shape[0]))
+    poles = np.pad(poles, (0, n - poles.shape[0]))
+
+    # delay by two samples per section, and one sample in last section
+    delays = [[0, 0, 1, 1, 0, 0]] * (delay // 2)
+    delays += [[0, 1, 0, 1, 0, 0]] * (delay % 2)
+
+    sos = zpk2sos(zeros, poles, gain)
+    if len(delays) > 0:
+        sos = np.concatenate((sos, delays))
+
+    return sos
+
+
+# points on unit circle at which composite systems with sections are checked
+_CHECK_Z = np.exp(1j * np.pi * (np.arange(64) + 0.5) / 64)
+
+
+def _checked_from_sos(sos, response):
+    '''
+    Create discrete-time system from second-order sections, warning if its
+    frequency response differs from the given response at ``_CHECK_Z``.
+
+    Parameters
+    ----------
+    sos : numpy.ndarray
+        Second-order sections of composite system.
+
+    response : numpy.ndarray
+        Frequency response the composite system should have at ``_CHECK_Z``.
+
+    Returns
+    -------
+    composite : DiscreteTimeSystem
+        Composite discrete-time system.
+    '''
+
+    composite = DiscreteTimeSystem.from_sos(sos)
+
+    # warn if computed poles or zeros are not accurate
+    actual = composite.eval(_CHECK_Z, dtype=np.complex128)
+    atol = 1e-6 * np.max(np.abs(response))
+    if not np.allclose(actual, response, rtol=1e-6, atol=atol):
+        warn_msg = 'Composite system could not be factored accurately into '
+        warn_msg += 'second-order sections, its response may be inaccurate'
+        warnings.warn(warn_msg, RuntimeWarning, stacklevel=3)
+
+    return composite
+
+
+def _system_zpk(system):
+    '''
+    Factor transfer function of system into zeros, poles, gain and delay,
+    see :func:`_zpk`, section by section if the system has second-order
+    sections.
+
+    Parameters
+    ----------
+    system : DiscreteTimeSystem
+        Given discrete-time system.
+
+    Returns
+    -------
+    tuple
+        Zeros, poles, gain and delay.
+    '''
+
+    if system.sos is None:
+        return _zpk(system.b, system.a)
+
+    factors = [_zpk(section[:3], section[3:]) for section in system.sos]
+    zeros = np.concatenate([f[0] for f in factors])
+    poles = np.concatenate([f[1] for f in factors])
+    gain = np.prod([f[2] for f in factors])
+    delay = sum(f[3] for f in factors)
+
+    return zeros, poles, gain, delay
+
+
+def _common_roots(p, q):
+    '''
+    Split roots into those common to both given sets of roots and the rest.
+
+    Parameters
+    ----------
+    p : numpy.ndarray
+        First set of roots.
+
+    q : numpy.ndarray
+        Second set of roots.
+
+    Returns
+    -------
+    common : numpy.ndarray
+        Roots in both sets, counted as often as in both.
+
+    p_rest : numpy.ndarray
+        Remaining roots of first set.
+
+    q_rest : numpy.ndarray
+        Remaining roots of second set.
+    '''
+
+    common = []
+    p_rest = []
+    q_rest = list(q)
+    for root in p:
+        if root in q_rest:
+            q_rest.remove(root)
+            common.append(root)
+        else:
+            p_rest.append(root)
+
+    return (
+        np.array(common, dtype=np.complex128),
+        np.array(p_rest, dtype=np.complex128),
+        np.array(q_rest, dtype=np.complex128),
+    )
+
+
+def _parallel_zpk(zpk, other_zpk):
+    '''
+    Compute zeros, poles, gain and delay of sum of transfer functions, see
+    :func:`_zpk`.
+
+    Poles and zeros common to both transfer functions are kept as they are,
+    so that for e.g. a sum of equal systems is computed exactly, and only
+    the zeros of the remaining numerator are computed from a polynomial.
+
+    Parameters
+    ----------
+    zpk : tuple
+        Zeros, poles, gain and delay of first transfer function.
+
+    other_zpk : tuple
+        Zeros, poles, gain and delay of second transfer function.
+
+    Returns
+    -------
+    tuple
+        Zeros, poles, gain and delay of sum.
+    '''
+
+    zeros, poles, gain, delay = zpk
+    other_zeros, other_poles, other_gain, other_delay = other_zpk
+
+    common_zeros, zeros, other_zeros = _common_roots(zeros, other_zeros)
+    common_poles, poles, other_poles = _common_roots(poles, other_poles)
+    common_delay = min(delay, other_delay)
+
+    # numerator of sum over remaining factors
+    numerator = gain * np.convolve(np.poly(zeros), np.poly(other_poles))
+    other_numerator = other_gain * np.convolve(
+        np.poly(other_zeros),
+        np.poly(poles),
+    )
+    numerator = _poly_add(
+        np.pad(numerator, (delay - common_delay, 0)),
+        np.pad(other_numerator, (other_delay - common_delay, 0)),
+    )
+    sum_zeros, sum_gain, sum_delay = _poly_roots(np.real_if_close(numerator))
+
+    sum_zpk = (
+        np.concatenate((common_zeros, sum_zeros)),
+        np.concatenate((common_poles, poles, other_poles)),
+        sum_gain,
+        common_delay + sum_delay,
+    )
+
+    return sum_zpk
+
+
+def _fft_grid_size(w_range, num):
+    '''
+    Compute number of points that the spacing of a frequency grid divides the
+    unit circle into.
+
+    Parameters
+    ----------
+    w_range : array-like
+        Range of angular velocities of frequency grid.
+
+    num : int
+        Number of points in frequency grid.
+
+    Returns
+    -------
+    int or None
+        Number of points on unit circle, ``None`` if spacing does not divide
+        unit circle into a whole number of points.
+    '''
+
+    if num < 2 or w_range[0] == w_range[1]:
+        return None
+
+    n_points = 2 * np.pi * (num - 1) / abs(w_range[1] - w_range[0])
+    n_fft = int(round(n_points))
+
+    if abs(n_points - n_fft) > 1e-9 * n_points:
+        return None
+
+    return n_fft
+
+
+def _fft_poly(coeffs, w_start, n_fft):
+    '''
+    Evaluate polynomial in :math:`z^{-1}` on ``n_fft`` evenly spaced points
+    on the unit circle, starting at angular velocity ``w_start``.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Polynomial coefficients, in increasing powers of :math:`z^{-1}`.
+
+    w_start : float
+        Angular velocity of first point.
+
+    n_fft : int
+        Number of points.
+
+    Returns
+    -------
+    numpy.ndarray
+        Polynomial values at given points.
+    '''
+
+    # rotate coefficients to start at given angular velocity
+    rotated = coeffs * np.exp(-1j * w_start * np.arange(coeffs.shape[0]))
+
+    # wrap coefficients beyond FFT length, since z^-n_fft = 1 on the grid
+    n_wraps = -(-rotated.shape[0] // n_fft)
+    wrapped = np.zeros(n_wraps * n_fft, dtype=rotated.dtype)
+    wrapped[: rotated.shape[0]] = rotated
+    wrapped = wrapped.reshape(n_wraps, n_fft).sum(axis=0)
+
+    return np.fft.fft(wrapped)
@@ -0,0 +1,639 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from DiscreteTimeLib import DiscreteTimeSignal, DiscreteTimeSystem
+from DiscreteTimeLib.caching import ResponseCache, use_response_cache
+from DiscreteTimeLib.multirate import resample, resampling_filter
+
+# default signal sizes, from 10^2 to 10^7 samples
+DEFAULT_SIZES = tuple(10**k for k in range(2, 8))
+# default ratio of current to baseline time above which a result regresses
+DEFAULT_THRESHOLD = 1.25
+# minimum total time of each timing repeat, in seconds
+DEFAULT_MIN_TIME = 0.2
+
+# coefficients of system used by filtering benchmarks
+SYSTEM_B = (0.2, 0.3, 0.2)
+SYSTEM_A = (1, -0.5, 0.25)
+
+
+def random_signal(size, start=0, seed=0):
+    '''
+    Create random discrete-time signal.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples.
+
+    start : int, optional
+        Index of first sample.
+
+    seed : int, optional
+        Seed of random number generator.
+
+    Returns
+    -------
+    DiscreteTimeSignal
+        Random discrete-time signal.
+    '''
+
+    values = np.random.default_rng(seed).random(size)
+
+    return DiscreteTimeSignal.from_dense(start, values)
+
+
+def setup_constructor(size):
+    '''
+    Set up construction of signal from index-value pairs.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    data = tuple(enumerate(np.random.default_rng(0).random(size).tolist()))
+
+    return lambda: DiscreteTimeSignal(data)
+
+
+def setup_values(size):
+    '''
+    Set up fetching values of signal.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    x_n = random_signal(size)
+
+    return x_n.values
+
+
+def setup_add(size):
+    '''
+    Set up addition of partially overlapping signals.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples of each signal.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    x_n = random_signal(size)
+    y_n = random_signal(size, start=size // 2, seed=1)
+
+    return lambda: x_n + y_n
+
+
+def setup_sub(size):
+    '''
+    Set up subtraction of partially overlapping signals.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples of each signal.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    x_n = random_signal(size)
+    y_n = random_signal(size, start=size // 2, seed=1)
+
+    return lambda: x_n - y_n
+
+
+def setup_scalar_mul(size):
+    '''
+    Set up multiplication of signal by scalar.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    x_n = random_signal(size)
+
+    return lambda: x_n * 2.5
+
+
+def setup_conv(size):
+    '''
+    Set up convolution of signals.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples of each signal.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    x_n = random_signal(size)
+    y_n = random_signal(size, seed=1)
+
+    return lambda: x_n * y_n
+
+
+def setup_xcorr(size):
+    '''
+    Set up cross-correlation of signals.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples of each signal.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    x_n = random_signal(size)
+    y_n = random_signal(size, start=size // 10, seed=1)
+
+    return lambda: x_n.xcorr(y_n)
+
+
+def setup_eq(size):
+    '''
+    Set up equality comparison of signals.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples of each signal.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    x_n = random_signal(size)
+    y_n = random_signal(size)
+
+    return lambda: x_n == y_n
+
+
+def setup_filter(size):
+    '''
+    Set up filtering of signal through second-order system.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    x_n = random_signal(size)
+    H = DiscreteTimeSystem(SYSTEM_B, SYSTEM_A)
+
+    return lambda: H.filter(x_n)
+
+
+def setup_resample(size):
+    '''
+    Set up resampling of signal by a factor of 1/3.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    # 48 kHz to 16 kHz
+    x_n = random_signal(size)
+    H = resampling_filter(1, 3)
+
+    return lambda: resample(x_n, 1, 3, system=H)
+
+
+def setup_freqz(size):
+    '''
+    Set up computation of frequency response, with caching disabled.
+
+    Parameters
+    ----------
+    size : int
+        Number of frequencies.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    H = DiscreteTimeSystem(SYSTEM_B, SYSTEM_A)
+
+    # measure computation rather than cache lookups
+    def freqz():
+        with use_response_cache(None):
+            return H.freqz((-np.pi, np.pi), num=size)
+
+    return freqz
+
+
+def setup_freqz_cached(size):
+    '''
+    Set up computation of frequency response, with a cache that
+    holds every response.
+
+    Parameters
+    ----------
+    size : int
+        Number of frequencies.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    H = DiscreteTimeSystem(SYSTEM_B, SYSTEM_A)
+    cache = ResponseCache(max_bytes=2**30)
+
+    def freqz():
+        with use_response_cache(cache):
+            return H.freqz((-np.pi, np.pi), num=size)
+
+    return freqz
+
+
+def setup_impz(size):
+    '''
+    Set up computation of impulse response.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    H = DiscreteTimeSystem(SYSTEM_B, SYSTEM_A)
+
+    return lambda: H.impz((0, size))
+
+
+def setup_iztrans(size):
+    '''
+    Set up computation of symbolic inverse z-transform.
+
+    Parameters
+    ----------
+    size : int
+        Number of poles of system.
+
+    Returns
+    -------
+    callable
+        Function to measure.
+    '''
+
+    # system with given number of distinct poles, equally spaced on circle of
+    # radius 0.9, which are roots of z^size - 0.9^size, so that coefficients
+    # and residues are well-conditioned
+    a = np.zeros(size + 1)
+    a[0] = 1
+    a[-1] = -(0.9**size)
+
+    # create new system on each call, since inverse z-transform is cached
+    return lambda: DiscreteTimeSystem((1,), a).iztrans()
+
+
+# benchmarks, mapping name to setup function, which creates the inputs for
+# the given size and returns the function to measure, and to the largest
+# size the benchmark runs at
+BENCHMARKS = {
+    'constructor': (setup_constructor, None),
+    'values': (setup_values, None),
+    'add': (setup_add, None),
+    'sub': (setup_sub, None),
+    'scalar_mul': (setup_scalar_mul, None),
+    'conv': (setup_conv, None),
+    'xcorr': (setup_xcorr, None),
+    'eq': (setup_eq, None),
+    'filter': (setup_filter, None),
+    'resample': (setup_resample, None),
+    'freqz': (setup_freqz, None),
+    'freqz_cached': (setup_freqz_cached, None),
+    'impz': (setup_impz, None),
+    # size is number of poles, for which symbolic expressions grow quickly,
+    # and partial fraction expansion loses accuracy beyond a hundred poles
+    'iztrans': (setup_iztrans, 100),
+}
+
+
+def time_func(func, repeat=5, min_time=DEFAULT_MIN_TIME):
+    '''
+    Measure time taken by function.
+
+    The function is called in loops long enough to take at least
+    ``min_time`` seconds, and the loops are repeated ``repeat`` times.
+
+    Parameters
+    ----------
+    func : callable
+        Function with no arguments.
+
+    repeat : int, optional
+        Number of repeats.
+
+    min_time : float, optional
+        Minimum time of each repeat, in seconds.
+
+    Returns
+    -------
+    best : float
+        Fastest time per call, in seconds.
+
+    median : float
+        Median time per call, in seconds.
+    '''
+
+    # estimate number of calls per repeat from a single call
+    t_start = time.perf_counter()
+    func()
+    t_single = time.perf_counter() - t_start
+    number = max(1, int(min_time / max(t_single, 1e-9)))
+
+    times = []
+    for _ in range(repeat):
+        t_start = time.perf_counter()
+        for _ in range(number):
+            func()
+
+        times.append((time.perf_counter() - t_start) / number)
+
+    return min(times), statistics.median(times)
+
+
+def peak_memory(func):
+    '''
+    Measure peak memory allocated by function, using tracemalloc.
+
+    Parameters
+    ----------
+    func : callable
+        Function with no arguments.
+
+    Returns
+    -------
+    int
+        Peak memory allocated during call, in bytes.
+    '''
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def run_benchmarks(
+    names=None,
+    sizes=DEFAULT_SIZES,
+    repeat=5,
+    min_time=DEFAULT_MIN_TIME,
+    log=None,
+):
+    '''
+    Run benchmarks at given sizes.
+
+    Parameters
+    ----------
+    names : iterable of str, optional
+        Names of benchmarks to run. Defaults to all benchmarks.
+
+    sizes : iterable of int, optional
+        Sizes to run benchmarks at.
+
+    repeat : int, optional
+        Number of timing repeats.
+
+    min_time : float, optional
+        Minimum time of each timing repeat, in seconds.
+
+    log : file object, optional
+        Stream to report progress to.
+
+    Returns
+    -------
+    dict
+        Results, holding environment metadata, and time and peak memory of
+        each benchmark, keyed by benchmark name and size.
+    '''
+
+    if names is None:
+        names = BENCHMARKS.keys()
+
+    results = {}
+    for name in names:
+        # raise error if benchmark is unknown
+        if name not in BENCHMARKS:
+            err_msg = f'Unknown benchmark {name}. '
+            err_msg += f'Use one of {tuple(BENCHMARKS)}'
+            raise ValueError(err_msg)
+
+        setup, max_size = BENCHMARKS[name]
+        results[name] = {}
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+
+            func = setup(size)
+            best, median = time_func(func, repeat=repeat, min_time=min_time)
+            results[name][str(size)] = {
+                'time': best,
+                'time_median': median,
+                'peak_memory': peak_memory(func),
+            }
+
+            if log is not None:
+                log.write(f'{name:<12} {size:>10} {best:12.6g} s\n')
+
+    metadata = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+    }
+
+    return {'metadata': metadata, 'results': results}
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    '''
+    Compare benchmark results against baseline results.
+
+    Parameters
+    ----------
+    results : dict
+        Current results, as returned by :func:`run_benchmarks`.
+
+    baseline : dict
+        Baseline results, as returned by :func:`run_benchmarks`.
+
+    threshold : float, optional
+        Ratio of current to baseline time above which a result regresses.
+
+    Returns
+    -------
+    list of dict
+        Comparison of each benchmark and size present in both results,
+        holding baseline and current time, their ratio and whether the result
+        regressed.
+    '''
+
+    comparisons = []
+    for name, sizes in results['results'].items():
+        baseline_sizes = baseline['results'].get(name, {})
+        for size, result in sizes.items():
+            if size not in baseline_sizes:
+                continue
+
+            baseline_time = baseline_sizes[size]['time']
+            ratio = result['time'] / baseline_time
+            comparisons.append(
+                {
+                    'name': name,
+                    'size': int(size),
+                    'baseline_time': baseline_time,
+                    'time': result['time'],
+                    'ratio': ratio,
+                    'regressed': ratio > threshold,
+                }
+            )
+
+    return comparisons
+
+
+def main(argv=None):
+    '''
+    Run benchmarks from command line.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Exit status, 1 if any result regressed against baseline, 0
+        otherwise.
+    '''
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark DiscreteTimeLib operations.',
+    )
+    parser.add_argument(
+        'names',
+        nargs='*',
+        help='benchmarks to run, defaults to all benchmarks',
+    )
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        type=int,
+        default=DEFAULT_SIZES,
+        help='sizes to run benchmarks at',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument('--output', help='path to save results JSON to')
+    parser.add_argument('--baseline', help='path of baseline results JSON')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='time ratio above which results are flagged as regressions',
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        names=args.names or None,
+        sizes=args.sizes,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        log=sys.stdout,
+    )
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    comparisons = compare(results, baseline, threshold=args.threshold)
+    for c in comparisons:
+        flag = 'REGRESSED' if c['regressed'] else ''
+        print(f'{c["name"]:<12} {c["size"]:>10} {c["ratio"]:8.3f}x {flag}')
+
+    return int(any(c['regressed'] for c in comparisons))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
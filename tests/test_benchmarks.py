@@ -0,0 +1,65 @@
+import pytest
+import json
+
+from benchmarks.run import BENCHMARKS, compare, main, run_benchmarks
+
+def test_run_benchmarks():
+    results = run_benchmarks(sizes=(10, 2000), repeat=1, min_time=0)
+
+    assert set(results['results']) == set(BENCHMARKS)
+    for name, sizes in results['results'].items():
+        for size, result in sizes.items():
+            assert int(size) <= (BENCHMARKS[name][1] or int(size))
+            assert result['time'] > 0
+            assert result['time_median'] >= result['time']
+            assert result['peak_memory'] >= 0
+
+    assert '2000' not in results['results']['iztrans']
+
+    with pytest.raises(ValueError):
+        run_benchmarks(names=['fft'])
+
+def test_compare():
+    baseline = {
+        'results': {
+            'add': {'100': {'time': 1.0}, '1000': {'time': 1.0}},
+            'sub': {'100': {'time': 1.0}},
+        },
+    }
+    results = {
+        'results': {
+            'add': {'100': {'time': 1.1}, '1000': {'time': 2.0}},
+            'conv': {'100': {'time': 1.0}},
+        },
+    }
+
+    comparisons = compare(results, baseline, threshold=1.25)
+
+    assert [(c['name'], c['size']) for c in comparisons] == [
+        ('add', 100),
+        ('add', 1000),
+    ]
+    assert [c['regressed'] for c in comparisons] == [False, True]
+
+def test_main(tmp_path):
+    output = tmp_path / 'results.json'
+    args = ['add', 'filter', '--sizes', '10', '--repeat', '1']
+    args += ['--min-time', '0']
+
+    assert main(args + ['--output', str(output)]) == 0
+
+    results = json.loads(output.read_text())
+    assert set(results['results']) == {'add', 'filter'}
+
+    # scale baseline times so that results are flagged either way
+    for factor, expected_status in ((1e6, 0), (1e-6, 1)):
+        baseline = json.loads(output.read_text())
+        for sizes in baseline['results'].values():
+            for result in sizes.values():
+                result['time'] *= factor
+
+        baseline_path = tmp_path / 'baseline.json'
+        baseline_path.write_text(json.dumps(baseline))
+
+        status = main(args + ['--baseline', str(baseline_path)])
+        assert status == expected_status
\ No newline at end of file
@@ -0,0 +1,223 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+import threading
+
+from DiscreteTimeLib import DiscreteTimeSystem
+from DiscreteTimeLib.caching import (
+    ResponseCache,
+    array_key,
+    get_response_cache,
+    set_response_cache,
+    system_key,
+    use_response_cache,
+)
+
+from .utils import generate_random_system
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_freqz_cache(execution_id):
+    b, a = generate_random_system()
+    num = random.randint(2, 200)
+    H = DiscreteTimeSystem(b, a)
+
+    with use_response_cache(None):
+        freq_expected, w_expected = H.freqz((-np.pi, np.pi), num=num)
+
+    with use_response_cache(ResponseCache()) as cache:
+        freq, w = H.freqz((-np.pi, np.pi), num=num)
+        freq_cached, w_cached = H.freqz((-np.pi, np.pi), num=num)
+
+        # equal system shares entries
+        DiscreteTimeSystem(b.copy(), a.copy()).freqz((-np.pi, np.pi), num=num)
+
+    npt.assert_array_equal(freq, freq_expected)
+    npt.assert_array_equal(freq_cached, freq_expected)
+    npt.assert_array_equal(w_cached, w_expected)
+
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['entries'] == 1
+    assert stats['bytes'] == freq.nbytes
+
+def test_freqz_cache_keys():
+    H = DiscreteTimeSystem((1, 0.5), (1, -0.5))
+
+    with use_response_cache(ResponseCache()) as cache:
+        freq, _ = H.freqz((0, np.pi), num=64)
+        H.freqz((0, np.pi), num=65)
+        H.freqz((0, np.pi / 2), num=64)
+        H.freqz((0, np.pi), num=64, method='horner')
+        H.freqz((0, np.pi), num=64, dtype=np.complex128)
+
+        assert cache.stats()['misses'] == 5
+
+        # changing coefficients never returns stale responses
+        H.b[1] = 2
+        freq_changed, _ = H.freqz((0, np.pi), num=64)
+        assert not np.allclose(freq, freq_changed)
+
+        H.sos = H.to_sos()
+        H.freqz((0, np.pi), num=64)
+        assert cache.stats()['misses'] == 7
+
+        # cached responses are copied, so that callers may modify them
+        freq_changed[:] = 0
+        freq_cached, _ = H.freqz((0, np.pi), num=64)
+        assert not np.allclose(freq_cached, 0)
+
+def test_eval_cache():
+    H = DiscreteTimeSystem((1, 0.5), (1, -0.5))
+    z = np.exp(1j * np.linspace(0, np.pi, 50))
+
+    with use_response_cache(ResponseCache()) as cache:
+        val = H.eval(z)
+        npt.assert_array_equal(H.eval(z.copy()), val)
+        H.eval(z, dtype=np.complex128)
+        H.eval(z[::2])
+        H.eval(1j)
+
+        # horner evaluation of freqz is cached as frequency response only
+        H.freqz((0, np.pi), num=50, method='horner')
+
+    with use_response_cache(None):
+        npt.assert_array_equal(H.eval(z), val)
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 4
+    assert stats['entries'] == 4
+
+def test_cache_eviction():
+    H = DiscreteTimeSystem((1,), (1, -0.5))
+    cache = ResponseCache(max_entries=3)
+
+    with use_response_cache(cache):
+        for num in (10, 20, 30):
+            H.freqz((0, np.pi), num=num)
+
+        # least recently used entry is evicted
+        H.freqz((0, np.pi), num=10)
+        H.freqz((0, np.pi), num=40)
+        H.freqz((0, np.pi), num=10)
+        H.freqz((0, np.pi), num=20)
+
+    stats = cache.stats()
+    assert stats['entries'] == 3
+    assert stats['hits'] == 2
+    assert stats['evictions'] == 2
+
+    cache = ResponseCache(max_bytes=1000)
+    with use_response_cache(cache):
+        for num in (20, 20, 30, 40, 100):
+            H.freqz((0, np.pi), num=num, dtype=np.complex128)
+
+    # responses larger than limit are not cached
+    stats = cache.stats()
+    assert stats['bytes'] == 40 * 16
+    assert stats['entries'] == 1
+    assert stats['evictions'] == 2
+
+    cache = ResponseCache(max_entries=0)
+    with use_response_cache(cache):
+        H.freqz((0, np.pi), num=10)
+
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=-1)
+
+def test_cache_invalidate():
+    H = DiscreteTimeSystem((1,), (1, -0.5))
+    G = DiscreteTimeSystem((1,), (1, 0.5))
+    cache = ResponseCache()
+
+    with use_response_cache(cache):
+        for system in (H, G):
+            system.freqz((0, np.pi), num=10)
+            system.freqz((0, np.pi), num=20)
+
+        cache.invalidate(H)
+        assert len(cache) == 2
+
+        H.freqz((0, np.pi), num=10)
+        G.freqz((0, np.pi), num=10)
+
+        cache.invalidate()
+        assert len(cache) == 0
+        assert cache.stats()['bytes'] == 0
+
+    assert cache.stats()['hits'] == 1
+    cache.reset_stats()
+    assert cache.stats()['misses'] == 0
+
+def test_cache_threads():
+    systems = [
+        DiscreteTimeSystem(*generate_random_system()) for _ in range(8)
+    ]
+    cache = ResponseCache(max_entries=4)
+    errors = []
+
+    with use_response_cache(None):
+        expected = [H.freqz((0, np.pi), num=32)[0] for H in systems]
+
+    def worker():
+        for _ in range(50):
+            i = random.randrange(len(systems))
+            freq, _ = systems[i].freqz((0, np.pi), num=32)
+            if not np.allclose(freq, expected[i]):
+                errors.append(i)
+
+    with use_response_cache(cache):
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    stats = cache.stats()
+    assert len(errors) == 0
+    assert stats['entries'] <= 4
+    assert stats['hits'] + stats['misses'] == 200
+
+def test_cache_concurrent_insert():
+    H = DiscreteTimeSystem((1,), (1, -0.5))
+    cache = ResponseCache()
+
+    # same response inserted while it is computed, as by another thread
+    value = cache.get(
+        H,
+        ('ones',),
+        lambda: cache.get(H, ('ones',), lambda: np.ones(3)),
+    )
+
+    npt.assert_array_equal(value, np.ones(3))
+    assert len(cache) == 1
+    assert cache.stats()['bytes'] == 24
+
+def test_cache_keys():
+    H = DiscreteTimeSystem((1, 2), (1,))
+
+    assert system_key(H) == system_key(DiscreteTimeSystem((1, 2), (1,)))
+    assert system_key(H) != system_key(DiscreteTimeSystem((1.0, 2.0), (1,)))
+    assert system_key(H) != system_key(DiscreteTimeSystem((1,), (2, 1)))
+
+    assert array_key(np.array([1, 2], dtype=object)) == array_key(
+        np.array([1, 2], dtype=object)
+    )
+
+def test_set_response_cache():
+    # caching is disabled by default
+    assert get_response_cache() is None
+
+    cache = ResponseCache()
+    previous = set_response_cache(cache)
+
+    try:
+        assert get_response_cache() is cache
+    finally:
+        assert set_response_cache(previous) is cache
+
+    assert get_response_cache() is previous
\ No newline at end of file
@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+
+from DiscreteTimeLib.convolution import choose_conv_method, convolve
+
+@pytest.mark.parametrize('method', ['auto', 'direct', 'fft', 'overlap-add'])
+@pytest.mark.parametrize('execution_id', range(5))
+def test_convolve(method, execution_id):
+    x = np.random.rand(random.randint(1, 3000)) - 0.5
+    h = np.random.rand(random.randint(1, 300)) - 0.5
+
+    y = convolve(x, h, method=method)
+
+    npt.assert_allclose(y, np.convolve(x, h), atol=1e-10)
+
+@pytest.mark.parametrize('method', ['direct', 'fft', 'overlap-add'])
+def test_convolve_complex(method):
+    x = np.random.rand(500) + 1j * np.random.rand(500)
+    h = np.random.rand(50) - 1j * np.random.rand(50)
+
+    y = convolve(x, h, method=method)
+
+    npt.assert_allclose(y, np.convolve(x, h), atol=1e-10)
+
+@pytest.mark.parametrize('method', ['direct', 'fft', 'overlap-add'])
+def test_convolve_integer(method):
+    x = np.random.randint(-100, 100, size=500)
+    h = np.random.randint(-100, 100, size=50)
+
+    y = convolve(x, h, method=method)
+
+    assert np.issubdtype(y.dtype, np.integer)
+    npt.assert_array_equal(y, np.convolve(x, h))
+
+def test_convolve_error_method():
+    with pytest.raises(ValueError):
+        convolve(np.random.rand(10), np.random.rand(10), method='winograd')
+
+@pytest.mark.parametrize(
+    'n, m, expected_method',
+    [
+        [100, 8, 'direct'],
+        [1000, 256, 'direct'],
+        [10_000_000, 100, 'direct'],
+        [900, 900, 'direct'],
+        [10_000, 2048, 'fft'],
+        [4096, 4096, 'fft'],
+        [1_000_000, 10_000, 'overlap-add'],
+        [10_000, 1_000_000, 'overlap-add'],
+    ],
+)
+def test_choose_conv_method(n, m, expected_method):
+    assert choose_conv_method(n, m) == expected_method
+
+@pytest.mark.parametrize('method', ['auto', 'direct', 'fft', 'overlap-add'])
+def test_convolve_rows(method):
+    x = np.random.rand(random.randint(1, 8), random.randint(1, 3000))
+    h = np.random.rand(random.randint(1, 300))
+    h_rows = np.random.rand(np.shape(x)[0], random.randint(1, 300))
+
+    y = convolve(x, h, method=method)
+    y_reversed = convolve(h, x, method=method)
+    y_rows = convolve(x, h_rows, method=method)
+
+    for i in range(np.shape(x)[0]):
+        npt.assert_allclose(y[i], np.convolve(x[i], h), atol=1e-10)
+        npt.assert_allclose(y_reversed[i], np.convolve(x[i], h), atol=1e-10)
+        npt.assert_allclose(
+            y_rows[i],
+            np.convolve(x[i], h_rows[i]),
+            atol=1e-10,
+        )
@@ -0,0 +1,62 @@
+import pytest
+import subprocess
+import sys
+
+# maximum time in seconds to import DiscreteTimeLib, on top of NumPy
+IMPORT_TIME_BUDGET = 0.2
+
+def run_python(code):
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return result.stdout.split()
+
+def test_import_time():
+    code = '''
+import time
+import numpy
+start = time.perf_counter()
+import DiscreteTimeLib
+print(time.perf_counter() - start)
+'''
+    import_times = [float(run_python(code)[0]) for _ in range(3)]
+
+    assert min(import_times) < IMPORT_TIME_BUDGET
+
+@pytest.mark.parametrize(
+    'code, modules',
+    [
+        [
+            'import DiscreteTimeLib',
+            ('scipy', 'sympy', 'pandas'),
+        ],
+        [
+            'from DiscreteTimeLib import DiscreteTimeSignal\n'
+            'x_n = DiscreteTimeSignal(((0, 1), (1, 2)))\n'
+            'x_n * x_n + x_n',
+            ('scipy', 'sympy', 'pandas'),
+        ],
+        [
+            'from DiscreteTimeLib import DiscreteTimeSignal, DiscreteTimeSystem\n'
+            'x_n = DiscreteTimeSignal(((0, 1), (1, 2)))\n'
+            'H = DiscreteTimeSystem((1,), (1, -0.5))\n'
+            'H.filter(x_n)\n'
+            'H.stream().process(x_n)\n'
+            'H.impz((0, 10))\n'
+            'H.impz((0, 10), method=\'residue\')\n'
+            'H.freqz((-1, 1))',
+            ('sympy', 'pandas'),
+        ],
+    ],
+)
+def test_import_lazy(code, modules):
+    code += '''
+import sys
+print(' '.join(m for m in sys.modules if m.split('.')[0] in {modules}))
+'''.format(modules=repr(set(modules)))
+
+    assert run_python(code) == []
@@ -0,0 +1,231 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+
+from DiscreteTimeLib import DiscreteTimeSignal, DiscreteTimeSystem
+from DiscreteTimeLib.io import (
+    HEADER_SIZE,
+    SignalWriter,
+    load_signal,
+    save_signal,
+)
+
+from .utils import generate_random_dts, generate_random_system
+
+@pytest.mark.parametrize('mmap', [True, False])
+@pytest.mark.parametrize(
+    'dtype',
+    [np.float64, np.float32, np.complex128, np.int64],
+)
+def test_save_load(tmp_path, mmap, dtype):
+    start = random.randint(-100, 100)
+    values = (np.random.rand(random.randint(1, 1000)) * 100).astype(dtype)
+    x_n = DiscreteTimeSignal.from_dense(start, values)
+    path = tmp_path / 'signal.dtl'
+
+    x_n.save(path)
+    y_n = DiscreteTimeSignal.load(path, mmap=mmap)
+
+    assert path.stat().st_size == HEADER_SIZE + values.nbytes
+    assert isinstance(y_n._buffer, np.memmap) == mmap
+    assert y_n.dtype == dtype
+    assert y_n.min_idx == x_n.min_idx
+    assert y_n.max_idx == x_n.max_idx
+    npt.assert_array_equal(y_n.values(), values)
+
+def test_save_load_empty(tmp_path):
+    path = tmp_path / 'signal.dtl'
+
+    save_signal(DiscreteTimeSignal(), path)
+    x_n = load_signal(path)
+
+    assert len(x_n) == 0
+    assert x_n.dtype == np.float64
+
+@pytest.mark.parametrize('mmap', [True, False])
+@pytest.mark.parametrize(
+    'n_range',
+    [(-1000, 1000), (-5, 5), (3, 40), (-200, -100), (200, 300), (10, 5)],
+)
+def test_load_n_range(tmp_path, mmap, n_range):
+    x_n, _ = generate_random_dts(start_idx_range=(-20, 20))
+    path = tmp_path / 'signal.dtl'
+
+    x_n.save(path)
+    y_n = DiscreteTimeSignal.load(path, mmap=mmap, n_range=n_range)
+
+    expected_keys = [
+        n for n in x_n.keys() if n_range[0] <= n < n_range[1]
+    ]
+
+    npt.assert_array_equal(y_n.keys(), expected_keys)
+    for n in expected_keys:
+        assert y_n[n] == x_n[n]
+
+def test_load_n_range_error(tmp_path):
+    x_n, _ = generate_random_dts()
+    path = tmp_path / 'signal.dtl'
+
+    x_n.save(path)
+
+    with pytest.raises(ValueError):
+        load_signal(path, n_range=(16,))
+
+def test_save_mapped(tmp_path):
+    x_n, _ = generate_random_dts()
+    path = tmp_path / 'signal.dtl'
+
+    x_n.save(path)
+    y_n = DiscreteTimeSignal.load(path)
+    y_n.save(path)
+
+    assert DiscreteTimeSignal.load(path) == x_n
+    assert y_n == x_n
+    assert [p.name for p in tmp_path.iterdir()] == ['signal.dtl']
+
+def test_save_error(tmp_path):
+    x_n, _ = generate_random_dts()
+    path = tmp_path / 'signal.dtl'
+
+    x_n.save(path)
+
+    y_n = DiscreteTimeSignal.from_dense(0, np.array([1, 'a'], dtype=object))
+    with pytest.raises(OSError):
+        y_n.save(path)
+
+    assert DiscreteTimeSignal.load(path) == x_n
+    assert [p.name for p in tmp_path.iterdir()] == ['signal.dtl']
+
+def test_load_mode(tmp_path):
+    x_n, _ = generate_random_dts()
+    path = tmp_path / 'signal.dtl'
+
+    x_n.save(path)
+
+    y_n = load_signal(path)
+    with pytest.raises(ValueError):
+        y_n._buffer[0] = 1
+
+    y_n = load_signal(path, mode='c')
+    y_n._buffer[0] = x_n[x_n.min_idx] + 1
+
+    assert load_signal(path) == x_n
+
+    y_n = load_signal(path, mode='r+')
+    y_n._buffer[0] = x_n[x_n.min_idx] + 1
+    y_n._buffer.flush()
+
+    assert load_signal(path)[x_n.min_idx] == x_n[x_n.min_idx] + 1
+
+    x_n.save(path)
+    y_n = load_signal(path, mode='r+')
+    y_n *= 2
+    y_n += x_n
+    y_n._buffer.flush()
+
+    assert isinstance(y_n._buffer, np.memmap)
+    assert load_signal(path) == 3 * x_n
+
+    y_n = load_signal(path, mode='c')
+    y_n *= 2
+
+    assert load_signal(path) == 3 * x_n
+
+    # views keep parent writing to file, and copy on write themselves
+    x_n.save(path)
+    y_n = load_signal(path, mode='r+')
+    views = (y_n.window(0, 2), y_n.shift(1), y_n.reverse(), y_n.downsample(2))
+    y_n *= 2
+    y_n._buffer.flush()
+
+    assert load_signal(path) == 2 * x_n
+    assert views[1] == 2 * x_n.shift(1)
+
+    for view in views:
+        view += x_n
+
+    assert load_signal(path) == 2 * x_n
+
+    for mode in ('w+', 'readwrite', 'x'):
+        with pytest.raises(ValueError):
+            load_signal(path, mode=mode)
+
+    assert len(load_signal(path)) == len(x_n)
+
+def test_load_filter_mapped(tmp_path):
+    x_n, _ = generate_random_dts()
+    b, a = generate_random_system()
+    path = tmp_path / 'signal.dtl'
+
+    x_n.save(path)
+    y_n = load_signal(path)
+
+    H = DiscreteTimeSystem(b, a)
+
+    assert H.filter(y_n) == H.filter(x_n)
+    assert y_n * x_n == x_n * x_n
+    assert y_n + x_n == 2 * x_n
+
+@pytest.mark.parametrize(
+    'content',
+    [b'', b'NOTSIG' + bytes(100), b'DTLSIG\x07\x00' + bytes(100)],
+)
+def test_load_error(tmp_path, content):
+    path = tmp_path / 'signal.dtl'
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        load_signal(path)
+
+
+@pytest.mark.parametrize('dtype', [None, np.float64, np.complex128])
+def test_SignalWriter(tmp_path, dtype):
+    start = random.randint(-100, 100)
+    values = np.random.rand(random.randint(1, 1000))
+    path = tmp_path / 'signal.dtl'
+
+    with SignalWriter(path, start, dtype=dtype) as writer:
+        for chunk in np.array_split(values, random.randint(1, 10)):
+            writer.write(chunk)
+
+    x_n = load_signal(path)
+
+    assert x_n.dtype == (np.float64 if dtype is None else dtype)
+    assert x_n.min_idx == start
+    npt.assert_array_equal(x_n.values(), values)
+
+def test_SignalWriter_empty(tmp_path):
+    path = tmp_path / 'signal.dtl'
+
+    writer = SignalWriter(path, 5)
+    writer.close()
+    writer.close()
+
+    x_n = load_signal(path)
+
+    assert len(x_n) == 0
+    assert x_n.dtype == np.float64
+
+    writer = SignalWriter(tmp_path / 'discarded.dtl', 5)
+    writer.write(np.ones(3))
+    writer.discard()
+    writer.discard()
+
+    assert [p.name for p in tmp_path.iterdir()] == ['signal.dtl']
+
+def test_SignalWriter_invalid_chunk(tmp_path):
+    with SignalWriter(tmp_path / 'signal.dtl', 0) as writer:
+        writer.write(np.ones(3))
+
+        with pytest.raises(ValueError):
+            writer.write(np.ones((2, 2)))
+
+        with pytest.raises(TypeError):
+            writer.write(np.ones(3, dtype=np.complex128))
+
+    with SignalWriter(tmp_path / 'signal.dtl', 0, np.float32) as writer:
+        writer.write(np.ones(3, dtype=np.int8))
+
+        with pytest.raises(TypeError):
+            writer.write(np.ones(3))
\ No newline at end of file
@@ -0,0 +1,247 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+
+from DiscreteTimeLib import (
+    DiscreteTimeSignal,
+    DiscreteTimeSystem,
+    MultichannelDiscreteTimeSignal,
+)
+
+from .utils import (
+    generate_random_dts,
+    generate_random_multichannel_dts,
+    generate_random_scalar,
+    generate_random_system,
+)
+
+def test_MultichannelDiscreteTimeSignal_init():
+    X, signals = generate_random_multichannel_dts()
+
+    min_idx = min(sig.min_idx for sig in signals)
+    max_idx = max(sig.max_idx for sig in signals)
+
+    assert X.n_channels == len(signals)
+    assert X.min_idx == min_idx
+    assert X.max_idx == max_idx
+    assert len(X) == max_idx - min_idx + 1
+    assert X.dtype == np.float64
+    npt.assert_array_equal(X.keys(), np.arange(min_idx, max_idx + 1))
+
+    for n in range(min_idx - 1, max_idx + 2):
+        npt.assert_array_equal(X[n], [sig[n] for sig in signals])
+
+    for c, sig in enumerate(signals):
+        assert X.channel(c) == sig
+        npt.assert_array_equal(X.values()[c], X.channel(c).values())
+
+def test_MultichannelDiscreteTimeSignal_init_empty():
+    X = MultichannelDiscreteTimeSignal()
+
+    assert X.n_channels == 0
+    assert len(X) == 0
+    assert X.min_idx == float('inf')
+    assert X.max_idx == float('-inf')
+
+    X = MultichannelDiscreteTimeSignal(
+        (DiscreteTimeSignal(), DiscreteTimeSignal()),
+        dtype=np.complex128,
+    )
+
+    assert X.n_channels == 2
+    assert len(X) == 0
+    assert X.dtype == np.complex128
+
+def test_MultichannelDiscreteTimeSignal_from_dense():
+    start = random.randint(-100, 100)
+    values = np.random.rand(random.randint(1, 8), random.randint(10, 100))
+
+    X = MultichannelDiscreteTimeSignal.from_dense(start, values)
+
+    assert X.min_idx == start
+    assert X.max_idx == start + np.shape(values)[1] - 1
+    assert np.shares_memory(X._buffer, values)
+    npt.assert_array_equal(X.values(), values)
+    npt.assert_array_equal(X.to_dataframe().to_numpy(), values.T)
+
+@pytest.mark.parametrize(
+    'start, values',
+    [
+        [0, [0, 1, 2]],
+        [1.5, [[0, 1, 2]]],
+    ],
+)
+def test_MultichannelDiscreteTimeSignal_from_dense_error(start, values):
+    with pytest.raises(ValueError):
+        MultichannelDiscreteTimeSignal.from_dense(start, values)
+
+def test_MultichannelDiscreteTimeSignal_equality():
+    X, signals = generate_random_multichannel_dts()
+    Y = MultichannelDiscreteTimeSignal(signals)
+
+    assert X == Y
+    assert not X != Y
+
+    Y = MultichannelDiscreteTimeSignal(signals + [signals[0]])
+
+    assert X != Y
+    assert not X == Y
+
+    X = MultichannelDiscreteTimeSignal((signals[0], signals[0]))
+
+    assert X == signals[0]
+    assert signals[0] == X
+    assert not signals[0] != X
+
+    signals = [generate_random_dts()[0] for _ in range(2)]
+    X = MultichannelDiscreteTimeSignal(signals)
+
+    assert X != MultichannelDiscreteTimeSignal(signals[::-1])
+    assert X != 1
+    assert not X == 1
+
+def test_MultichannelDiscreteTimeSignal_equality_tolerance():
+    x_n = DiscreteTimeSignal.from_dense(-2, 1000 * np.random.rand(20) + 1000)
+    y_n = DiscreteTimeSignal.from_dense(-2, x_n.values() * (1 + 1e-7))
+    X = MultichannelDiscreteTimeSignal((x_n, x_n))
+
+    # values are compared relative to their magnitude, as single-channel
+    assert x_n == y_n
+    assert X == MultichannelDiscreteTimeSignal((y_n, y_n))
+    assert X == y_n
+    assert X != MultichannelDiscreteTimeSignal((2 * y_n, y_n))
+
+@pytest.mark.parametrize('op', ['add', 'sub'])
+@pytest.mark.parametrize('execution_id', range(5))
+def test_MultichannelDiscreteTimeSignal_element_wise(op, execution_id):
+    X, signals_x = generate_random_multichannel_dts()
+    signals_y = [generate_random_dts()[0] for _ in signals_x]
+    Y = MultichannelDiscreteTimeSignal(signals_y)
+
+    Z = X + Y if op == 'add' else X - Y
+
+    for c in range(X.n_channels):
+        if op == 'add':
+            assert Z.channel(c) == signals_x[c] + signals_y[c]
+        else:
+            assert Z.channel(c) == signals_x[c] - signals_y[c]
+
+@pytest.mark.parametrize('execution_id', range(5))
+def test_MultichannelDiscreteTimeSignal_element_wise_broadcast(execution_id):
+    X, signals = generate_random_multichannel_dts()
+    y_n, _ = generate_random_dts()
+
+    for Z, expected in (
+        (X + y_n, [sig + y_n for sig in signals]),
+        (y_n + X, [sig + y_n for sig in signals]),
+        (X - y_n, [sig - y_n for sig in signals]),
+        (y_n - X, [y_n - sig for sig in signals]),
+    ):
+        assert isinstance(Z, MultichannelDiscreteTimeSignal)
+        for c in range(X.n_channels):
+            assert Z.channel(c) == expected[c]
+
+def test_MultichannelDiscreteTimeSignal_element_wise_empty():
+    X = MultichannelDiscreteTimeSignal(
+        (DiscreteTimeSignal(), DiscreteTimeSignal())
+    )
+    y_n, _ = generate_random_dts()
+
+    Z = X + DiscreteTimeSignal()
+
+    assert Z.n_channels == 2
+    assert len(Z) == 0
+
+    Z = X - y_n
+
+    assert Z.channel(0) == -1 * y_n
+    assert Z.channel(1) == -1 * y_n
+
+def test_MultichannelDiscreteTimeSignal_element_wise_error():
+    X, _ = generate_random_multichannel_dts(num_channels_range=(2, 8))
+    Y, _ = generate_random_multichannel_dts(num_channels_range=(1, 1))
+
+    with pytest.raises(ValueError):
+        X + Y
+
+    with pytest.raises(ValueError):
+        X.element_wise_operation(X, op='mul')
+
+    with pytest.raises(TypeError):
+        X + 1
+
+    with pytest.raises(TypeError):
+        1 - X
+
+@pytest.mark.parametrize('execution_id', range(5))
+def test_MultichannelDiscreteTimeSignal_scalar_mul(execution_id):
+    X, signals = generate_random_multichannel_dts()
+    scalar = generate_random_scalar()
+
+    for Z in (X * scalar, scalar * X):
+        for c in range(X.n_channels):
+            assert Z.channel(c) == signals[c] * scalar
+
+@pytest.mark.parametrize('method', ['auto', 'direct', 'fft', 'overlap-add'])
+def test_MultichannelDiscreteTimeSignal_conv(method):
+    X, signals = generate_random_multichannel_dts()
+    h_n, _ = generate_random_dts()
+
+    Z = X.conv(h_n, method=method)
+
+    for c in range(X.n_channels):
+        if len(signals[c]) > 0:
+            assert Z.channel(c) == signals[c] * h_n
+
+    H = MultichannelDiscreteTimeSignal(
+        [generate_random_dts()[0] for _ in signals]
+    )
+
+    Z = X.conv(H, method=method)
+
+    for c in range(X.n_channels):
+        assert Z.channel(c) == signals[c] * H.channel(c)
+
+def test_MultichannelDiscreteTimeSignal_mul_conv():
+    X, signals = generate_random_multichannel_dts()
+    h_n, _ = generate_random_dts()
+
+    for Z in (X * h_n, h_n * X):
+        assert isinstance(Z, MultichannelDiscreteTimeSignal)
+        for c in range(X.n_channels):
+            assert Z.channel(c) == signals[c] * h_n
+
+def test_MultichannelDiscreteTimeSignal_conv_empty():
+    X, _ = generate_random_multichannel_dts()
+
+    Z = X * DiscreteTimeSignal()
+
+    assert Z.n_channels == X.n_channels
+    assert len(Z) == 0
+
+def test_MultichannelDiscreteTimeSignal_mul_error_type():
+    X, _ = generate_random_multichannel_dts()
+
+    with pytest.raises(TypeError):
+        X * np.zeros((4, 4))
+
+    x_n, _ = generate_random_dts()
+
+    with pytest.raises(TypeError):
+        x_n + 1
+
+@pytest.mark.parametrize('execution_id', range(5))
+def test_MultichannelDiscreteTimeSignal_filter(execution_id):
+    X, signals = generate_random_multichannel_dts()
+    b, a = generate_random_system()
+
+    H = DiscreteTimeSystem(b, a)
+    Y = H.filter(X)
+
+    assert isinstance(Y, MultichannelDiscreteTimeSignal)
+    assert Y.min_idx == X.min_idx
+    assert Y.max_idx == X.max_idx
+    for c in range(X.n_channels):
+        y_n = H.filter(X.channel(c))
+        npt.assert_allclose(Y.channel(c).values(), y_n.values())
@@ -0,0 +1,191 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+
+from DiscreteTimeLib import (
+    DiscreteTimeSignal,
+    DiscreteTimeSystem,
+    MultichannelDiscreteTimeSignal,
+    SparseDiscreteTimeSignal,
+    StreamingResampler,
+)
+from DiscreteTimeLib.multirate import (
+    decimate,
+    interpolate,
+    resample,
+    resampling_filter,
+)
+
+from .test_streaming import split_random
+from .utils import generate_random_dts
+
+def resample_naive(x_n, L, M, h):
+    # upsample over full upsampled range, filter, then downsample
+    start = x_n.min_idx * L
+    stop = (x_n.max_idx + 1) * L
+    v = np.zeros(stop - start)
+    v[::L] = x_n.values()
+    v = np.convolve(v, h)[: stop - start]
+
+    m_start = -(-start // M)
+    offset = m_start * M - start
+
+    return m_start, v[offset::M]
+
+@pytest.mark.parametrize('execution_id', range(20))
+def test_resample(execution_id):
+    x_n, _ = generate_random_dts()
+    L = random.randint(1, 6)
+    M = random.randint(1, 6)
+    h = np.random.rand(random.randint(1, 30)) - 0.5
+
+    H = DiscreteTimeSystem(h, (1,))
+    y_n = resample(x_n, L, M, system=H)
+    start, y_expected = resample_naive(x_n, L, M, h)
+
+    if len(y_expected) > 0:
+        assert y_n.min_idx == start
+    npt.assert_allclose(y_n.values(), y_expected, atol=1e-9)
+
+    assert H.resample(x_n, L, M) == y_n
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_decimate_interpolate(execution_id):
+    x_n, _ = generate_random_dts()
+    factor = random.randint(1, 5)
+    h = np.random.rand(random.randint(1, 20))
+    H = DiscreteTimeSystem(2 * h, (2,))
+
+    y_n = H.decimate(x_n, factor)
+    npt.assert_allclose(
+        y_n.values(),
+        H.filter(x_n).downsample(factor).values(),
+        atol=1e-9,
+    )
+    assert decimate(x_n, factor, system=H) == y_n
+
+    y_n = H.interpolate(x_n, factor)
+    y_expected = H.filter(
+        x_n.upsample(factor) + DiscreteTimeSignal.from_dense(
+            (x_n.max_idx + 1) * factor - 1,
+            np.zeros(1),
+        )
+    )
+    npt.assert_allclose(y_n.values(), y_expected.values(), atol=1e-9)
+    assert interpolate(x_n, factor, system=H) == y_n
+
+def test_resample_default_filter():
+    # 48 kHz to 16 kHz, keeping a 1 kHz tone and removing a 12 kHz tone
+    n = np.arange(4800)
+    tone = np.sin(2 * np.pi * 1000 / 48000 * n)
+    x_n = DiscreteTimeSignal.from_dense(
+        0,
+        tone + np.sin(2 * np.pi * 12000 / 48000 * n),
+    )
+
+    y_n = resample(x_n, 16000, 48000)
+    delay = 10
+
+    assert len(y_n) == 1600
+    npt.assert_allclose(
+        y_n.values()[100:-100],
+        tone[::3][100 - delay : -100 - delay],
+        atol=0.01,
+    )
+
+    y_n = decimate(x_n, 3)
+    assert len(y_n) == 1600
+
+    y_n = interpolate(x_n, 2)
+    assert len(y_n) == 9600
+
+    assert resample(x_n, 2, 2) == x_n
+
+    H = resampling_filter(3, 2, half_len=4)
+    assert len(H.b) == 2 * 4 * 3 + 1
+    npt.assert_allclose(np.sum(H.b), 3, rtol=1e-2)
+
+def test_resample_signal_types():
+    X = MultichannelDiscreteTimeSignal.from_dense(-3, np.random.rand(3, 40))
+    H = DiscreteTimeSystem(np.random.rand(7), (1,))
+
+    Y = H.resample(X, 2, 3)
+
+    assert isinstance(Y, MultichannelDiscreteTimeSignal)
+    for c in range(3):
+        assert Y.channel(c) == H.resample(X.channel(c), 2, 3)
+
+    x_n = SparseDiscreteTimeSignal(((0, 1), (50, 2)))
+    y_n = H.resample(x_n, 3, 2)
+
+    assert y_n == H.resample(x_n.to_dense(), 3, 2)
+    assert len(H.resample(DiscreteTimeSignal(), 3, 2)) == 0
+
+def test_resample_errors():
+    x_n = DiscreteTimeSignal.from_dense(0, np.ones(5))
+
+    for L, M in ((0, 1), (1, -1), (1.5, 2)):
+        with pytest.raises(ValueError):
+            resample(x_n, L, M)
+
+    with pytest.raises(ValueError):
+        DiscreteTimeSystem((1,), (1, -0.5)).decimate(x_n, 2)
+
+    with pytest.raises(ValueError):
+        DiscreteTimeSystem((1,), (0,)).decimate(x_n, 2)
+
+    H = DiscreteTimeSystem((2,), (2, 0))
+    assert H.decimate(x_n, 2) == x_n.downsample(2)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_StreamingResampler_process_values(execution_id):
+    x = np.random.rand(random.randint(10, 300)) - 0.5
+    L = random.randint(1, 5)
+    M = random.randint(1, 5)
+    H = DiscreteTimeSystem(np.random.rand(random.randint(1, 40)), (1,))
+
+    stream = H.stream_resample(L, M)
+    y = np.concatenate([stream(chunk) for chunk in split_random(x, (1, 20))])
+    y_expected = H.resample(DiscreteTimeSignal.from_dense(0, x), L, M)
+
+    npt.assert_allclose(y, y_expected.values(), atol=1e-9)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_StreamingResampler_process_signal(execution_id):
+    start = random.randint(-100, 100)
+    x = np.random.rand(random.randint(10, 300)) - 0.5
+    L = random.randint(1, 5)
+    M = random.randint(1, 5)
+
+    stream = StreamingResampler(L, M)
+
+    idx = start
+    y_chunks = []
+    for chunk in split_random(x, (1, 20)):
+        y_chunks.append(stream(DiscreteTimeSignal.from_dense(idx, chunk)))
+        idx += np.shape(chunk)[0]
+
+    y_n = DiscreteTimeSignal()
+    for y_chunk in y_chunks:
+        if len(y_chunk) > 0:
+            assert len(y_n) == 0 or y_chunk.min_idx == y_n.max_idx + 1
+        y_n += y_chunk
+
+    assert y_n == resample(DiscreteTimeSignal.from_dense(start, x), L, M)
+
+def test_StreamingResampler_errors():
+    stream = StreamingResampler(1, 2)
+    stream(DiscreteTimeSignal.from_dense(0, np.ones(4)))
+
+    assert len(stream(DiscreteTimeSignal())) == 0
+
+    with pytest.raises(ValueError):
+        stream(DiscreteTimeSignal.from_dense(5, np.ones(4)))
+
+    with pytest.raises(ValueError):
+        stream.process_values(np.ones((2, 2)))
+
+    stream.reset()
+    assert stream.history is None
+    assert stream.next_idx is None
\ No newline at end of file
@@ -0,0 +1,179 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+import tracemalloc
+
+from DiscreteTimeLib import DiscreteTimeSignal, DiscreteTimeSystem
+from DiscreteTimeLib.outofcore import (
+    conv_out_of_core,
+    filter_out_of_core,
+    iter_blocks,
+)
+
+from .utils import generate_random_dts, generate_random_system
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_iter_blocks_signal(tmp_path, execution_id):
+    x_n, _ = generate_random_dts(start_idx_range=(-20, 20))
+    block_size = random.randint(1, 10)
+    path = tmp_path / 'signal.dtl'
+    x_n.save(path)
+
+    for source in (x_n, path, str(path)):
+        blocks = list(iter_blocks(source, block_size))
+
+        assert all(len(values) <= block_size for _, values in blocks)
+        for idx, values in blocks:
+            npt.assert_array_equal(
+                values,
+                [x_n[n] for n in range(idx, idx + len(values))],
+            )
+
+        if len(x_n) > 0:
+            assert blocks[0][0] == x_n.min_idx
+            npt.assert_array_equal(
+                np.concatenate([values for _, values in blocks]),
+                x_n.values(),
+            )
+
+def test_iter_blocks_iterable():
+    chunks = [np.ones(3), np.zeros(0), np.arange(4)]
+    blocks = list(iter_blocks(chunks, start=-2))
+
+    assert [idx for idx, _ in blocks] == [-2, 1]
+
+    chunks = [
+        DiscreteTimeSignal.from_dense(5, np.ones(3)),
+        DiscreteTimeSignal(),
+        DiscreteTimeSignal.from_dense(8, np.ones(2)),
+    ]
+    blocks = list(iter_blocks(chunks))
+
+    assert [idx for idx, _ in blocks] == [5, 8]
+
+    chunks = [np.zeros(0), DiscreteTimeSignal.from_dense(5, np.arange(7))]
+    blocks = list(iter_blocks(chunks, block_size=3))
+
+    assert [idx for idx, _ in blocks] == [5, 8, 11]
+    npt.assert_array_equal(blocks[-1][1], [6])
+
+def test_iter_blocks_invalid():
+    with pytest.raises(ValueError):
+        list(iter_blocks(DiscreteTimeSignal(), block_size=0))
+
+    chunks = [
+        DiscreteTimeSignal.from_dense(5, np.ones(3)),
+        DiscreteTimeSignal.from_dense(9, np.ones(2)),
+    ]
+
+    with pytest.raises(ValueError):
+        list(iter_blocks(chunks))
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_filter_out_of_core(tmp_path, execution_id):
+    b, a = generate_random_system()
+    start = random.randint(-100, 100)
+    values = np.random.rand(random.randint(1, 500)) - 0.5
+    x_n = DiscreteTimeSignal.from_dense(start, values)
+    block_size = random.randint(1, 50)
+
+    H = DiscreteTimeSystem(b, a)
+    y_n = filter_out_of_core(H, x_n, tmp_path / 'y.dtl', block_size)
+    y_n_expected = H.filter(x_n)
+
+    assert isinstance(y_n._buffer, np.memmap)
+    assert y_n.min_idx == y_n_expected.min_idx
+    npt.assert_allclose(y_n.values(), y_n_expected.values())
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_conv_out_of_core(tmp_path, execution_id):
+    x_n, _ = generate_random_dts(start_idx_range=(-20, 20))
+    h_n, _ = generate_random_dts(start_idx_range=(-20, 20))
+    block_size = random.randint(1, 50)
+    path = tmp_path / 'x.dtl'
+    x_n.save(path)
+
+    y_n = conv_out_of_core(path, h_n, tmp_path / 'y.dtl', block_size)
+    y_n_expected = x_n * h_n
+
+    assert len(y_n) == len(y_n_expected)
+    npt.assert_array_equal(y_n.keys(), y_n_expected.keys())
+    npt.assert_allclose(y_n.values(), y_n_expected.values())
+
+@pytest.mark.parametrize('method', ['direct', 'fft', 'overlap-add'])
+def test_conv_out_of_core_chunks(tmp_path, method):
+    values = np.random.rand(1000)
+    h = np.random.rand(random.randint(1, 100))
+    chunks = np.array_split(values, random.randint(1, 20))
+
+    y_n = conv_out_of_core(
+        chunks,
+        DiscreteTimeSignal.from_dense(-3, h),
+        tmp_path / 'y.dtl',
+        start=10,
+        method=method,
+    )
+
+    assert y_n.min_idx == 7
+    npt.assert_allclose(y_n.values(), np.convolve(values, h))
+
+def test_out_of_core_same_sink(tmp_path):
+    x_n, _ = generate_random_dts()
+    h_n, _ = generate_random_dts()
+    H = DiscreteTimeSystem((1,), (1, -0.5))
+    path = tmp_path / 'x.dtl'
+    x_n.save(path)
+
+    y_n = filter_out_of_core(H, path, path, block_size=7)
+
+    assert y_n == H.filter(x_n)
+
+    y_n = conv_out_of_core(DiscreteTimeSignal.load(path), h_n, path)
+
+    assert y_n == H.filter(x_n) * h_n
+    assert [p.name for p in tmp_path.iterdir()] == ['x.dtl']
+
+def test_out_of_core_error(tmp_path):
+    x_n, _ = generate_random_dts()
+    H = DiscreteTimeSystem((1,), (1, -0.5))
+    path = tmp_path / 'y.dtl'
+    x_n.save(path)
+
+    # complex block after real blocks
+    chunks = [np.ones(3), np.ones(3, dtype=np.complex128)]
+
+    with pytest.raises(TypeError):
+        filter_out_of_core(H, chunks, path)
+
+    with pytest.raises(TypeError):
+        filter_out_of_core(H, 1, path)
+
+    assert DiscreteTimeSignal.load(path) == x_n
+    assert [p.name for p in tmp_path.iterdir()] == ['y.dtl']
+
+def test_out_of_core_empty(tmp_path):
+    H = DiscreteTimeSystem((1,), (1, -0.5))
+    x_n = DiscreteTimeSignal.from_dense(0, np.ones(10))
+
+    assert len(filter_out_of_core(H, [], tmp_path / 'y.dtl')) == 0
+    assert len(conv_out_of_core([], x_n, tmp_path / 'y.dtl')) == 0
+    assert len(conv_out_of_core(x_n, DiscreteTimeSignal(), tmp_path / 'y.dtl')) == 0
+
+def test_out_of_core_peak_memory(tmp_path):
+    n = 2_000_000
+    block_size = 10_000
+    path = tmp_path / 'x.dtl'
+    DiscreteTimeSignal.from_dense(0, np.random.rand(n)).save(path)
+
+    H = DiscreteTimeSystem((1, 0.5), (1, -0.5))
+    h_n = DiscreteTimeSignal.from_dense(0, np.random.rand(64))
+
+    tracemalloc.start()
+    filter_out_of_core(H, path, tmp_path / 'y.dtl', block_size)
+    conv_out_of_core(path, h_n, tmp_path / 'z.dtl', block_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # peak memory is bounded by block size rather than signal length
+    assert peak < 20 * block_size * 8
\ No newline at end of file
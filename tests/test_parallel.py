@@ -0,0 +1,102 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from DiscreteTimeLib import DiscreteTimeSystem
+from DiscreteTimeLib.parallel import filter_channels, filter_many
+
+from .utils import (
+    generate_random_dts,
+    generate_random_multichannel_dts,
+    generate_random_system,
+)
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+@pytest.mark.parametrize('chunksize', [1, 3, 100])
+def test_filter_many(executor, chunksize):
+    H = DiscreteTimeSystem(*generate_random_system())
+    signals = [generate_random_dts()[0] for _ in range(random.randint(1, 50))]
+
+    filtered = list(
+        filter_many(
+            H,
+            iter(signals),
+            executor=executor,
+            max_workers=2,
+            chunksize=chunksize,
+        )
+    )
+
+    assert len(filtered) == len(signals)
+    for x_n, y_n in zip(signals, filtered):
+        y_n_expected = H.filter(x_n)
+
+        npt.assert_array_equal(y_n.keys(), y_n_expected.keys())
+        npt.assert_allclose(y_n.values(), y_n_expected.values())
+
+def test_filter_many_method():
+    sos = np.random.rand(3, 6) - 0.5
+    sos[:, 3] = 1
+    H = DiscreteTimeSystem.from_sos(sos)
+    H.iztrans_func()
+    signals = [generate_random_dts()[0] for _ in range(10)]
+
+    filtered = list(H.filter_many(signals, executor='process', chunksize=4))
+
+    for x_n, y_n in zip(signals, filtered):
+        npt.assert_allclose(y_n.values(), H.filter(x_n).values())
+
+def test_filter_many_executor():
+    H = DiscreteTimeSystem(*generate_random_system())
+    signals = [generate_random_dts()[0] for _ in range(20)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        filtered = filter_many(H, signals, executor=executor, max_workers=1)
+        y_n = next(filtered)
+        filtered.close()
+
+        npt.assert_allclose(y_n.values(), H.filter(signals[0]).values())
+
+        filtered = list(filter_many(H, signals, executor=executor))
+        assert len(filtered) == 20
+
+def test_filter_many_error():
+    H = DiscreteTimeSystem(*generate_random_system())
+    signals = [generate_random_dts()[0] for _ in range(5)]
+
+    with pytest.raises(ValueError):
+        list(filter_many(H, signals, executor='gpu'))
+
+    with pytest.raises(ValueError):
+        list(filter_many(H, signals, chunksize=0))
+
+    with pytest.raises(ValueError):
+        filter_channels(H, generate_random_multichannel_dts()[0], chunksize=0)
+
+    assert list(filter_many(H, [])) == []
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+@pytest.mark.parametrize('chunksize', [None, 1, 3])
+def test_filter_channels(executor, chunksize):
+    H = DiscreteTimeSystem(*generate_random_system())
+    X, _ = generate_random_multichannel_dts()
+
+    Y = filter_channels(
+        H,
+        X,
+        executor=executor,
+        max_workers=2,
+        chunksize=chunksize,
+    )
+    Y_expected = H.filter(X)
+
+    assert Y.min_idx == Y_expected.min_idx
+    npt.assert_allclose(Y.values(), Y_expected.values())
+
+def test_filter_channels_empty():
+    H = DiscreteTimeSystem(*generate_random_system())
+    X, _ = generate_random_multichannel_dts(num_channels_range=(0, 0))
+
+    assert filter_channels(H, X).n_channels == 0
\ No newline at end of file
@@ -0,0 +1,137 @@
+import pytest
+import numpy as np
+import json
+import io
+
+from DiscreteTimeLib import (
+    DiscreteTimeSignal,
+    DiscreteTimeSystem,
+    SparseDiscreteTimeSignal,
+)
+from DiscreteTimeLib import profiling
+from DiscreteTimeLib.profiling import Profiler, profile, span
+
+from .utils import generate_random_dts
+
+def run_pipeline():
+    x_n, _ = generate_random_dts()
+    y_n, _ = generate_random_dts()
+    H = DiscreteTimeSystem((1, 0.5), (1, -0.5))
+
+    z_n = (x_n + y_n) - x_n * 2.0
+    z_n = H.filter(z_n * y_n)
+    H.filter(SparseDiscreteTimeSignal.from_signal(z_n))
+    z_n.values()
+    assert z_n == z_n
+    H.freqz((-np.pi, np.pi), num=16)
+    H.impz((-2, 5))
+    H.impz((-2, 5), method='residue')
+    H.impz((-2, 5), method='symbolic')
+    H.iztrans()
+
+    return x_n
+
+def test_profile():
+    with profile() as profiler:
+        assert profiling.get_profiler() is profiler
+        x_n = run_pipeline()
+
+    assert profiling.get_profiler() is None
+    snapshot = profiler.snapshot()
+
+    conv = snapshot['DiscreteTimeSignal.conv']
+    assert conv['calls'] == 1
+    assert conv['time'] > 0
+    assert conv['bytes'] > 0
+    assert set(conv['phases']) == {'compute', 'wrap result'}
+    assert conv['phases']['compute']['bytes'] == conv['bytes']
+
+    assert snapshot['DiscreteTimeSignal.element_wise_operation']['calls'] == 2
+    assert snapshot['DiscreteTimeSignal.scalar_mul']['bytes'] == len(x_n) * 8
+    assert set(snapshot['DiscreteTimeSystem.filter']['phases']) == {
+        'materialize',
+        'compute',
+        'wrap result',
+    }
+    assert set(snapshot['DiscreteTimeSystem.impz']['phases']) == {
+        'compute',
+        'substitute',
+    }
+    assert snapshot['DiscreteTimeSystem.iztrans']['calls'] == 2
+    assert snapshot['DiscreteTimeSystem.iztrans']['phases']['compute'][
+        'calls'
+    ] == 1
+    assert snapshot['DiscreteTimeSystem.freqz']['bytes'] > 0
+    assert 'parse' in snapshot['DiscreteTimeSignal.__init__']['phases']
+
+def test_profile_disabled():
+    profiler = Profiler()
+    profiling.enable(profiler)
+    profiling.disable()
+
+    run_pipeline()
+
+    assert profiler.snapshot() == {}
+    assert span('op') is span('op', 'phase')
+
+def test_profile_nested():
+    with profile() as outer:
+        DiscreteTimeSignal(((0, 1),)).values()
+
+        with profile() as inner:
+            DiscreteTimeSignal(((0, 1),)).values()
+
+        assert profiling.get_profiler() is outer
+
+        with profile(outer):
+            DiscreteTimeSignal(((0, 1),)).values()
+
+    assert outer.snapshot()['DiscreteTimeSignal.values']['calls'] == 2
+    assert inner.snapshot()['DiscreteTimeSignal.values']['calls'] == 1
+
+def test_Profiler_export(tmp_path):
+    profiler = Profiler()
+    with profile(profiler):
+        with span('pipeline', 'load') as s:
+            s.allocated(np.zeros(10))
+
+        with span('pipeline'):
+            pass
+
+    records = profiler.records()
+    assert records == [
+        {
+            'operation': 'pipeline',
+            'phase': None,
+            'calls': 1,
+            'time': records[0]['time'],
+            'bytes': 0,
+        },
+        {
+            'operation': 'pipeline',
+            'phase': 'load',
+            'calls': 1,
+            'time': records[1]['time'],
+            'bytes': 80,
+        },
+    ]
+
+    path = tmp_path / 'profile.json'
+    profiler.export(path)
+    buffer = io.StringIO()
+    profiler.export(buffer)
+
+    assert json.loads(path.read_text()) == profiler.snapshot()
+    assert json.loads(buffer.getvalue()) == profiler.snapshot()
+
+    profiler.reset()
+    assert profiler.records() == []
+
+def test_Profiler_phase_only():
+    with profile() as profiler:
+        with span('pipeline', 'load'):
+            pass
+
+    snapshot = profiler.snapshot()
+    assert snapshot['pipeline']['calls'] == 0
+    assert snapshot['pipeline']['phases']['load']['calls'] == 1
\ No newline at end of file
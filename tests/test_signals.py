@@ -4,14 +4,21 @@ import numpy.testing as npt
 import random
 
 from .utils import generate_random_scalar, generate_random_dts
-from DiscreteTimeLib import DiscreteTimeSignal
+from DiscreteTimeLib import (
+    DiscreteTimeSignal,
+    MultichannelDiscreteTimeSignal,
+    SparseDiscreteTimeSignal,
+)
 
 def test_DiscreteTimeSignal_init():
     x_n, data = generate_random_dts()
 
-    assert len(x_n) == np.shape(data)[0]
+    assert len(x_n) == data[-1][0] - data[0][0] + 1
+    assert x_n.min_idx == data[0][0]
+    assert x_n.max_idx == data[-1][0]
 
     assert x_n[data[0][0] - 1] == 0
+    assert x_n[data[-1][0] + 1] == 0
 
     for i in range(np.shape(data)[0]):
         npt.assert_almost_equal(x_n[data[i][0]], data[i][1])
@@ -30,6 +37,125 @@ def test_DiscreteTimeSignal_init_error_shape():
     with pytest.raises(ValueError):
         DiscreteTimeSignal(data)
 
+def test_DiscreteTimeSignal_init_empty():
+    x_n = DiscreteTimeSignal()
+
+    assert len(x_n) == 0
+    assert x_n.min_idx == float('inf')
+    assert x_n.max_idx == float('-inf')
+    assert np.shape(x_n.keys()) == (0,)
+    assert np.shape(x_n.values()) == (0,)
+
+def test_DiscreteTimeSignal_init_missing_samples():
+    data = ((-2, 1.5), (0, 2.5), (3, -4))
+    x_n = DiscreteTimeSignal(data)
+
+    npt.assert_array_equal(x_n.keys(), np.arange(-2, 4))
+    npt.assert_array_equal(x_n.values(), (1.5, 0, 2.5, 0, 0, -4))
+
+def test_DiscreteTimeSignal_init_error_duplicate_keys():
+    data = ((0, 1), (2, 3), (0, 4))
+
+    with pytest.raises(ValueError):
+        DiscreteTimeSignal(data)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_from_arrays(execution_id):
+    x_n, data = generate_random_dts()
+
+    keys = np.array([k for k, _ in data])
+    values = np.array([v for _, v in data])
+    order = np.random.permutation(np.shape(keys)[0])
+
+    y_n = DiscreteTimeSignal.from_arrays(keys[order], values[order])
+
+    assert y_n.min_idx == x_n.min_idx
+    assert y_n.max_idx == x_n.max_idx
+    npt.assert_array_equal(y_n.values(), x_n.values())
+
+def test_DiscreteTimeSignal_from_arrays_no_copy():
+    keys = np.arange(-5, 15)
+    values = np.random.rand(20)
+
+    x_n = DiscreteTimeSignal.from_arrays(keys, values)
+
+    assert x_n.min_idx == -5
+    assert x_n.max_idx == 14
+    assert np.shares_memory(x_n._buffer, values)
+
+def test_DiscreteTimeSignal_from_arrays_dtype():
+    x_n = DiscreteTimeSignal.from_arrays(
+        np.array([0.0, 1.0, 3.0]),
+        [1, 2, 3],
+        dtype=np.complex128,
+    )
+
+    assert x_n.dtype == np.complex128
+    npt.assert_array_equal(x_n.keys(), (0, 1, 2, 3))
+    npt.assert_array_equal(x_n.values(), (1, 2, 0, 3))
+
+    x_n = DiscreteTimeSignal.from_arrays([], [])
+
+    assert len(x_n) == 0
+
+@pytest.mark.parametrize(
+    'keys, values',
+    [
+        [[[0, 1], [2, 3]], [[0, 1], [2, 3]]],
+        [[0, 1, 2], [0, 1]],
+        [[0, 1.5, 2], [0, 1, 2]],
+        [[0, 2, 1, 2], [0, 1, 2, 3]],
+    ],
+)
+def test_DiscreteTimeSignal_from_arrays_error(keys, values):
+    with pytest.raises(ValueError):
+        DiscreteTimeSignal.from_arrays(keys, values)
+
+def test_DiscreteTimeSignal_from_dense():
+    start = random.randint(-100, 100)
+    values = np.random.rand(random.randint(10, 100))
+
+    x_n = DiscreteTimeSignal.from_dense(start, values)
+
+    assert x_n.min_idx == start
+    assert x_n.max_idx == start + np.shape(values)[0] - 1
+    assert np.shares_memory(x_n._buffer, values)
+    for i in range(np.shape(values)[0]):
+        assert x_n[start + i] == values[i]
+
+    x_n = DiscreteTimeSignal.from_dense(start, values, dtype=np.float32)
+
+    assert x_n.dtype == np.float32
+    assert not np.shares_memory(x_n._buffer, values)
+
+@pytest.mark.parametrize(
+    'start, values',
+    [
+        [0, [[0, 1], [2, 3]]],
+        [1.5, [0, 1, 2]],
+    ],
+)
+def test_DiscreteTimeSignal_from_dense_error(start, values):
+    with pytest.raises(ValueError):
+        DiscreteTimeSignal.from_dense(start, values)
+
+def test_DiscreteTimeSignal_to_dataframe():
+    x_n, data = generate_random_dts()
+
+    df = x_n.to_dataframe()
+
+    npt.assert_array_equal(df.index, x_n.keys())
+    npt.assert_array_equal(df['x[n]'], x_n.values())
+    npt.assert_array_equal(x_n.signal['x[n]'], x_n.values())
+
+def test_DiscreteTimeSignal_values_copy():
+    x_n, data = generate_random_dts()
+
+    values = x_n.values()
+    values[:] = 0
+
+    npt.assert_almost_equal(x_n[data[0][0]], data[0][1])
+
 def test_DiscreteTimeSignal_keys_values():
     x_n, data = generate_random_dts()
 
@@ -88,6 +214,78 @@ def test_DiscreteTimeSignal_inequality():
     assert y_n != x_n
     assert not y_n == x_n
 
+@pytest.mark.parametrize('block_size', [None, 1, 7, 1000])
+def test_DiscreteTimeSignal_allclose(block_size):
+    x_n, _ = generate_random_dts()
+    values = x_n.values() * (1 + 1e-7)
+    y_n = DiscreteTimeSignal.from_dense(x_n.min_idx, values)
+
+    assert x_n.allclose(y_n, block_size=block_size)
+    assert not x_n.allclose(y_n, rtol=1e-9, atol=0, block_size=block_size)
+
+    # padding with zeros within tolerance
+    values = np.concatenate(([1e-9], x_n.values(), [-1e-9]))
+    y_n = DiscreteTimeSignal.from_dense(x_n.min_idx - 1, values)
+
+    assert x_n.allclose(y_n, block_size=block_size)
+    assert y_n.allclose(x_n, block_size=block_size)
+    assert not x_n.allclose(y_n, atol=1e-10, block_size=block_size)
+
+@pytest.mark.parametrize('block_size', [None, 1, 7, 1000])
+def test_DiscreteTimeSignal_compare(block_size):
+    x_n, _ = generate_random_dts(start_idx_range=(-20, 20))
+    values = x_n.values()
+    y_n = DiscreteTimeSignal.from_dense(x_n.min_idx, values)
+
+    assert x_n.compare(y_n, block_size=block_size) == (None, 0.0)
+
+    mismatches = sorted(random.sample(range(len(x_n)), 2))
+    values = values.copy()
+    values[mismatches[0]] += 1
+    values[mismatches[1]] -= 50
+    y_n = DiscreteTimeSignal.from_dense(x_n.min_idx + 30, values)
+
+    x_shifted = DiscreteTimeSignal.from_dense(x_n.min_idx + 30, x_n.values())
+    first_mismatch, max_deviation = x_shifted.compare(
+        y_n,
+        block_size=block_size,
+    )
+
+    assert first_mismatch == x_n.min_idx + 30 + mismatches[0]
+    npt.assert_allclose(max_deviation, 50)
+
+    # compare against shifted signal covering a disjoint range
+    first_mismatch, max_deviation = x_n.compare(y_n, block_size=block_size)
+    expected_diff = np.abs(
+        np.concatenate((x_n.values(), np.zeros(30)))
+        - np.concatenate((np.zeros(30), y_n.values()))
+    )
+
+    assert first_mismatch == x_n.min_idx + np.argmax(expected_diff > 1e-5)
+    npt.assert_allclose(max_deviation, np.max(expected_diff))
+
+def test_DiscreteTimeSignal_compare_early_exit(monkeypatch):
+    from DiscreteTimeLib import signals
+
+    x_n = DiscreteTimeSignal.from_dense(0, np.zeros(1000))
+    y_n = DiscreteTimeSignal.from_dense(0, np.ones(1000))
+
+    n_blocks = []
+    window = signals._window
+    monkeypatch.setattr(
+        signals,
+        '_window',
+        lambda *args: n_blocks.append(1) or window(*args),
+    )
+
+    assert not x_n.allclose(y_n, block_size=10)
+    assert len(n_blocks) == 2
+
+    with pytest.raises(ValueError):
+        x_n.allclose(y_n, block_size=0)
+
+    assert DiscreteTimeSignal().compare(DiscreteTimeSignal()) == (None, 0.0)
+
 def test_DiscreteTimeSignal_sum_empty():
     x_n = DiscreteTimeSignal()
     y_n, data_y = generate_random_dts()
@@ -127,6 +325,13 @@ def test_DiscreteTimeSignal_sum(execution_id):
 
         npt.assert_almost_equal(sum_signal[n], x_k + y_k)
 
+def test_DiscreteTimeSignal_element_wise_operation_error():
+    x_n, data_x = generate_random_dts()
+    y_n, data_y = generate_random_dts()
+
+    with pytest.raises(ValueError):
+        x_n.element_wise_operation(y_n, op='mul')
+
 def test_DiscreteTimeSignal_sub_empty():
     x_n = DiscreteTimeSignal()
     y_n, data_y = generate_random_dts()
@@ -188,6 +393,12 @@ def test_DiscreteTimeSignal_scalar_mul(execution_id):
     for n in range(data_x[0][0], data_x[-1][0] + 1):
         npt.assert_almost_equal(scaled_signal[n], x_n[n] * scalar)
 
+def test_DiscreteTimeSignal_scalar_mul_empty():
+    x_n = DiscreteTimeSignal()
+    scalar = generate_random_scalar()
+
+    assert len(x_n * scalar) == 0
+
 def test_DiscreteTimeSignal_conv_empty():
     x_n = DiscreteTimeSignal()
     h_n, data_h = generate_random_dts()
@@ -228,4 +439,441 @@ def test_DiscreteTimeSignal_conv(execution_id):
 
             conv_sum += x_k * h_n_sub_k
 
-        npt.assert_almost_equal(conv_signal[n], conv_sum)
\ No newline at end of file
+        npt.assert_almost_equal(conv_signal[n], conv_sum)
+
+@pytest.mark.parametrize('method', ['direct', 'fft', 'overlap-add'])
+def test_DiscreteTimeSignal_conv_method(method):
+    x_n, data_x = generate_random_dts()
+    h_n, data_h = generate_random_dts()
+
+    conv_signal = x_n.conv(h_n, method=method)
+    expected = np.convolve(x_n.values(), h_n.values())
+
+    assert conv_signal.min_idx == x_n.min_idx + h_n.min_idx
+    assert conv_signal.max_idx == x_n.max_idx + h_n.max_idx
+    npt.assert_allclose(conv_signal.values(), expected, atol=1e-6)
+
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_inplace(execution_id):
+    x_n, _ = generate_random_dts()
+    y_n, _ = generate_random_dts()
+    scalar = generate_random_scalar()
+
+    for op, param, expected in (
+        ('__iadd__', y_n, x_n + y_n),
+        ('__isub__', y_n, x_n - y_n),
+        ('__imul__', scalar, x_n * scalar),
+        ('__imul__', y_n, x_n * y_n),
+    ):
+        z_n = x_n + DiscreteTimeSignal()
+        result = getattr(z_n, op)(param)
+
+        assert result is z_n
+        npt.assert_array_equal(z_n.keys(), expected.keys())
+        npt.assert_allclose(z_n.values(), expected.values())
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_out(execution_id):
+    x_n, _ = generate_random_dts()
+    y_n, _ = generate_random_dts()
+    out, _ = generate_random_dts()
+
+    for op, expected in (('add', x_n + y_n), ('sub', x_n - y_n)):
+        for out_n in (out, y_n + DiscreteTimeSignal()):
+            operand = y_n if out_n is out else out_n
+            result = x_n.element_wise_operation(operand, op=op, out=out_n)
+
+            assert result is out_n
+            npt.assert_array_equal(out_n.keys(), expected.keys())
+            npt.assert_allclose(out_n.values(), expected.values())
+
+    assert x_n.scalar_mul(3, out=out) is out
+    npt.assert_allclose(out.values(), 3 * x_n.values())
+
+def test_DiscreteTimeSignal_out_overlap():
+    x_n = DiscreteTimeSignal.from_dense(0, np.arange(10.0))
+    x_n += DiscreteTimeSignal()
+    y_n = DiscreteTimeSignal.from_dense(5, np.ones(10))
+
+    # signal backed by buffer of x_n
+    out = DiscreteTimeSignal._from_buffer(2, x_n._buffer)
+
+    x_n.element_wise_operation(y_n, op='sub', out=out)
+    npt.assert_allclose(
+        out.values(),
+        np.concatenate((np.arange(10.0), np.zeros(5)))
+        - np.concatenate((np.zeros(5), np.ones(10))),
+    )
+
+    x_n = DiscreteTimeSignal.from_dense(0, np.arange(10.0))
+    x_n += DiscreteTimeSignal()
+    out = DiscreteTimeSignal._from_buffer(2, x_n._buffer[::-1])
+
+    x_n.scalar_mul(2, out=out)
+    npt.assert_allclose(out.values(), 2 * np.arange(10.0))
+    assert out.min_idx == 0
+
+def test_DiscreteTimeSignal_inplace_amortized_growth():
+    acc = DiscreteTimeSignal()
+    n_storages = 0
+    storage = None
+
+    for i in range(1000):
+        acc += DiscreteTimeSignal.from_dense(i, np.ones(1))
+        acc += DiscreteTimeSignal.from_dense(-i, np.ones(1))
+        if acc._storage is not storage:
+            storage = acc._storage
+            n_storages += 1
+
+    expected = np.ones(1999)
+    expected[999] = 2
+
+    assert acc.min_idx == -999
+    assert acc.max_idx == 999
+    npt.assert_allclose(acc.values(), expected)
+    assert n_storages < 40
+
+def test_DiscreteTimeSignal_inplace_reuses_storage():
+    x_n = DiscreteTimeSignal.from_dense(0, np.ones(10)) + DiscreteTimeSignal()
+    storage = x_n._storage
+
+    for _ in range(10):
+        x_n += DiscreteTimeSignal.from_dense(3, np.ones(4))
+        x_n -= DiscreteTimeSignal.from_dense(3, np.ones(4))
+        x_n *= 2
+
+    assert x_n._storage is storage
+    npt.assert_allclose(x_n.values(), 1024 * np.ones(10))
+
+    # values outside kept range are zeroed when range expands into storage
+    out = DiscreteTimeSignal.from_dense(0, np.ones(10)) + DiscreteTimeSignal()
+    out.scalar_mul(1, out=out)
+    DiscreteTimeSignal.from_dense(3, np.ones(2)).scalar_mul(5, out=out)
+    out += DiscreteTimeSignal.from_dense(0, np.zeros(10))
+
+    npt.assert_allclose(out.values(), [0, 0, 0, 5, 5, 0, 0, 0, 0, 0])
+
+def test_DiscreteTimeSignal_inplace_shared(tmp_path):
+    values = np.ones(10)
+    x_n = DiscreteTimeSignal.from_dense(0, values)
+    x_n += DiscreteTimeSignal.from_dense(5, np.ones(10))
+    x_n *= 2
+
+    npt.assert_array_equal(values, np.ones(10))
+    npt.assert_allclose(x_n.values(), [2] * 5 + [4] * 5 + [2] * 5)
+
+    path = tmp_path / 'signal.dtl'
+    DiscreteTimeSignal.from_dense(0, np.ones(10)).save(path)
+    y_n = DiscreteTimeSignal.load(path)
+    y_n += y_n
+
+    npt.assert_allclose(y_n.values(), 2 * np.ones(10))
+    npt.assert_allclose(DiscreteTimeSignal.load(path).values(), np.ones(10))
+
+    X = MultichannelDiscreteTimeSignal.from_dense(0, np.ones((2, 10)))
+    z_n = X.channel(0)
+    z_n *= 3
+
+    npt.assert_allclose(z_n.values(), 3 * np.ones(10))
+    npt.assert_allclose(X.values(), np.ones((2, 10)))
+
+def test_DiscreteTimeSignal_inplace_dtype():
+    x_n = DiscreteTimeSignal.from_dense(0, np.ones(5))
+    x_n += DiscreteTimeSignal.from_dense(0, 1j * np.ones(5))
+    x_n *= 1j
+
+    assert x_n.dtype == np.complex128
+    npt.assert_allclose(x_n.values(), (1j - 1) * np.ones(5))
+
+def test_DiscreteTimeSignal_inplace_other_types():
+    x_n = DiscreteTimeSignal.from_dense(0, np.ones(5))
+    y_n = x_n
+
+    y_n += SparseDiscreteTimeSignal(((10, 1),))
+    assert y_n is not x_n
+    npt.assert_array_equal(y_n.values(), [1] * 5 + [0] * 5 + [1])
+
+    y_n = x_n
+    y_n -= SparseDiscreteTimeSignal(((10, 1),))
+    assert y_n is not x_n
+
+    y_n = x_n
+    y_n *= MultichannelDiscreteTimeSignal.from_dense(0, np.ones((2, 3)))
+    assert isinstance(y_n, MultichannelDiscreteTimeSignal)
+
+    npt.assert_array_equal(x_n.values(), np.ones(5))
+
+def test_DiscreteTimeSignal_inplace_empty():
+    x_n = DiscreteTimeSignal()
+    x_n += DiscreteTimeSignal()
+
+    assert len(x_n) == 0
+
+    x_n += DiscreteTimeSignal.from_dense(3, np.ones(2))
+    npt.assert_array_equal(x_n.keys(), [3, 4])
+
+    x_n -= DiscreteTimeSignal()
+    npt.assert_array_equal(x_n.keys(), [3, 4])
+
+    out = DiscreteTimeSignal.from_dense(0, np.ones(3))
+    DiscreteTimeSignal().element_wise_operation(DiscreteTimeSignal(), out=out)
+
+    assert len(out) == 0
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_window(execution_id):
+    x_n, _ = generate_random_dts()
+    start = random.randint(x_n.min_idx - 10, x_n.max_idx + 10)
+    stop = random.randint(start, x_n.max_idx + 20)
+
+    w_n = x_n.window(start, stop)
+
+    for n in range(start - 5, stop + 5):
+        expected = x_n[n] if start <= n < stop else 0
+        assert w_n[n] == expected
+
+    if len(w_n) > 0:
+        assert w_n.min_idx == max(start, x_n.min_idx)
+        assert w_n.max_idx == min(stop - 1, x_n.max_idx)
+        assert np.shares_memory(w_n._buffer, x_n._buffer)
+
+    assert x_n[start:stop] == w_n
+
+def test_DiscreteTimeSignal_window_slice():
+    x_n = DiscreteTimeSignal.from_dense(-2, np.arange(6.0))
+
+    npt.assert_array_equal(x_n[:].values(), x_n.values())
+    npt.assert_array_equal(x_n[:1].keys(), [-2, -1, 0])
+    npt.assert_array_equal(x_n[1:].values(), [3, 4, 5])
+    npt.assert_array_equal(x_n[0:2:1].values(), [2, 3])
+
+    assert len(x_n[10:20]) == 0
+    assert len(x_n[2:0]) == 0
+
+    with pytest.raises(ValueError):
+        x_n[0:4:2]
+
+def test_DiscreteTimeSignal_window_copy_on_write():
+    x_n = DiscreteTimeSignal.from_dense(0, np.arange(10.0))
+    x_n += DiscreteTimeSignal()
+    w_n = x_n[2:5]
+
+    w_n *= 2
+    npt.assert_array_equal(w_n.values(), [4, 6, 8])
+    npt.assert_array_equal(x_n.values(), np.arange(10.0))
+
+    w_n = x_n[2:5]
+    x_n += DiscreteTimeSignal.from_dense(3, np.ones(1))
+    npt.assert_array_equal(w_n.values(), [2, 3, 4])
+    npt.assert_array_equal(x_n[2:5].values(), [2, 4, 4])
+
+    # operations on windows read shared buffer without copying
+    w_n = x_n[2:5]
+    y_n = w_n + w_n
+    npt.assert_array_equal(y_n.values(), [4, 8, 8])
+    assert np.shares_memory(w_n._buffer, x_n._buffer)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_shift(execution_id):
+    x_n, _ = generate_random_dts()
+    k = random.randint(-50, 50)
+
+    y_n = x_n.shift(k)
+
+    assert y_n.min_idx == x_n.min_idx + k
+    for n in range(y_n.min_idx - 5, y_n.max_idx + 5):
+        assert y_n[n] == x_n[n - k]
+
+    assert np.shares_memory(y_n._buffer, x_n._buffer)
+    assert y_n.shift(-k) == x_n
+
+    with pytest.raises(ValueError):
+        x_n.shift(0.5)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_reverse(execution_id):
+    x_n, _ = generate_random_dts()
+
+    y_n = x_n.reverse()
+
+    assert y_n.min_idx == -x_n.max_idx
+    assert y_n.max_idx == -x_n.min_idx
+    for n in range(y_n.min_idx - 5, y_n.max_idx + 5):
+        assert y_n[n] == x_n[-n]
+
+    assert np.shares_memory(y_n._buffer, x_n._buffer)
+    assert y_n.reverse() == x_n
+    assert len(DiscreteTimeSignal().reverse()) == 0
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_downsample(execution_id):
+    x_n, _ = generate_random_dts()
+    M = random.randint(1, 10)
+
+    y_n = x_n.downsample(M)
+
+    for n in range(x_n.min_idx // M - 5, x_n.max_idx // M + 5):
+        assert y_n[n] == x_n[n * M]
+
+    assert y_n.min_idx * M >= x_n.min_idx
+    assert y_n.max_idx * M <= x_n.max_idx
+    assert np.shares_memory(y_n._buffer, x_n._buffer)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_upsample(execution_id):
+    x_n, _ = generate_random_dts()
+    L = random.randint(1, 10)
+
+    y_n = x_n.upsample(L)
+
+    assert y_n.min_idx == x_n.min_idx * L
+    assert y_n.max_idx == x_n.max_idx * L
+    for n in range(y_n.min_idx - 5, y_n.max_idx + 5):
+        expected = x_n[n // L] if n % L == 0 else 0
+        assert y_n[n] == expected
+
+    assert y_n.downsample(L) == x_n
+
+def test_DiscreteTimeSignal_rate_change_errors():
+    x_n = DiscreteTimeSignal.from_dense(0, np.ones(5))
+
+    for M in (0, -2, 1.5):
+        with pytest.raises(ValueError):
+            x_n.downsample(M)
+
+        with pytest.raises(ValueError):
+            x_n.upsample(M)
+
+    assert len(DiscreteTimeSignal().downsample(2)) == 0
+    assert len(DiscreteTimeSignal().upsample(2)) == 0
+
+def test_DiscreteTimeSignal_transform_views():
+    x_n = DiscreteTimeSignal.from_dense(-3, np.arange(7.0))
+    x_n += DiscreteTimeSignal()
+    y_n = x_n.reverse().downsample(2).shift(1)
+
+    npt.assert_array_equal(y_n.keys(), [0, 1, 2])
+    npt.assert_array_equal(y_n.values(), [5, 3, 1])
+
+    # strided views are copied before being modified in place
+    y_n += DiscreteTimeSignal.from_dense(0, np.ones(1))
+    npt.assert_array_equal(y_n.values(), [6, 3, 1])
+    npt.assert_array_equal(x_n.values(), np.arange(7.0))
+
+    x_n *= 2
+    npt.assert_array_equal(x_n.reverse().values(), 2 * np.arange(6.0, -1, -1))
+    npt.assert_allclose((x_n.reverse() * x_n).values(), np.convolve(
+        2 * np.arange(6.0, -1, -1),
+        2 * np.arange(7.0),
+    ))
+
+def xcorr_naive(x_n, y_n, lags):
+    return np.array([
+        sum(x_n[n + l] * np.conj(y_n[n]) for n in y_n.keys())
+        for l in lags
+    ])
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_xcorr(execution_id):
+    x_n, _ = generate_random_dts(start_idx_range=(-20, 20))
+    y_n, _ = generate_random_dts(start_idx_range=(-20, 20))
+
+    r_l = x_n.xcorr(y_n)
+
+    assert r_l.min_idx == x_n.min_idx - y_n.max_idx
+    assert r_l.max_idx == x_n.max_idx - y_n.min_idx
+    npt.assert_allclose(r_l.values(), xcorr_naive(x_n, y_n, r_l.keys()))
+
+    maxlag = random.randint(0, 30)
+    for method in ('auto', 'direct', 'fft', 'overlap-add'):
+        r_bounded = x_n.xcorr(y_n, maxlag=maxlag, method=method)
+        lags = np.arange(-maxlag, maxlag + 1)
+
+        assert r_bounded.min_idx >= -maxlag
+        assert r_bounded.max_idx <= maxlag
+        for l in lags:
+            npt.assert_allclose(r_bounded[l], r_l[l], atol=1e-6)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_xcorr_delay(execution_id):
+    x = np.random.rand(random.randint(300, 2000)) - 0.5
+    start = random.randint(-100, 100)
+    delay = random.randint(-50, 50)
+
+    x_n = DiscreteTimeSignal.from_dense(start, x)
+    y_n = DiscreteTimeSignal.from_dense(start + delay, x)
+
+    r_l = y_n.xcorr(x_n, maxlag=60)
+    assert r_l.keys()[np.argmax(r_l.values())] == delay
+
+    r_l = y_n.xcorr(x_n, maxlag=500)
+    assert r_l.keys()[np.argmax(r_l.values())] == delay
+
+def test_DiscreteTimeSignal_xcorr_complex():
+    x_n = DiscreteTimeSignal.from_dense(0, np.random.rand(50) + 1j)
+    y_n = DiscreteTimeSignal.from_dense(-4, np.random.rand(30) - 2j)
+
+    r_l = x_n.xcorr(y_n)
+    npt.assert_allclose(r_l.values(), xcorr_naive(x_n, y_n, r_l.keys()))
+
+    r_l = x_n.xcorr(y_n, maxlag=300, method='fft')
+    npt.assert_allclose(r_l.values(), xcorr_naive(x_n, y_n, r_l.keys()))
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSignal_xcorr_normalization(execution_id):
+    x_n, _ = generate_random_dts(start_idx_range=(-20, 20))
+    y_n, _ = generate_random_dts(start_idx_range=(-20, 20))
+
+    r_l = x_n.xcorr(y_n)
+    length = max(x_n.max_idx, y_n.max_idx) - min(x_n.min_idx, y_n.min_idx)
+    length += 1
+
+    npt.assert_allclose(
+        x_n.xcorr(y_n, normalization='biased').values(),
+        r_l.values() / length,
+    )
+    npt.assert_allclose(
+        x_n.xcorr(y_n, normalization='unbiased').values(),
+        r_l.values() / (length - np.abs(r_l.keys())),
+    )
+
+    r_coeff = x_n.xcorr(y_n, maxlag=5, normalization='coeff')
+    scale = np.sqrt(np.sum(x_n.values() ** 2) * np.sum(y_n.values() ** 2))
+    for l in r_coeff.keys():
+        npt.assert_allclose(r_coeff[l], r_l[l] / scale)
+
+def test_DiscreteTimeSignal_autocorr():
+    x_n = DiscreteTimeSignal.from_dense(5, np.random.rand(40) - 0.5)
+
+    r_l = x_n.autocorr(normalization='coeff')
+
+    npt.assert_array_equal(r_l.keys(), np.arange(-39, 40))
+    npt.assert_allclose(r_l[0], 1)
+    npt.assert_allclose(r_l.values(), r_l.values()[::-1])
+    assert np.all(np.abs(r_l.values()) <= 1 + 1e-12)
+
+    assert x_n.autocorr(maxlag=3) == x_n.xcorr(x_n, maxlag=3)
+
+def test_DiscreteTimeSignal_xcorr_errors():
+    x_n = DiscreteTimeSignal.from_dense(0, np.ones(5))
+    y_n = DiscreteTimeSignal.from_dense(100, np.ones(5))
+
+    with pytest.raises(ValueError):
+        x_n.xcorr(y_n, normalization='normal')
+
+    with pytest.raises(ValueError):
+        x_n.xcorr(y_n, method='naive')
+
+    for maxlag in (-1, 1.5):
+        with pytest.raises(ValueError):
+            x_n.xcorr(y_n, maxlag=maxlag)
+
+    with pytest.raises(ValueError):
+        DiscreteTimeSignal.from_dense(0, np.zeros(3)).autocorr(
+            normalization='coeff',
+        )
+
+    assert len(x_n.xcorr(y_n, maxlag=10)) == 0
+    assert len(x_n.xcorr(DiscreteTimeSignal())) == 0
+    assert len(x_n.xcorr(y_n)) == 9
\ No newline at end of file
@@ -0,0 +1,301 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+
+from DiscreteTimeLib import (
+    DiscreteTimeSignal,
+    DiscreteTimeSystem,
+    MultichannelDiscreteTimeSignal,
+    SparseDiscreteTimeSignal,
+)
+from DiscreteTimeLib import sparse
+
+from .utils import (
+    generate_random_dts,
+    generate_random_multichannel_dts,
+    generate_random_scalar,
+)
+
+def generate_random_sparse_dts(
+    num_values_range=(1, 20),
+    idx_range=(-10**9, 10**9),
+    values_range=(-1000.0, 1000.0),
+):
+    num_values = random.randint(*num_values_range)
+    keys = random.sample(range(*idx_range), num_values)
+    values = np.random.uniform(*values_range, size=num_values)
+
+    x_n = SparseDiscreteTimeSignal(tuple(zip(keys, values)))
+
+    return x_n, dict(zip(keys, values))
+
+def test_SparseDiscreteTimeSignal_init():
+    x_n, data = generate_random_sparse_dts()
+
+    assert x_n.nnz == len(data)
+    assert x_n.min_idx == min(data)
+    assert x_n.max_idx == max(data)
+    assert len(x_n) == max(data) - min(data) + 1
+    assert x_n.density == len(data) / len(x_n)
+    npt.assert_array_equal(x_n.keys(), sorted(data))
+    npt.assert_array_equal(x_n.values(), [data[k] for k in sorted(data)])
+
+    for k, v in data.items():
+        assert x_n[k] == v
+        if k + 1 not in data:
+            assert x_n[k + 1] == 0
+
+    assert x_n[max(data) + 1] == 0
+    npt.assert_array_equal(x_n.to_dataframe()['x[n]'], x_n.values())
+
+def test_SparseDiscreteTimeSignal_init_empty():
+    x_n = SparseDiscreteTimeSignal()
+
+    assert x_n.nnz == 0
+    assert len(x_n) == 0
+    assert x_n.density == 0
+    assert x_n.min_idx == float('inf')
+    assert x_n.max_idx == float('-inf')
+    assert x_n[0] == 0
+    assert len(x_n.to_dense()) == 0
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        np.random.rand(10),
+        np.random.rand(10, 3),
+        ((0, 1), (5, 2), (0, 3)),
+    ],
+)
+def test_SparseDiscreteTimeSignal_init_error(data):
+    with pytest.raises(ValueError):
+        SparseDiscreteTimeSignal(data)
+
+def test_SparseDiscreteTimeSignal_from_arrays():
+    x_n, data = generate_random_sparse_dts()
+
+    y_n = SparseDiscreteTimeSignal.from_arrays(
+        list(data.keys()),
+        list(data.values()),
+        dtype=np.complex128,
+    )
+
+    assert y_n.dtype == np.complex128
+    assert y_n == x_n
+
+@pytest.mark.parametrize(
+    'keys, values',
+    [
+        [[[0, 1], [2, 3]], [[0, 1], [2, 3]]],
+        [[0, 1, 2], [0, 1]],
+        [[0, 1.5, 2], [0, 1, 2]],
+        [[0, 2, 1, 2], [0, 1, 2, 3]],
+    ],
+)
+def test_SparseDiscreteTimeSignal_from_arrays_error(keys, values):
+    with pytest.raises(ValueError):
+        SparseDiscreteTimeSignal.from_arrays(keys, values)
+
+def test_SparseDiscreteTimeSignal_dense_conversion():
+    x_n, data = generate_random_dts()
+
+    x_sparse = SparseDiscreteTimeSignal.from_signal(x_n)
+
+    assert SparseDiscreteTimeSignal.from_signal(x_sparse) is x_sparse
+    assert x_sparse.nnz == np.count_nonzero(x_n.values())
+    assert x_sparse == x_n
+    assert x_n == x_sparse
+    assert x_sparse.to_dense() == x_n
+
+@pytest.mark.parametrize('op', ['add', 'sub'])
+@pytest.mark.parametrize('execution_id', range(5))
+def test_SparseDiscreteTimeSignal_element_wise(op, execution_id):
+    x_n, data_x = generate_random_sparse_dts()
+    y_n, data_y = generate_random_sparse_dts()
+
+    z_n = x_n + y_n if op == 'add' else x_n - y_n
+
+    assert isinstance(z_n, SparseDiscreteTimeSignal)
+    assert z_n.nnz == len(set(data_x) | set(data_y))
+    for k in set(data_x) | set(data_y):
+        x_k = data_x.get(k, 0.0)
+        y_k = data_y.get(k, 0.0)
+        npt.assert_almost_equal(z_n[k], x_k + y_k if op == 'add' else x_k - y_k)
+
+@pytest.mark.parametrize('execution_id', range(5))
+def test_SparseDiscreteTimeSignal_element_wise_dense(execution_id):
+    # overlapping signals, so that results are dense
+    x_n, _ = generate_random_dts(start_idx_range=(-5, 5))
+    y_n, _ = generate_random_dts(start_idx_range=(-5, 5))
+    x_sparse = SparseDiscreteTimeSignal.from_signal(x_n)
+
+    for z_n, expected in (
+        (x_sparse + y_n, x_n + y_n),
+        (y_n + x_sparse, x_n + y_n),
+        (x_sparse - y_n, x_n - y_n),
+        (y_n - x_sparse, y_n - x_n),
+    ):
+        assert isinstance(z_n, DiscreteTimeSignal)
+        assert z_n == expected
+
+def test_SparseDiscreteTimeSignal_density_threshold():
+    x_n = SparseDiscreteTimeSignal(((0, 1), (20, 2)))
+    y_n = SparseDiscreteTimeSignal(((5, 3),))
+
+    assert isinstance(x_n + y_n, SparseDiscreteTimeSignal)
+
+    y_n = SparseDiscreteTimeSignal(((1, 3), (2, 4), (3, 5), (4, 6)))
+
+    z_n = x_n + y_n
+
+    assert isinstance(z_n, DiscreteTimeSignal)
+    npt.assert_array_equal(z_n.keys(), np.arange(21))
+    npt.assert_array_equal(z_n.values()[:6], (1, 3, 4, 5, 6, 0))
+    assert z_n[20] == 2
+
+def test_SparseDiscreteTimeSignal_element_wise_error():
+    x_n, _ = generate_random_sparse_dts()
+
+    with pytest.raises(ValueError):
+        x_n.element_wise_operation(x_n, op='mul')
+
+def test_SparseDiscreteTimeSignal_equality():
+    x_n, data = generate_random_sparse_dts()
+    y_n = SparseDiscreteTimeSignal(tuple(data.items()))
+
+    assert x_n == y_n
+    assert not x_n != y_n
+
+    data[max(data) + 1] = 1.0
+    y_n = SparseDiscreteTimeSignal(tuple(data.items()))
+
+    assert x_n != y_n
+    assert not x_n == y_n
+    assert SparseDiscreteTimeSignal() == SparseDiscreteTimeSignal()
+
+def test_SparseDiscreteTimeSignal_equality_tolerance():
+    x = 1000 * np.random.rand(20) + 1000
+    x_n = DiscreteTimeSignal.from_dense(-2, x)
+    y_n = DiscreteTimeSignal.from_dense(-2, x * (1 + 1e-7))
+
+    # values are compared relative to their magnitude, as dense signals
+    assert x_n == y_n
+    assert SparseDiscreteTimeSignal.from_signal(x_n) == y_n
+    assert SparseDiscreteTimeSignal.from_signal(x_n) != 2 * y_n
+
+@pytest.mark.parametrize('execution_id', range(5))
+def test_SparseDiscreteTimeSignal_scalar_mul(execution_id):
+    x_n, data = generate_random_sparse_dts()
+    scalar = generate_random_scalar()
+
+    for z_n in (x_n * scalar, scalar * x_n):
+        assert isinstance(z_n, SparseDiscreteTimeSignal)
+        for k, v in data.items():
+            npt.assert_almost_equal(z_n[k], v * scalar)
+
+@pytest.mark.parametrize('execution_id', range(5))
+def test_SparseDiscreteTimeSignal_conv(execution_id):
+    # several samples, so that results are sparse
+    x_n, data_x = generate_random_sparse_dts(num_values_range=(2, 20))
+    h_n, data_h = generate_random_sparse_dts()
+
+    conv_signal = x_n * h_n
+
+    expected = {}
+    for k_x, v_x in data_x.items():
+        for k_h, v_h in data_h.items():
+            expected[k_x + k_h] = expected.get(k_x + k_h, 0) + v_x * v_h
+
+    assert isinstance(conv_signal, SparseDiscreteTimeSignal)
+    assert conv_signal.nnz == len(expected)
+    for k, v in expected.items():
+        npt.assert_almost_equal(conv_signal[k], v)
+
+def test_SparseDiscreteTimeSignal_conv_blocks(monkeypatch):
+    monkeypatch.setattr(sparse, 'CONV_BLOCK_PAIRS', 3)
+
+    x_n, data_x = generate_random_sparse_dts(num_values_range=(5, 20))
+    h_n, data_h = generate_random_sparse_dts(num_values_range=(5, 20))
+
+    conv_signal = x_n * h_n
+
+    expected = {}
+    for k_x, v_x in data_x.items():
+        for k_h, v_h in data_h.items():
+            expected[k_x + k_h] = expected.get(k_x + k_h, 0) + v_x * v_h
+
+    assert conv_signal.nnz == len(expected)
+    for k, v in expected.items():
+        npt.assert_almost_equal(conv_signal[k], v)
+
+@pytest.mark.parametrize('execution_id', range(5))
+def test_SparseDiscreteTimeSignal_conv_dense(execution_id):
+    x_n, _ = generate_random_dts()
+    h_n, _ = generate_random_dts()
+    x_sparse = SparseDiscreteTimeSignal.from_signal(x_n)
+
+    for conv_signal in (x_sparse * h_n, h_n * x_sparse):
+        assert isinstance(conv_signal, DiscreteTimeSignal)
+        assert conv_signal == x_n * h_n
+
+def test_SparseDiscreteTimeSignal_conv_complex():
+    x_n = SparseDiscreteTimeSignal(((0, 1j), (100, 2)), dtype=np.complex128)
+    h_n = SparseDiscreteTimeSignal(((0, 1), (100, 1j)), dtype=np.complex128)
+
+    conv_signal = x_n * h_n
+
+    assert conv_signal == SparseDiscreteTimeSignal(
+        ((0, 1j), (100, 1), (200, 2j)),
+        dtype=np.complex128,
+    )
+
+def test_SparseDiscreteTimeSignal_conv_empty():
+    x_n, _ = generate_random_sparse_dts()
+
+    assert (x_n * SparseDiscreteTimeSignal()).nnz == 0
+    assert (x_n * DiscreteTimeSignal()).nnz == 0
+
+def test_SparseDiscreteTimeSignal_mul_error_type():
+    x_n, _ = generate_random_sparse_dts()
+
+    with pytest.raises(TypeError):
+        x_n * np.zeros((4, 4))
+
+    X, _ = generate_random_multichannel_dts()
+
+    for operation in (
+        lambda: x_n + X,
+        lambda: X + x_n,
+        lambda: x_n * X,
+        lambda: X * x_n,
+        lambda: SparseDiscreteTimeSignal.from_signal(X),
+    ):
+        with pytest.raises(TypeError):
+            operation()
+
+    assert x_n != X
+    assert X != x_n
+    assert x_n != 1
+
+def test_SparseDiscreteTimeSignal_filter():
+    x_n, _ = generate_random_dts()
+    b = np.random.rand(3)
+    a = np.array((1, 0.5))
+
+    H = DiscreteTimeSystem(b, a)
+    y_n = H.filter(SparseDiscreteTimeSignal.from_signal(x_n))
+
+    assert isinstance(y_n, DiscreteTimeSignal)
+    assert y_n == H.filter(x_n)
+
+def test_SparseDiscreteTimeSignal_huge_range():
+    x_n = SparseDiscreteTimeSignal(((0, 1), (10**12, 2)))
+
+    y_n = x_n * x_n + x_n - 2 * x_n
+
+    assert isinstance(y_n, SparseDiscreteTimeSignal)
+    assert y_n.nnz == 3
+    npt.assert_array_equal(y_n.keys(), (0, 10**12, 2 * 10**12))
+    npt.assert_array_equal(y_n.values(), (0, 2, 4))
+    assert sparse.DENSITY_THRESHOLD < 1
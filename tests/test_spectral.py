@@ -0,0 +1,149 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+
+from DiscreteTimeLib import DiscreteTimeSignal, DiscreteTimeSystem
+from DiscreteTimeLib.spectral import frequencies, spectrum, stft
+
+from .utils import generate_random_dts
+
+def dtft_naive(x_n, w):
+    return np.array([
+        np.sum(x_n.values() * np.exp(-1j * w_k * x_n.keys())) for w_k in w
+    ])
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_spectrum(execution_id):
+    x_n, _ = generate_random_dts(start_idx_range=(-1000, 1000))
+    n_fft = random.choice((None, random.randint(1, 300)))
+
+    X, w = x_n.spectrum(n_fft=n_fft, onesided=False)
+
+    assert X.shape == w.shape == (n_fft or len(x_n),)
+    npt.assert_allclose(X, dtft_naive(x_n, w), atol=1e-6)
+
+    X_onesided, w_onesided = x_n.spectrum(n_fft=n_fft)
+
+    assert w_onesided.shape == ((n_fft or len(x_n)) // 2 + 1,)
+    npt.assert_allclose(w_onesided, w[: w_onesided.shape[0]])
+    npt.assert_allclose(X_onesided, X[: w_onesided.shape[0]], atol=1e-6)
+
+def test_spectrum_wrapped():
+    x_n = DiscreteTimeSignal.from_dense(-7, np.random.rand(100))
+
+    X, w = x_n.spectrum(n_fft=16, onesided=False)
+    npt.assert_allclose(X, dtft_naive(x_n, w), atol=1e-9)
+
+def test_spectrum_system():
+    # spectrum of impulse response matches frequency response of FIR system
+    b = np.random.rand(20)
+    H = DiscreteTimeSystem(b, (1,))
+    h_n = DiscreteTimeSignal.from_dense(0, b)
+
+    X, w = h_n.spectrum(n_fft=64, onesided=False)
+    freq, _ = H.freqz((0, 2 * np.pi * 63 / 64), num=64)
+
+    npt.assert_allclose(X, freq.astype(np.complex128))
+
+def test_spectrum_large_index():
+    values = np.random.rand(16) + 1j * np.random.rand(16)
+    start = 10**12 + 3
+    x_n = DiscreteTimeSignal.from_dense(start, values)
+    y_n = DiscreteTimeSignal.from_dense(3, values)
+
+    X, w = x_n.spectrum(n_fft=32)
+    Y, _ = y_n.spectrum(n_fft=32)
+
+    # 10**12 is a multiple of 32, so spectra match
+    assert X.shape == (32,)
+    npt.assert_allclose(X, Y, atol=1e-9)
+
+def test_spectrum_errors():
+    x_n = DiscreteTimeSignal.from_dense(0, np.ones(4))
+
+    for n_fft in (0, -4, 2.5):
+        with pytest.raises(ValueError):
+            spectrum(x_n, n_fft=n_fft)
+
+    X, w = spectrum(DiscreteTimeSignal())
+    npt.assert_array_equal(X, [0])
+    npt.assert_array_equal(frequencies(4), [0, np.pi / 2, np.pi, 3 * np.pi / 2])
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_stft(execution_id):
+    x_n, _ = generate_random_dts(num_values_range=(50, 500))
+    window_length = random.randint(1, 50)
+    hop = random.randint(1, 30)
+    n_fft = window_length + random.randint(0, 20)
+    window = np.random.rand(window_length)
+
+    frames = list(
+        stft(
+            x_n,
+            window_length,
+            hop=hop,
+            window=window,
+            n_fft=n_fft,
+            block_size=random.randint(1, 10),
+        )
+    )
+
+    assert len(frames) == (len(x_n) - window_length) // hop + 1
+    for i, (n, X) in enumerate(frames):
+        assert n == x_n.min_idx + i * hop
+
+        frame = DiscreteTimeSignal.from_dense(
+            n,
+            x_n.window(n, n + window_length).values() * window,
+        )
+        X_expected, _ = frame.spectrum(n_fft=n_fft)
+        npt.assert_allclose(X, X_expected, atol=1e-6)
+
+def test_stft_windows():
+    x_n = DiscreteTimeSignal.from_dense(-5, np.random.rand(100) + 1j)
+
+    frames = list(x_n.stft(16))
+    assert len(frames) == 11
+    assert frames[0][1].shape == (16,)
+
+    hann = np.hanning(17)[:16]
+    frames_hann = list(x_n.stft(16, window=hann))
+    for (n, X), (_, X_hann) in zip(frames, frames_hann):
+        npt.assert_allclose(X, X_hann)
+
+    frames = list(x_n.stft(16, window=('kaiser', 5.0), n_fft=32, hop=16))
+    assert len(frames) == 6
+    assert frames[0][1].shape == (32,)
+
+    frames_rect = list(x_n.stft(16, window=None))
+    frames_ones = list(x_n.stft(16, window=np.ones(16)))
+    for (n, X), (_, X_ones) in zip(frames_rect, frames_ones):
+        npt.assert_allclose(X, X_ones)
+
+    assert len(list(x_n.stft(101))) == 0
+
+def test_stft_lazy():
+    # frames of long signal are yielded one at a time
+    x_n = DiscreteTimeSignal.from_dense(0, np.zeros(10**7))
+    frames = x_n.stft(1024, hop=1024)
+
+    n, X = next(frames)
+    assert n == 0
+    assert X.shape == (513,)
+
+    n, _ = next(frames)
+    assert n == 1024
+
+def test_stft_errors():
+    x_n = DiscreteTimeSignal.from_dense(0, np.ones(10))
+
+    for kwargs in (
+        {'window_length': 0},
+        {'window_length': 4, 'hop': 0},
+        {'window_length': 4, 'n_fft': 2},
+        {'window_length': 4, 'window': np.ones(3)},
+        {'window_length': 4, 'block_size': 0},
+    ):
+        with pytest.raises(ValueError):
+            stft(x_n, **kwargs)
\ No newline at end of file
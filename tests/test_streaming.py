@@ -0,0 +1,141 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import random
+
+from DiscreteTimeLib import DiscreteTimeSignal, DiscreteTimeSystem
+
+from .utils import generate_random_system
+
+def split_random(values, num_chunks_range=(1, 10)):
+    num_chunks = random.randint(*num_chunks_range)
+    splits = np.sort(
+        np.random.randint(0, np.shape(values)[0] + 1, size=num_chunks - 1)
+    )
+
+    return np.split(values, splits)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_StreamingFilter_process_values(execution_id):
+    b, a = generate_random_system()
+    x = np.random.rand(random.randint(10, 200)) - 0.5
+
+    H = DiscreteTimeSystem(b, a)
+    stream = H.stream()
+
+    y = np.concatenate([stream.process(chunk) for chunk in split_random(x)])
+    y_expected = H.filter(DiscreteTimeSignal.from_dense(0, x)).values()
+
+    npt.assert_allclose(y, y_expected)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_StreamingFilter_process_signal(execution_id):
+    b, a = generate_random_system()
+    start = random.randint(-100, 100)
+    x = np.random.rand(random.randint(10, 200)) - 0.5
+
+    H = DiscreteTimeSystem(b, a)
+    stream = H.stream()
+
+    idx = start
+    y_chunks = []
+    for chunk in split_random(x):
+        y_chunk = stream(DiscreteTimeSignal.from_dense(idx, chunk))
+        assert len(y_chunk) == np.shape(chunk)[0]
+        if np.shape(chunk)[0] > 0:
+            assert y_chunk.min_idx == idx
+
+        idx += np.shape(chunk)[0]
+        y_chunks.append(y_chunk.values())
+
+    y_n = H.filter(DiscreteTimeSignal.from_dense(start, x))
+
+    assert stream.next_idx == y_n.max_idx + 1
+    npt.assert_allclose(np.concatenate(y_chunks), y_n.values())
+
+def test_StreamingFilter_reset():
+    b, a = generate_random_system()
+    x = np.random.rand(50)
+
+    H = DiscreteTimeSystem(b, a)
+    stream = H.stream()
+
+    y_first = stream.process(x)
+    stream.process(x)
+    stream.reset()
+    y_reset = stream.process(x)
+
+    npt.assert_allclose(y_reset, y_first)
+
+def test_StreamingFilter_complex():
+    b, a = generate_random_system()
+    x = np.random.rand(50) + 1j * np.random.rand(50)
+
+    H = DiscreteTimeSystem(b, a)
+    stream = H.stream()
+
+    y = np.concatenate(
+        [stream.process(x[:20].real), stream.process(x[20:])]
+    )
+    x[:20] = x[:20].real
+    y_expected = H.filter(DiscreteTimeSignal.from_dense(0, x)).values()
+
+    assert np.iscomplexobj(y)
+    npt.assert_allclose(y, y_expected)
+
+def test_StreamingFilter_gain():
+    H = DiscreteTimeSystem((3,), (2,))
+    stream = H.stream()
+
+    npt.assert_allclose(stream.process(np.ones(4)), 1.5 * np.ones(4))
+
+def test_StreamingFilter_empty():
+    b, a = generate_random_system()
+    x = np.random.rand(50)
+
+    H = DiscreteTimeSystem(b, a)
+    stream = H.stream()
+
+    assert np.shape(stream.process(np.zeros(0))) == (0,)
+    assert len(stream.process(DiscreteTimeSignal())) == 0
+    assert stream.zi is None
+
+    npt.assert_allclose(
+        stream.process(x),
+        H.filter(DiscreteTimeSignal.from_dense(0, x)).values(),
+    )
+
+    # empty chunks have same data type as filtered chunks
+    stream = DiscreteTimeSystem((1, 1), (1,)).stream()
+    for chunk in (np.zeros(0, dtype=int), np.arange(5)):
+        assert stream.process(chunk).dtype == np.float64
+
+def test_StreamingFilter_error():
+    b, a = generate_random_system()
+
+    H = DiscreteTimeSystem(b, a)
+    stream = H.stream()
+
+    with pytest.raises(ValueError):
+        stream.process(np.random.rand(4, 4))
+
+    stream.process(DiscreteTimeSignal.from_dense(0, np.random.rand(10)))
+
+    with pytest.raises(ValueError):
+        stream.process(DiscreteTimeSignal.from_dense(11, np.random.rand(10)))
+
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_StreamingFilter_sos(execution_id):
+    sos = np.random.rand(random.randint(1, 4), 6) - 0.5
+    sos[:, 3] = 1
+    x = np.random.rand(random.randint(10, 200)) - 0.5
+
+    H = DiscreteTimeSystem.from_sos(sos)
+    stream = H.stream()
+
+    y = np.concatenate([stream.process(chunk) for chunk in split_random(x)])
+    y_expected = H.filter(DiscreteTimeSignal.from_dense(0, x)).values()
+
+    assert np.shape(stream.zi) == (np.shape(sos)[0], 2)
+    npt.assert_allclose(y, y_expected)
\ No newline at end of file
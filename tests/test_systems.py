@@ -1,6 +1,9 @@
 import pytest
 import numpy as np
 import numpy.testing as npt
+import random
+import warnings
+from functools import reduce
 
 from DiscreteTimeLib import DiscreteTimeSystem
 from DiscreteTimeLib.signals import DiscreteTimeSignal
@@ -43,6 +46,27 @@ def test_DiscreteTimeSystem_eval(b, a, z, expected_val):
 
     npt.assert_allclose(computed_val, expected_val)
 
+def test_DiscreteTimeSystem_eval_array():
+    b, a = generate_random_system()
+    z = np.random.rand(20) + 1j * np.random.rand(20)
+
+    H = DiscreteTimeSystem(b, a)
+    computed_vals = H.eval(z)
+    computed_vals_double = H.eval(z, dtype=np.complex128)
+
+    assert np.shape(computed_vals) == (20,)
+    assert computed_vals_double.dtype == np.complex128
+    for i in range(20):
+        npt.assert_allclose(computed_vals[i], H.eval(z[i]))
+        npt.assert_allclose(computed_vals_double[i], H.eval(z[i]))
+
+def test_DiscreteTimeSystem_eval_error_dtype():
+    b, a = generate_random_system()
+
+    H = DiscreteTimeSystem(b, a)
+    with pytest.raises(ValueError):
+        H.eval(1j, dtype=np.float64)
+
 @pytest.mark.parametrize('execution_id', range(10))
 def test_DiscreteTimeSystem_filter(execution_id):
     b, a = generate_random_system()
@@ -63,6 +87,14 @@ def test_DiscreteTimeSystem_filter(execution_id):
 
         npt.assert_allclose(y_n[n], y_expected)
 
+def test_DiscreteTimeSystem_filter_empty():
+    b, a = generate_random_system()
+
+    H = DiscreteTimeSystem(b, a)
+    y_n = H.filter(DiscreteTimeSignal())
+
+    assert len(y_n) == 0
+
 def test_DiscreteTimeSystem_impz_error():
     b, a = generate_random_system()
     n_range = (16,)
@@ -91,13 +123,112 @@ def test_DiscreteTimeSystem_impz(b, a, h, n_range):
 
     assert h_n_computed == h_expected
 
+def test_DiscreteTimeSystem_impz_error_method():
+    b, a = generate_random_system()
+
+    H = DiscreteTimeSystem(b, a)
+    with pytest.raises(ValueError):
+        H.impz(n_range=(0, 10), method='table')
+
+@pytest.mark.parametrize('method', ['filter', 'residue', 'symbolic'])
+@pytest.mark.parametrize(
+    'b, a, h, n_range',
+    [
+        [(1,), (1,), (0, 0, 1, 0, 0, 0), (-2, 4)],
+        [(0, 1), (1, -2), (0, 0, 0, 0, 1, 2), (-3, 3)],
+        [(1,), (1, -2, 10), (-6, -32), (2, 4)],
+        [(1,), (1, -2, 10), (), (4, 2)],
+        [(1,), (1, -2, 10), (0, 0), (-4, -2)],
+        [(1,), (1, -2, 1), (0, 1, 2, 3, 4), (-1, 4)],
+        [(1, 1), (1, -3, 3, -1), (1, 4, 9, 16), (0, 4)],
+        [(1, 2, 3), (1,), (0, 1, 2, 3, 0), (-1, 4)],
+    ],
+)
+def test_DiscreteTimeSystem_impz_range(method, b, a, h, n_range):
+    H = DiscreteTimeSystem(b, a)
+    h_n_computed = H.impz(n_range=n_range, method=method)
+
+    data = tuple(zip(range(*n_range), h))
+    h_expected = DiscreteTimeSignal(data)
+
+    assert len(h_n_computed) == len(h)
+    assert h_n_computed == h_expected
+
+@pytest.mark.parametrize(
+    'b, a',
+    [
+        [(1, 0.5), (1, -0.9)],
+        [(2, -1, 0.5), (1, 0.2, 0.5)],
+        [(1, 2, 3, 4), (4, -1, 0.3)],
+        [(1,), (1, -1.2, 0.8, -0.2)],
+    ],
+)
+def test_DiscreteTimeSystem_impz_filter_symbolic(b, a):
+    n_range = (-5, 20)
+
+    H = DiscreteTimeSystem(b, a)
+    h_n_filter = H.impz(n_range=n_range)
+    h_n_symbolic = H.impz(n_range=n_range, method='symbolic')
+
+    npt.assert_allclose(
+        h_n_filter.values(),
+        h_n_symbolic.values().astype(np.complex128),
+        atol=1e-10,
+    )
+
+@pytest.mark.parametrize(
+    'b, a',
+    [
+        [(1, 0.5), (1, -0.9)],
+        [(1, 2, 3, 4, 5), (1, 0.2, 0.5)],
+        [(1,), (1, -1, 0.25)],
+        [(2, 1), (1, -1.5, 0.75, -0.125)],
+        [(1, 1j), (1, -0.5j)],
+    ],
+)
+def test_DiscreteTimeSystem_iztrans_func(b, a):
+    n_range = (-5, 30)
+
+    H = DiscreteTimeSystem(b, a)
+    h = H.iztrans_func()
+    h_values = h(np.arange(*n_range))
+    h_n_filter = H.impz(n_range=n_range)
+
+    assert np.iscomplexobj(h_values) == np.iscomplexobj(b + a)
+    npt.assert_allclose(h_values, h_n_filter.values(), atol=1e-10)
+    npt.assert_allclose(h(3), h_n_filter[3], atol=1e-10)
+
+def test_DiscreteTimeSystem_iztrans_cache():
+    H = DiscreteTimeSystem((1,), (1, -0.5))
+
+    assert H.iztrans_func() is H.iztrans_func()
+    assert H.partial_fractions() is H.partial_fractions()
+    exp, n = H.iztrans()
+    assert H.iztrans()[0] is exp
+
+    h = H.iztrans_func()
+    H.a = np.array((1, -0.25))
+
+    assert H.iztrans_func() is not h
+    npt.assert_allclose(H.iztrans_func()(2), 0.0625)
+    npt.assert_allclose(np.float64(H.iztrans()[0].subs(n, 2)), 0.0625)
+
+def test_DiscreteTimeSystem_partial_fractions():
+    H = DiscreteTimeSystem((1,), np.convolve((1, -0.5), (1, -0.5)))
+    r, p, m, k = H.partial_fractions()
+
+    npt.assert_allclose(p, (0.5, 0.5))
+    npt.assert_array_equal(m, (1, 2))
+    npt.assert_allclose(r, (0, 1), atol=1e-7)
+    assert np.shape(k) == (0,)
+
 def test_DiscreteTimeSystem_iztrans_impz():
     b, a = generate_random_system()
     n_range=(0, 10)
 
     H = DiscreteTimeSystem(b, a)
     h_exp, n = H.iztrans()
-    h_n = H.impz(n_range=n_range)
+    h_n = H.impz(n_range=n_range, method='symbolic')
 
     for i in range(*n_range):
         npt.assert_almost_equal(
@@ -112,4 +243,367 @@ def test_DiscreteTimeSystem_freqz():
     w_expected = np.linspace(-np.pi, np.pi, num=20)
     fr, w_samples = H.freqz((-np.pi, np.pi), num=20)
 
-    npt.assert_allclose(w_samples, w_expected)
\ No newline at end of file
+    npt.assert_allclose(w_samples, w_expected)
+
+@pytest.mark.parametrize('method', ['auto', 'horner', 'fft'])
+@pytest.mark.parametrize(
+    'w_range, num',
+    [
+        [(-np.pi, np.pi), 20],
+        [(0, 2 * np.pi), 64],
+        [(np.pi, -np.pi), 33],
+        [(0, 1.5 * np.pi), 4],
+        [(-np.pi / 2, np.pi / 2), 65],
+    ],
+)
+def test_DiscreteTimeSystem_freqz_method(method, w_range, num):
+    b, a = generate_random_system(b_len_range=(2, 10), a_len_range=(2, 10))
+    H = DiscreteTimeSystem(b, a)
+
+    fr, w_samples = H.freqz(w_range, num=num, method=method)
+    fr_expected = np.array([H.eval(np.exp(1j * w)) for w in w_samples])
+
+    assert fr.dtype == np.clongdouble
+    npt.assert_allclose(w_samples, np.linspace(*w_range, num=num))
+    npt.assert_allclose(
+        fr.astype(np.complex128),
+        fr_expected.astype(np.complex128),
+        rtol=1e-7,
+    )
+
+def test_DiscreteTimeSystem_freqz_dtype():
+    b, a = generate_random_system()
+    H = DiscreteTimeSystem(b, a)
+
+    fr, w_samples = H.freqz((-np.pi, np.pi), num=20, dtype=np.complex128)
+    fr_expected, _ = H.freqz((-np.pi, np.pi), num=20, method='horner')
+
+    assert fr.dtype == np.complex128
+    npt.assert_allclose(fr, fr_expected.astype(np.complex128), rtol=1e-7)
+
+    with pytest.raises(ValueError):
+        H.freqz((-np.pi, np.pi), num=20, dtype=np.float64)
+
+@pytest.mark.parametrize(
+    'w_range, num',
+    [
+        [(0, 1), 10],
+        [(0, 0), 10],
+        [(-np.pi, np.pi), 1],
+    ],
+)
+def test_DiscreteTimeSystem_freqz_error_fft(w_range, num):
+    b, a = generate_random_system()
+    H = DiscreteTimeSystem(b, a)
+
+    fr, _ = H.freqz(w_range, num=num)
+    assert np.shape(fr) == (num,)
+
+    with pytest.raises(ValueError):
+        H.freqz(w_range, num=num, method='fft')
+
+def test_DiscreteTimeSystem_freqz_error_method():
+    b, a = generate_random_system()
+    H = DiscreteTimeSystem(b, a)
+
+    with pytest.raises(ValueError):
+        H.freqz((-np.pi, np.pi), method='chirp-z')
+
+
+def cascade_sections(sos, values):
+    y = np.asarray(values, dtype=np.float64)
+    for section in sos:
+        y_section = np.zeros_like(y)
+        for n in range(np.shape(y)[0]):
+            y_section[n] = sum(
+                section[i] * y[n - i] for i in range(3) if n - i >= 0
+            )
+            y_section[n] -= sum(
+                section[3 + i] * y_section[n - i]
+                for i in range(1, 3)
+                if n - i >= 0
+            )
+            y_section[n] /= section[3]
+
+        y = y_section
+
+    return y
+
+def test_DiscreteTimeSystem_from_sos():
+    sos = [[2, 2, 0, 2, -1, 0], [1, 0, -1, 1, 0, 0.25]]
+    H = DiscreteTimeSystem.from_sos(sos)
+
+    npt.assert_allclose(H.sos[:, 3], 1)
+    npt.assert_allclose(H.b, np.convolve((1, 1, 0), (1, 0, -1)))
+    npt.assert_allclose(H.a, np.convolve((1, -0.5, 0), (1, 0, 0.25)))
+    assert H.to_sos() is H.sos
+
+@pytest.mark.parametrize(
+    'sos',
+    [
+        [1, 0, 0, 1, 0, 0],
+        np.zeros((0, 6)),
+        [[1, 0, 0, 1, 0]],
+        [[1, 0, 0, 0, 1, 0]],
+    ],
+)
+def test_DiscreteTimeSystem_from_sos_error(sos):
+    with pytest.raises(ValueError):
+        DiscreteTimeSystem.from_sos(sos)
+
+def test_DiscreteTimeSystem_to_sos():
+    b, a = generate_random_system(b_len_range=(2, 8), a_len_range=(2, 8))
+    H = DiscreteTimeSystem(b, a)
+
+    sos = H.to_sos()
+    H_sos = DiscreteTimeSystem.from_sos(sos)
+    z = np.exp(1j * np.linspace(-np.pi, np.pi, 20))
+
+    assert np.shape(sos)[1] == 6
+    assert H.to_sos() is sos
+    npt.assert_allclose(
+        H_sos.eval(z, dtype=np.complex128),
+        H.eval(z, dtype=np.complex128),
+        rtol=1e-6,
+    )
+
+@pytest.mark.parametrize(
+    'b, a',
+    [((0, 1, 0.5), (1, -0.5)), ((0, 0, 0, 2), (1,)), ((0,), (1, 0.2))],
+)
+def test_DiscreteTimeSystem_to_sos_delay(b, a):
+    H = DiscreteTimeSystem(b, a)
+    H_sos = DiscreteTimeSystem.from_sos(H.to_sos())
+    x_n, _ = generate_random_dts()
+
+    npt.assert_allclose(
+        H_sos.filter(x_n).values(),
+        H.filter(x_n).values(),
+        atol=1e-10,
+    )
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSystem_filter_sos(execution_id):
+    sos = np.random.rand(random.randint(1, 4), 6) - 0.5
+    sos[:, 3] = 1
+    x_n, _ = generate_random_dts()
+
+    H = DiscreteTimeSystem.from_sos(sos)
+    y_n = H.filter(x_n)
+
+    npt.assert_array_equal(y_n.keys(), x_n.keys())
+    npt.assert_allclose(y_n.values(), cascade_sections(sos, x_n.values()))
+
+def test_DiscreteTimeSystem_filter_sos_high_order():
+    # 16th order low-pass Butterworth filter, with coefficients from
+    # scipy.signal.butter(16, 0.02, output='sos')
+    from scipy.signal import butter
+
+    sos = butter(16, 0.02, output='sos')
+    x = np.random.rand(500)
+
+    H = DiscreteTimeSystem.from_sos(sos)
+    y = H.filter(DiscreteTimeSignal.from_dense(0, x)).values()
+    y_single = H.filter(
+        DiscreteTimeSignal.from_dense(0, x.astype(np.float32))
+    ).values()
+    h_n = H.impz((0, 500))
+
+    npt.assert_allclose(y, cascade_sections(sos, x), atol=1e-10)
+    npt.assert_allclose(y_single, y, atol=1e-3)
+    assert np.all(np.isfinite(h_n.values()))
+    npt.assert_allclose(h_n.values(), cascade_sections(sos, np.eye(500)[0]))
+
+@pytest.mark.parametrize('method', ['horner', 'fft'])
+def test_DiscreteTimeSystem_freqz_sos(method):
+    sos = np.random.rand(random.randint(1, 4), 6) - 0.5
+    sos[:, 3] = 1
+
+    H = DiscreteTimeSystem.from_sos(sos)
+    H_tf = DiscreteTimeSystem(H.b, H.a)
+
+    fr, _ = H.freqz((-np.pi, np.pi), num=33, method=method)
+    fr_expected, _ = H_tf.freqz((-np.pi, np.pi), num=33, method='horner')
+
+    assert fr.dtype == np.clongdouble
+    npt.assert_allclose(
+        fr.astype(np.complex128),
+        fr_expected.astype(np.complex128),
+        rtol=1e-7,
+    )
+    npt.assert_allclose(H.eval(1 + 1j), H_tf.eval(1 + 1j), rtol=1e-10)
+
+@pytest.mark.parametrize('execution_id', range(10))
+def test_DiscreteTimeSystem_cascade(execution_id):
+    systems = [
+        DiscreteTimeSystem(*generate_random_system())
+        for _ in range(random.randint(2, 10))
+    ]
+    x_n, _ = generate_random_dts()
+
+    H = reduce(lambda H1, H2: H1 * H2, systems)
+    y_n = H.filter(x_n)
+
+    y_n_expected = x_n
+    for system in systems:
+        y_n_expected = system.filter(y_n_expected)
+
+    npt.assert_array_equal(y_n.keys(), y_n_expected.keys())
+    npt.assert_allclose(y_n.values(), y_n_expected.values(), atol=1e-8)
+
+def test_DiscreteTimeSystem_cascade_sos():
+    sos1 = np.random.rand(2, 6) - 0.5
+    sos2 = np.random.rand(3, 6) - 0.5
+    sos1[:, 3] = 1
+    sos2[:, 3] = 1
+
+    H = DiscreteTimeSystem.from_sos(sos1) * DiscreteTimeSystem.from_sos(sos2)
+
+    npt.assert_allclose(H.sos, np.concatenate((sos1, sos2)))
+
+    H2 = DiscreteTimeSystem((0, 1, 0.5), (1, -0.5))
+    x_n, _ = generate_random_dts()
+
+    for H, sos in (
+        (DiscreteTimeSystem.from_sos(sos1) * H2, (sos1, H2.to_sos())),
+        (H2 * DiscreteTimeSystem.from_sos(sos1), (H2.to_sos(), sos1)),
+    ):
+        npt.assert_allclose(H.sos, np.concatenate(sos))
+        npt.assert_allclose(
+            H.filter(x_n).values(),
+            cascade_sections(np.concatenate(sos), x_n.values()),
+        )
+
+def test_DiscreteTimeSystem_compose_sos_high_order():
+    from scipy.signal import butter
+
+    sos = butter(16, 0.02, output='sos')
+    x = np.random.rand(500)
+    x_n = DiscreteTimeSignal.from_dense(0, x)
+
+    Hs = DiscreteTimeSystem.from_sos(sos)
+    unity = DiscreteTimeSystem((1,), (1,))
+    y = cascade_sections(sos, x)
+
+    for H, y_expected in (
+        (Hs * unity, y),
+        (unity * Hs, y),
+        (Hs + Hs, 2 * y),
+    ):
+        assert H.sos is not None
+        y_n = H.filter(x_n)
+        npt.assert_allclose(y_n.values()[:500], y_expected, atol=1e-10)
+
+    # closed-loop poles of high-order loops cannot be computed accurately
+    with pytest.warns(RuntimeWarning):
+        Hs.feedback()
+
+    with pytest.warns(RuntimeWarning):
+        Hs + unity
+
+@pytest.mark.parametrize('sign', [-1, 1])
+def test_DiscreteTimeSystem_compose_sos(sign):
+    from scipy.signal import butter
+
+    Hs = DiscreteTimeSystem.from_sos(butter(4, 0.2, output='sos'))
+    G = DiscreteTimeSystem((0, 0.5), (1, -0.2))
+    z = np.exp(1j * np.random.rand(20) * np.pi)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        H_parallel = Hs + sign * G
+        T = Hs.feedback(G, sign=sign)
+
+    Hs_z = Hs.eval(z, dtype=np.complex128)
+    G_z = G.eval(z, dtype=np.complex128)
+
+    assert H_parallel.sos is not None
+    assert T.sos is not None
+    npt.assert_allclose(
+        H_parallel.eval(z, dtype=np.complex128),
+        Hs_z + sign * G_z,
+        rtol=1e-8,
+    )
+    npt.assert_allclose(
+        T.eval(z, dtype=np.complex128),
+        Hs_z / (1 - sign * Hs_z * G_z),
+        rtol=1e-8,
+    )
+
+@pytest.mark.parametrize('from_sos', [False, True])
+def test_DiscreteTimeSystem_gain(from_sos):
+    sos = np.random.rand(2, 6) - 0.5
+    sos[:, 3] = 1
+    H = DiscreteTimeSystem.from_sos(sos)
+    if not from_sos:
+        H = DiscreteTimeSystem(H.b, H.a)
+
+    x_n, _ = generate_random_dts()
+    y_n = H.filter(x_n)
+
+    for H_scaled in (H * 3, 3 * H):
+        assert (H_scaled.sos is not None) == from_sos
+        npt.assert_allclose(
+            H_scaled.filter(x_n).values(),
+            3 * y_n.values(),
+            atol=1e-10,
+        )
+
+@pytest.mark.parametrize('same_a', [False, True])
+def test_DiscreteTimeSystem_parallel(same_a):
+    b1, a1 = generate_random_system()
+    b2, a2 = generate_random_system()
+    if same_a:
+        a2 = a1
+
+    H1 = DiscreteTimeSystem(b1, a1)
+    H2 = DiscreteTimeSystem(b2, a2)
+    H = H1 + H2
+    x_n, _ = generate_random_dts()
+
+    if same_a:
+        npt.assert_array_equal(H.a, a1)
+
+    npt.assert_allclose(
+        H.filter(x_n).values(),
+        (H1.filter(x_n) + H2.filter(x_n)).values(),
+        atol=1e-8,
+    )
+
+@pytest.mark.parametrize('sign', [-1, 1])
+@pytest.mark.parametrize('unity', [False, True])
+def test_DiscreteTimeSystem_feedback(sign, unity):
+    H = DiscreteTimeSystem(*generate_random_system())
+    G = DiscreteTimeSystem((1,), (1,)) if unity else None
+    if not unity:
+        G = DiscreteTimeSystem(*generate_random_system())
+
+    T = H.feedback(None if unity else G, sign=sign)
+    z = np.random.rand(20) + 1j * np.random.rand(20)
+
+    H_z = H.eval(z)
+    T_expected = H_z / (1 - sign * H_z * G.eval(z))
+
+    npt.assert_allclose(
+        T.eval(z).astype(np.complex128),
+        T_expected.astype(np.complex128),
+        rtol=1e-8,
+    )
+
+def test_DiscreteTimeSystem_algebra_error():
+    H = DiscreteTimeSystem((1,), (1,))
+
+    with pytest.raises(ValueError):
+        H.feedback(sign=1)
+
+    with pytest.raises(ValueError):
+        H.feedback(sign=0)
+
+    with pytest.raises(ValueError):
+        DiscreteTimeSystem.from_sos([[1, 0, 0, 1, 0, 0]]).feedback(sign=1)
+
+    with pytest.raises(TypeError):
+        H * [1, 2]
+
+    with pytest.raises(TypeError):
+        H + 1
\ No newline at end of file
@@ -1,7 +1,7 @@
 import numpy as np
 import random
 
-from DiscreteTimeLib import DiscreteTimeSignal
+from DiscreteTimeLib import DiscreteTimeSignal, MultichannelDiscreteTimeSignal
 
 def generate_random_scalar(
     values_range=(-100, 100),
@@ -39,4 +39,15 @@ def generate_random_system(
     a = np.random.rand(a_len) * (values_range[1] - values_range[0])
     a += values_range[0]
 
-    return b, a
\ No newline at end of file
+    return b, a
+
+def generate_random_multichannel_dts(
+    num_channels_range=(1, 8),
+    **kwargs,
+):
+    num_channels = random.randint(*num_channels_range)
+    signals = [generate_random_dts(**kwargs)[0] for _ in range(num_channels)]
+
+    X = MultichannelDiscreteTimeSignal(signals)
+
+    return X, signals
\ No newline at end of file